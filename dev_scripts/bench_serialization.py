@@ -0,0 +1,120 @@
+"""
+This is a development script measuring the cost of serializing game listings.
+It compares the previous path, building a `GameSchema` per row and dumping the list
+through a pydantic `TypeAdapter`, with the direct row to JSON bytes path of
+`api.app.serialization`, and prints the time per item for several listing sizes.
+
+
+How it works:
+1. Builds in-memory listing rows shaped like the rows of `GameSource.select`.
+2. Serializes them with both paths, keeping the best of several rounds.
+3. Checks that both paths produce the same bytes.
+4. Prints the total time and the time per item of each path.
+
+Usage:
+- Install the API module and export its settings (`guestready__api__*`, `guestready__db__*`,
+  `guestready__logger__*`, as in the `[pytest]` section of `tox.ini`), no database is needed.
+- Run from the repository root: `python dev_scripts/bench_serialization.py`
+- Update the SIZES and ROUNDS variables as needed.
+"""
+
+import time
+from collections import namedtuple
+from datetime import date, timedelta
+from typing import Any, Callable
+
+from api.app.queries import GAME_FIELDS
+from api.app.schemas import GameSchema
+from api.app.serialization import encode_games
+from pydantic import TypeAdapter
+
+# Number of games per listing
+SIZES: tuple[int, ...] = (1_000, 10_000, 100_000)
+
+# Rounds per measure, the fastest one is kept
+ROUNDS: int = 5
+
+GameRow = namedtuple("GameRow", ("id", *GAME_FIELDS))  # type: ignore
+
+games_adapter: TypeAdapter[list[GameSchema]] = TypeAdapter(list[GameSchema])
+
+
+def make_rows(size: int) -> list[Any]:
+    """
+    Build listing rows with realistic field lengths.
+
+    Args:
+        size (int): The number of rows.
+
+    Returns:
+        list[Any]: The rows, with the game id and the `GameSchema` fields.
+    """
+    return [
+        GameRow(
+            id=i,
+            title=f"Catalog Game {i}",
+            genre="Action",
+            release_date=date(2000, 1, 1) + timedelta(days=i % 9000),
+            description="An action packed adventure through a sprawling open world. "
+            * 3,
+            platform=f"Platform {i % 10}",
+            publisher=f"Publisher {i % 50}",
+            developer=f"Developer {i % 200}",
+        )
+        for i in range(size)
+    ]
+
+
+def pydantic_path(rows: list[Any]) -> bytes:
+    """
+    Serialize the rows the way the routes used to: one `GameSchema` per row.
+
+    Args:
+        rows (list[Any]): The listing rows.
+
+    Returns:
+        bytes: The JSON array of the games.
+    """
+    return games_adapter.dump_json([GameSchema(**row._asdict()) for row in rows])
+
+
+def measure(serialize: Callable[[list[Any]], bytes], rows: list[Any]) -> float:
+    """
+    Measure the fastest serialization of the rows.
+
+    Args:
+        serialize (Callable[[list[Any]], bytes]): The serialization path.
+        rows (list[Any]): The listing rows.
+
+    Returns:
+        float: The best time over ROUNDS, in seconds.
+    """
+    best: float = float("inf")
+    for _ in range(ROUNDS):
+        start: float = time.perf_counter()
+        serialize(rows)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    """
+    Run the benchmark for every size and print the results.
+    """
+    print(
+        f"{'rows':>8} {'pydantic':>12} {'per item':>10} {'direct':>12} {'per item':>10} {'speedup':>8}"
+    )
+    for size in SIZES:
+        rows: list[Any] = make_rows(size)
+        assert pydantic_path(rows) == encode_games(rows)
+
+        before: float = measure(pydantic_path, rows)
+        after: float = measure(encode_games, rows)
+        print(
+            f"{size:>8} {before * 1e3:>10.1f}ms {before / size * 1e6:>8.2f}us"
+            f" {after * 1e3:>10.1f}ms {after / size * 1e6:>8.2f}us {before / after:>7.1f}x",
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,6 @@
 from unittest.mock import MagicMock, patch
 
+import requests
 from django.http import HttpResponse
 from django.test import Client, TestCase
 from django.urls import reverse
@@ -114,3 +115,31 @@ class GameViewsTest(TestCase):
         response: HttpResponse = self.client.post(reverse("post_games"))
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertTemplateUsed(response, "game/post.html")
+
+    @patch("time.sleep")
+    @patch("requests.post")
+    def test_post_games_retry(
+        self, mock_post: MagicMock, mock_sleep: MagicMock
+    ) -> None:
+        """
+        Test case for a game posted again after a timeout, while its first
+        attempt is still handled, then accepted.
+        """
+        in_progress: MagicMock = MagicMock()
+        in_progress.status_code = status.HTTP_409_CONFLICT
+        in_progress.headers = {"Retry-After": "1"}
+        accepted: MagicMock = MagicMock()
+        accepted.status_code = status.HTTP_202_ACCEPTED
+        accepted.headers = {}
+        mock_post.side_effect = [requests.Timeout(), in_progress, accepted]
+
+        response: HttpResponse = self.client.post(reverse("post_games"))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.context["success_count"], 1)
+        self.assertEqual(response.context["fail_count"], 0)
+        mock_sleep.assert_called_once_with(1.0)
+        keys = {
+            call.kwargs["headers"]["Idempotency-Key"]
+            for call in mock_post.call_args_list
+        }
+        self.assertEqual(len(keys), 1)
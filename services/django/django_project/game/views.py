@@ -1,4 +1,8 @@
+import hashlib
+import json
 import logging
+import time
+import uuid
 
 import requests
 from django.db import models
@@ -12,6 +16,14 @@ from .models import Developer, Game, Platform, Publisher
 
 logger: logging.Logger = logging.getLogger(__name__)
 
+# Seconds to wait for the FastAPI response of one game, and attempts per game.
+# Every attempt carries the same Idempotency-Key, so a retry never creates the
+# game twice and a retry of a handled request is answered without any query.
+# A retry reaching the API while the first attempt is still handled is answered
+# 409 with `Retry-After`, and is sent again after that delay.
+POST_GAME_TIMEOUT_SECONDS: float = 10.0
+POST_GAME_ATTEMPTS: int = 3
+
 
 # Create your views here.
 def front_page(request: HttpRequest) -> HttpResponse:
@@ -128,6 +140,10 @@ def post_games(request: HttpRequest) -> HttpResponse:
     success_count: int = 0
     fail_count: int = 0
 
+    # The keys are scoped to this run: its retries are answered from the stored
+    # response, while a later run sends the games again, e.g. after a deletion
+    run_id: str = uuid.uuid4().hex
+
     # Loop through each game and send its data to the FastAPI endpoint
     for game in games:
         post_data = {
@@ -140,16 +156,48 @@ def post_games(request: HttpRequest) -> HttpResponse:
             "developer": game.developer.name,
         }
 
-        response: requests.Response = requests.post(
-            url=f"{config.fastapi.url}/game",
-            json=post_data,
-            auth=HTTPBasicAuth(
-                config.fastapi.auth.user,
-                config.fastapi.auth.password,
-            ),
-        )
+        # The key is derived from the run and the content of the game
+        idempotency_key: str = hashlib.sha256(
+            f"{run_id}:{json.dumps(post_data, sort_keys=True)}".encode(),
+        ).hexdigest()
 
-        if response.status_code == status.HTTP_201_CREATED:
+        response: requests.Response | None = None
+        for attempt in range(1, POST_GAME_ATTEMPTS + 1):
+            try:
+                response = requests.post(
+                    url=f"{config.fastapi.url}/game",
+                    json=post_data,
+                    headers={"Idempotency-Key": idempotency_key},
+                    auth=HTTPBasicAuth(
+                        config.fastapi.auth.user,
+                        config.fastapi.auth.password,
+                    ),
+                    timeout=POST_GAME_TIMEOUT_SECONDS,
+                )
+            except (requests.Timeout, requests.ConnectionError) as e:
+                logger.warning(f"Attempt {attempt} to send {game.title} failed: {e}")
+                continue
+
+            # The first attempt is still being handled, its response is
+            # replayed once it is stored
+            retry_after: str | None = response.headers.get("Retry-After")
+            if (
+                response.status_code == status.HTTP_409_CONFLICT
+                and retry_after is not None
+                and attempt < POST_GAME_ATTEMPTS
+            ):
+                logger.warning(f"Attempt {attempt} to send {game.title} is in progress")
+                time.sleep(float(retry_after))
+                continue
+            break
+
+        # Accepted games are written behind by the API
+        if response is None:
+            fail_count += 1
+        elif response.status_code in (
+            status.HTTP_201_CREATED,
+            status.HTTP_202_ACCEPTED,
+        ):
             success_count += 1
             logger.debug(response.text)
         else:
@@ -1,53 +1,113 @@
 import asyncio
+import importlib
+import importlib.util
 import logging
+from typing import Callable, Optional
 
 from api.app.app import app
+from api.app.config import EventLoop, ServerConfig
 from api.settings import config
 from hypercorn.asyncio import serve
 from hypercorn.config import Config
+from hypercorn.run import run as run_workers
 
 # Configure logging
 config.logger.configure_logger()
 logger = logging.getLogger(__name__)
 
+# Workers are spawned processes importing this module (not running it), so they
+# configure their logging as above before serving the app. Each worker imports
+# the app on its own: the import in the parent only validates the configuration,
+# nothing is shared with the workers.
+APPLICATION_PATH: str = "api.__main__:app"
 
-# Configure Hypercorn server settings
-hypercorn_cfg: Config = Config()
-hypercorn_cfg.bind = [f"0.0.0.0:{config.api.port}"]
-hypercorn_cfg.loglevel = str(logging.getLevelName(logger.getEffectiveLevel()))
-hypercorn_cfg.accesslog = logger
 
+async def _launch_api(hypercorn_cfg: Config) -> None:
+    """
+    Serve the API in this process.
 
-async def _launch_api():
+    Args:
+        hypercorn_cfg (Config): The Hypercorn configuration.
     """
-    Launches the Hypercorn server to serve the API.
+    await serve(app, hypercorn_cfg)  # type:ignore
+
 
-    Raises:
-        Exception: If any error occurs while running the server.
+def _worker_class(event_loop: EventLoop) -> str:
     """
-    logger.info("Starting API server...")
-    try:
-        await serve(app, hypercorn_cfg)  # type:ignore
-    except Exception as e:
-        logger.error(f"Error while running the server: {e}")
-    finally:
-        logger.info("Server shutdown complete.")
+    Get the Hypercorn worker class of an event loop implementation.
+
+    Args:
+        event_loop (EventLoop): The configured event loop.
+
+    Returns:
+        str: The worker class, asyncio when uvloop is requested but not installed.
+    """
+    if event_loop == EventLoop.UVLOOP and importlib.util.find_spec("uvloop") is None:
+        logger.warning(
+            "uvloop is not installed, falling back to the asyncio event loop"
+        )
+        return EventLoop.ASYNCIO.value
+    return event_loop.value
+
+
+def build_hypercorn_config(server: ServerConfig, port: int) -> Config:
+    """
+    Build the Hypercorn settings of the API server.
+
+    With several workers, the listening socket is created once and shared by
+    the worker processes, with SO_REUSEPORT set by Hypercorn.
+
+    Args:
+        server (ServerConfig): The workers and connection settings.
+        port (int): The port to listen on.
+
+    Returns:
+        Config: The Hypercorn configuration.
+    """
+    workers: int = server.worker_count()
+
+    hypercorn_cfg: Config = Config()
+    hypercorn_cfg.application_path = APPLICATION_PATH
+    hypercorn_cfg.bind = [f"0.0.0.0:{port}"]
+    hypercorn_cfg.loglevel = str(logging.getLevelName(logger.getEffectiveLevel()))
+    hypercorn_cfg.accesslog = logger
+    hypercorn_cfg.workers = workers if workers > 1 else 0
+    hypercorn_cfg.worker_class = _worker_class(server.event_loop)
+    hypercorn_cfg.backlog = server.backlog
+    hypercorn_cfg.keep_alive_timeout = server.keep_alive_timeout
+    hypercorn_cfg.keep_alive_max_requests = server.keep_alive_max_requests
+    hypercorn_cfg.h2_max_concurrent_streams = server.h2_max_concurrent_streams
+    hypercorn_cfg.h2_max_inbound_frame_size = server.h2_max_inbound_frame_size
+    return hypercorn_cfg
 
 
 def run():
     """
-    Runs the asyncio event loop to start the API server.
+    Runs the Hypercorn server to serve the API, with the configured number of workers.
 
     Handles KeyboardInterrupt to gracefully shutdown the server.
     """
+    hypercorn_cfg: Config = build_hypercorn_config(config.api.server, config.api.port)
+    logger.info(
+        f"Starting API server with {config.api.server.worker_count()} worker(s) "
+        f"on the {hypercorn_cfg.worker_class} event loop...",
+    )
     try:
-        asyncio.run(_launch_api())
+        if hypercorn_cfg.workers:
+            run_workers(hypercorn_cfg)
+        else:
+            # A single worker serves in this process, the app being already loaded
+            loop_factory: Optional[Callable[[], asyncio.AbstractEventLoop]] = None
+            if hypercorn_cfg.worker_class == EventLoop.UVLOOP.value:
+                loop_factory = importlib.import_module("uvloop").new_event_loop
+            with asyncio.Runner(loop_factory=loop_factory) as runner:
+                runner.run(_launch_api(hypercorn_cfg))
     except KeyboardInterrupt:
         logger.info("Received exit signal. Shutting down gracefully.")
     except Exception as e:
-        logger.error(f"Unexpected error: {e}")
+        logger.error(f"Error while running the server: {e}")
     finally:
-        logger.info("Application stopped.")
+        logger.info("Server shutdown complete.")
 
 
 if __name__ == "__main__":
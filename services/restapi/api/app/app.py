@@ -1,17 +1,81 @@
+import asyncio
+from contextlib import asynccontextmanager, suppress
+from typing import AsyncIterator, Mapping
+
 from fastapi import Depends, FastAPI, status
 
+from api.app.cache import response_cache
+from api.app.catalog_index import catalog_index
+from api.app.compression import CompressionMiddleware
+from api.app.dimensions import dimension_ids
+from api.app.idempotency import idempotency_store
+from api.app.routers.developer import router as developer_router
 from api.app.routers.game import router as game_router
+from api.app.statements import compiled_cache_stats, statement_stats
 from api.app.verification import security
+from api.app.write_behind import write_behind
+from api.database.db import AsyncSessionLocal, async_engine
+from api.settings import config
+
+# The statements of the route handlers are counted on `/metrics`
+compiled_cache_stats.watch(async_engine.sync_engine)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """
+    Start and stop the background components of the API.
+
+    When enabled, the in-memory catalog index is built before serving the
+    first request and kept in sync with the catalog version afterwards, and
+    the ids of the platforms, publishers and developers are cached. In
+    write-behind mode, the queued games are written before shutting down.
+    """
+    tasks: list[asyncio.Task] = []
+    if config.api.dimension_cache.enabled:
+        async with AsyncSessionLocal() as db:
+            await dimension_ids.load(db)
+    if config.api.catalog_index.enabled:
+        async with AsyncSessionLocal() as db:
+            await catalog_index.load(db)
+        tasks.append(
+            asyncio.create_task(
+                catalog_index.refresh_forever(
+                    AsyncSessionLocal,
+                    config.api.catalog_index.refresh_interval_seconds,
+                ),
+            ),
+        )
+
+    writer: asyncio.Task | None = None
+    if config.api.write_behind.enabled:
+        writer = asyncio.create_task(write_behind.run_forever(AsyncSessionLocal))
+
+    yield
+
+    if writer is not None:
+        await write_behind.stop(writer)
+        tasks.append(writer)
+    for task in tasks:
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
+
 
 app: FastAPI = FastAPI(
     title="GuestReady Challenge REST API",
     docs_url="/",
     openapi_url="/openapi_url.json",
     dependencies=[Depends(security)],
+    lifespan=lifespan,
 )
 
+# Compress the responses the client accepts compressed (gzip, and br/zstd if installed)
+app.add_middleware(CompressionMiddleware, compression_config=config.api.compression)
+
 # add the router with the guestready challenge endpoints
 app.include_router(game_router)
+app.include_router(developer_router)
 
 
 @app.get("/version", tags=["Info"])
@@ -25,6 +89,26 @@ async def version() -> dict[str, str]:
     return {"version": "1.0.0"}
 
 
+@app.get("/metrics", tags=["Info"])
+async def metrics() -> dict[str, Mapping[str, int | float | bool]]:
+    """
+    Endpoint to get the runtime counters of the API.
+
+    Returns:
+        dict: A dictionary with the counters of each component (response cache,
+        catalog index, statement caches, dimension ids, idempotency keys,
+        write-behind queue).
+    """
+    return {
+        "cache": response_cache.stats(),
+        "catalog_index": catalog_index.stats(),
+        "statements": statement_stats(),
+        "dimensions": dimension_ids.stats(),
+        "idempotency": idempotency_store.stats(),
+        "write_behind": write_behind.stats(),
+    }
+
+
 # NOTE:  This is definitelty not the way to go, however I simply want an endpoint that where I can check if the API is up
 @app.get("/health", tags=["HealthCheck"], status_code=status.HTTP_200_OK)
 async def health() -> str:
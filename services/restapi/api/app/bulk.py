@@ -0,0 +1,111 @@
+from typing import Optional, Sequence
+
+from api.app.catalog import CatalogState, bump_catalog_version
+from api.app.dimensions import dialect_insert, resolve_dimension
+from api.app.models import Developer, Game, Platform, Publisher
+from api.app.schemas import GameSchema
+from pydantic import ValidationError
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# Maximum number of games in one bulk request
+MAX_BULK_GAMES: int = 1000
+
+
+def validation_detail(error: ValidationError) -> str:
+    """
+    Summarize why a game is invalid, as reported per game by the bulk endpoints.
+
+    Args:
+        error (ValidationError): The validation error of the game.
+
+    Returns:
+        str: One `location: message` per error, separated by semicolons.
+    """
+    return "; ".join(
+        f"{'.'.join(map(str, item['loc']))}: {item['msg']}" for item in error.errors()
+    )
+
+
+async def insert_games(
+    db: AsyncSession,
+    games: Sequence[GameSchema],
+) -> tuple[list[Optional[int]], CatalogState]:
+    """
+    Insert a batch of games in the current transaction, without committing it.
+
+    A game whose title already exists, in the catalog or earlier in the batch,
+    is skipped. The names of the platforms, publishers and developers are
+    resolved once per batch, then the games are written with multi-row inserts,
+    so the number of round trips does not grow with the size of the batch.
+    The catalog watermark is bumped once the names are resolved, right before
+    the games are written, like `insert_game` does: every writer locks the
+    names before the watermark row, so two writers cannot deadlock on them.
+
+    Args:
+        db (AsyncSession): The session of the write transaction.
+        games (Sequence[GameSchema]): The validated games.
+
+    Returns:
+        tuple[list[Optional[int]], CatalogState]: The id of each created game,
+        None for a title conflict, and the catalog version set by the write
+        (left unbumped when every title conflicts).
+    """
+    titles: set[str] = {game.title for game in games}
+    taken: set[str] = (
+        set((await db.scalars(select(Game.title).where(Game.title.in_(titles)))).all())
+        if titles
+        else set()
+    )
+
+    new_games: list[tuple[int, GameSchema]] = []
+    for position, game in enumerate(games):
+        if game.title not in taken:
+            taken.add(game.title)
+            new_games.append((position, game))
+
+    ids: list[Optional[int]] = [None] * len(games)
+    if not new_games:
+        return ids, CatalogState()
+
+    platforms: dict[str, int] = await resolve_dimension(
+        db,
+        Platform,
+        (game.platform for _, game in new_games),
+    )
+    publishers: dict[str, int] = await resolve_dimension(
+        db,
+        Publisher,
+        (game.publisher for _, game in new_games),
+    )
+    developers: dict[str, int] = await resolve_dimension(
+        db,
+        Developer,
+        (game.developer for _, game in new_games),
+    )
+
+    catalog: CatalogState = await bump_catalog_version(db)
+    # The titles are unique within the batch, so the returned rows need no ordering.
+    # A title created concurrently since the lookup is skipped by the unique index.
+    created = await db.execute(
+        dialect_insert(Game, db.get_bind().dialect.name)
+        .on_conflict_do_nothing(index_elements=[Game.title])
+        .returning(Game.title, Game.id),
+        [
+            {
+                "title": game.title,
+                "genre": game.genre,
+                "description": game.description,
+                "release_date": game.release_date,
+                "platform_id": platforms[game.platform],
+                "publisher_id": publishers[game.publisher],
+                "developer_id": developers[game.developer],
+                "change_version": catalog.version,
+            }
+            for _, game in new_games
+        ],
+    )
+    id_of: dict[str, int] = {title: game_id for title, game_id in created.all()}
+    for position, game in new_games:
+        ids[position] = id_of.get(game.title)
+    return ids, catalog
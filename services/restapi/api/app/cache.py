@@ -0,0 +1,336 @@
+import asyncio
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Generic, Optional, TypeVar
+from urllib.parse import urlencode
+
+from api.app.config import CacheConfig
+from api.settings import config
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+@dataclass
+class CachedResponse:
+    """
+    A serialized response kept in the cache.
+
+    Attributes:
+        body (bytes): The encoded response body.
+        headers (dict[str, str]): Extra headers that belong to the body (e.g. `Link`).
+    """
+
+    body: bytes
+    headers: dict[str, str] = field(default_factory=dict)
+
+    def dump(self) -> bytes:
+        """Serialize the response as a JSON headers line followed by the body."""
+        return json.dumps(self.headers).encode("utf-8") + b"\n" + self.body
+
+    @classmethod
+    def load(cls, raw: bytes) -> "CachedResponse":
+        """Deserialize a response produced by `dump`."""
+        headers, body = raw.split(b"\n", 1)
+        return cls(body=body, headers=json.loads(headers))
+
+
+class TTLCache(Generic[T]):
+    """
+    A bounded in-process LRU cache whose entries expire after a fixed TTL.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self.max_entries: int = max_entries
+        self.ttl_seconds: float = ttl_seconds
+        self._entries: OrderedDict[str, tuple[float, T]] = OrderedDict()
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+
+    def get(self, key: str) -> Optional[T]:
+        """
+        Get a value and mark it as the most recently used one.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            Optional[T]: The cached value, or None if missing or expired.
+        """
+        entry: tuple[float, T] | None = self._entries.get(key)
+        if entry is None or entry[0] < time.monotonic():
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def set(self, key: str, value: T) -> None:
+        """
+        Store a value, evicting the least recently used entries above the size bound.
+
+        Args:
+            key (str): The cache key.
+            value (T): The value to store.
+        """
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def pop(self, key: str) -> Optional[T]:
+        """Remove a value from the cache and return it if it was still valid."""
+        entry: tuple[float, T] | None = self._entries.pop(key, None)
+        if entry is None or entry[0] < time.monotonic():
+            return None
+        return entry[1]
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SQLiteStore:
+    """
+    A key/value store with TTL backed by a local SQLite file.
+
+    Every worker process opens the same file, so values and the catalog
+    version written by one worker are visible to all of them.
+    """
+
+    def __init__(self, path: str, ttl_seconds: float):
+        self.ttl_seconds: float = ttl_seconds
+        self._lock: threading.Lock = threading.Lock()
+        self._conn: sqlite3.Connection = sqlite3.connect(
+            path,
+            timeout=5,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS kv (key TEXT PRIMARY KEY, value BLOB NOT NULL, expires_at REAL NOT NULL)",
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS counter (name TEXT PRIMARY KEY, value INTEGER NOT NULL)",
+        )
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Get a value that has not expired yet."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM kv WHERE key = ? AND expires_at >= ?",
+                (key, time.time()),
+            ).fetchone()
+        return row[0] if row else None
+
+    def set(self, key: str, value: bytes) -> None:
+        """Store a value and purge the expired ones."""
+        now: float = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO kv (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, value, now + self.ttl_seconds),
+            )
+            self._conn.execute("DELETE FROM kv WHERE expires_at < ?", (now,))
+
+    def claim(self, key: str, ttl_seconds: float) -> bool:
+        """
+        Atomically store an empty value for a key, unless it holds an unexpired one.
+
+        Args:
+            key (str): The key to claim.
+            ttl_seconds (float): How long the claim lasts if it is never deleted.
+
+        Returns:
+            bool: Whether the key was claimed by this call.
+        """
+        now: float = time.time()
+        with self._lock:
+            return (
+                self._conn.execute(
+                    "INSERT INTO kv (key, value, expires_at) VALUES (?, ?, ?) "
+                    "ON CONFLICT (key) DO UPDATE SET value = excluded.value, "
+                    "expires_at = excluded.expires_at WHERE kv.expires_at < ?",
+                    (key, b"", now + ttl_seconds, now),
+                ).rowcount
+                == 1
+            )
+
+    def delete(self, key: str) -> None:
+        """Remove a value."""
+        with self._lock:
+            self._conn.execute("DELETE FROM kv WHERE key = ?", (key,))
+
+    def counter(self, name: str) -> int:
+        """Read a named counter, 0 if it was never incremented."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM counter WHERE name = ?",
+                (name,),
+            ).fetchone()
+        return row[0] if row else 0
+
+    def increment(self, name: str) -> int:
+        """Atomically increment a named counter and return its new value."""
+        with self._lock:
+            return self._conn.execute(
+                "INSERT INTO counter (name, value) VALUES (?, 1) "
+                "ON CONFLICT (name) DO UPDATE SET value = value + 1 RETURNING value",
+                (name,),
+            ).fetchone()[0]
+
+
+class ResponseCache:
+    """
+    Two-tier cache of serialized catalog responses.
+
+    The first tier is an in-process LRU, the optional second tier is a
+    `SQLiteStore` shared by all workers. Keys are prefixed with the catalog
+    version, so bumping the version on a write invalidates every entry at once.
+    The shared tier is queried in a worker thread: a store locked by another
+    worker never blocks the event loop.
+    """
+
+    _VERSION_COUNTER: str = "catalog_version"
+
+    def __init__(self, cache_config: CacheConfig):
+        self.enabled: bool = cache_config.enabled
+        self.local: TTLCache[CachedResponse] = TTLCache(
+            max_entries=cache_config.max_entries,
+            ttl_seconds=cache_config.ttl_seconds,
+        )
+        self.shared: Optional[SQLiteStore] = (
+            SQLiteStore(cache_config.shared_path, cache_config.ttl_seconds)
+            if cache_config.enabled and cache_config.shared_path
+            else None
+        )
+        self._local_version: int = 0
+        self.shared_hits: int = 0
+        self.invalidations: int = 0
+
+    @staticmethod
+    def make_key(path: str, **params: Any) -> str:
+        """
+        Build a cache key from the request path and its normalized query parameters.
+
+        Args:
+            path (str): The endpoint path.
+            **params (Any): The query parameters, None values are ignored.
+
+        Returns:
+            str: The cache key.
+        """
+        normalized: list[tuple[str, str]] = sorted(
+            (name, str(value)) for name, value in params.items() if value is not None
+        )
+        return f"{path}?{urlencode(normalized)}"
+
+    @property
+    def version(self) -> int:
+        """The current catalog version."""
+        if self.shared is not None:
+            return self.shared.counter(self._VERSION_COUNTER)
+        return self._local_version
+
+    async def current_version(self) -> int:
+        """
+        Read the catalog version a request looks its response up with.
+
+        Read once per request and passed to both `get` and `set`.
+
+        Returns:
+            int: The current catalog version.
+        """
+        if self.shared is not None:
+            return await asyncio.to_thread(self.shared.counter, self._VERSION_COUNTER)
+        return self._local_version
+
+    async def get(self, key: str, version: int) -> Optional[CachedResponse]:
+        """
+        Look a response up in the local tier, then in the shared tier.
+
+        Args:
+            key (str): The key built with `make_key`.
+            version (int): The catalog version read by `current_version`.
+
+        Returns:
+            Optional[CachedResponse]: The cached response, or None on a miss.
+        """
+        if not self.enabled:
+            return None
+
+        versioned_key: str = f"{version}:{key}"
+        cached: CachedResponse | None = self.local.get(versioned_key)
+        if cached is None and self.shared is not None:
+            raw: bytes | None = await asyncio.to_thread(self.shared.get, versioned_key)
+            if raw is not None:
+                self.shared_hits += 1
+                cached = CachedResponse.load(raw)
+                self.local.set(versioned_key, cached)
+        return cached
+
+    async def set(self, key: str, version: int, response: CachedResponse) -> None:
+        """
+        Store a response in both tiers.
+
+        Args:
+            key (str): The key built with `make_key`.
+            version (int): The catalog version the response was looked up with.
+            response (CachedResponse): The serialized response.
+        """
+        if not self.enabled:
+            return
+
+        versioned_key: str = f"{version}:{key}"
+        self.local.set(versioned_key, response)
+        if self.shared is not None:
+            await asyncio.to_thread(self.shared.set, versioned_key, response.dump())
+
+    async def invalidate(self) -> None:
+        """Bump the catalog version, which invalidates every cached response."""
+        version: int = self._local_version + 1
+        if self.shared is not None:
+            version = await asyncio.to_thread(
+                self.shared.increment,
+                self._VERSION_COUNTER,
+            )
+        self._local_version += 1
+        self.local.clear()
+        self.invalidations += 1
+        logger.debug(f"Response cache invalidated, catalog version {version}")
+
+    def stats(self) -> dict[str, int | bool]:
+        """
+        Get the cache counters.
+
+        Returns:
+            dict[str, int | bool]: Hit, miss, eviction and invalidation counters.
+        """
+        return {
+            "enabled": self.enabled,
+            "entries": len(self.local),
+            "hits": self.local.hits + self.shared_hits,
+            "local_hits": self.local.hits,
+            "shared_hits": self.shared_hits,
+            "misses": self.local.misses - self.shared_hits,
+            "evictions": self.local.evictions,
+            "invalidations": self.invalidations,
+            "version": self.version,
+        }
+
+
+response_cache: ResponseCache = ResponseCache(config.api.cache)
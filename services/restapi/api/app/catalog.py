@@ -0,0 +1,152 @@
+import hashlib
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import format_datetime
+from typing import Optional
+
+from api.app.models import CatalogVersion
+from fastapi import Request, Response, status
+from sqlalchemy import Select, Update, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+# The catalog_version table holds a single row
+_CATALOG_VERSION_ID: int = 1
+
+# Read on every listing request, built once so its cache key is computed once
+_CATALOG_STATE_QUERY: Select = select(
+    CatalogVersion.version,
+    CatalogVersion.updated_at,
+).where(CatalogVersion.id == _CATALOG_VERSION_ID)
+
+
+@dataclass
+class CatalogState:
+    """
+    The watermark of the game catalog.
+
+    Attributes:
+        version (int): A counter incremented by every write to the catalog.
+        updated_at (Optional[datetime]): The time of the last write, None if never written.
+    """
+
+    version: int = 0
+    updated_at: Optional[datetime] = None
+
+    def etag(self, cache_key: str) -> str:
+        """
+        Compute the entity tag of a listing for this catalog version.
+
+        Args:
+            cache_key (str): The normalized key of the listing (path and filters).
+
+        Returns:
+            str: A quoted strong entity tag.
+        """
+        digest: str = hashlib.sha1(cache_key.encode("utf-8")).hexdigest()[:16]
+        return f'"{self.version}-{digest}"'
+
+    def headers(self, cache_key: str) -> dict[str, str]:
+        """
+        Build the validator headers of a listing.
+
+        Args:
+            cache_key (str): The normalized key of the listing (path and filters).
+
+        Returns:
+            dict[str, str]: The `ETag` and, when known, `Last-Modified` headers.
+        """
+        headers: dict[str, str] = {"ETag": self.etag(cache_key)}
+        if self.updated_at is not None:
+            headers["Last-Modified"] = format_datetime(self.updated_at, usegmt=True)
+        return headers
+
+
+async def get_catalog_state(db: AsyncSession) -> CatalogState:
+    """
+    Read the catalog watermark with a single primary key lookup.
+
+    Args:
+        db (AsyncSession): The database session.
+
+    Returns:
+        CatalogState: The current catalog version.
+    """
+    row = (await db.execute(_CATALOG_STATE_QUERY)).first()
+    if row is None:
+        return CatalogState()
+
+    updated_at: datetime = row.updated_at
+    if updated_at.tzinfo is None:
+        updated_at = updated_at.replace(tzinfo=timezone.utc)
+    return CatalogState(version=row.version, updated_at=updated_at)
+
+
+def catalog_bump_statement(now: datetime) -> Update:
+    """
+    Build the statement incrementing the catalog watermark.
+
+    Args:
+        now (datetime): The time of the write.
+
+    Returns:
+        Update: An update of the watermark row returning the new version.
+    """
+    return (
+        update(CatalogVersion)
+        .where(CatalogVersion.id == _CATALOG_VERSION_ID)
+        .values(version=CatalogVersion.version + 1, updated_at=now)
+        .returning(CatalogVersion.version)
+    )
+
+
+async def bump_catalog_version(db: AsyncSession) -> CatalogState:
+    """
+    Increment the catalog watermark inside the current write transaction.
+
+    Must be called before the commit of every write to the game catalog.
+
+    Args:
+        db (AsyncSession): The database session holding the write.
+
+    Returns:
+        CatalogState: The catalog version set by this write.
+    """
+    now: datetime = datetime.now(timezone.utc)
+    version: int | None = (
+        await db.execute(catalog_bump_statement(now))
+    ).scalar_one_or_none()
+    if version is None:
+        version = 1
+        db.add(CatalogVersion(id=_CATALOG_VERSION_ID, version=version, updated_at=now))
+        await db.flush()
+    return CatalogState(version=version, updated_at=now)
+
+
+def not_modified(request: Request, headers: dict[str, str]) -> Optional[Response]:
+    """
+    Evaluate the conditional request headers against the listing validators.
+
+    Only `If-None-Match` is evaluated: `Last-Modified` has a precision of one
+    second, so a write in the same second as the copy of the client would be
+    missed by `If-Modified-Since`, while the ETag changes with every write.
+
+    Args:
+        request (Request): The incoming request.
+        headers (dict[str, str]): The validators built with `CatalogState.headers`.
+
+    Returns:
+        Optional[Response]: A `304 Not Modified` response, or None if the client copy is stale.
+    """
+    if_none_match: str | None = request.headers.get("if-none-match")
+    if if_none_match is None:
+        return None
+    etags: list[str] = [
+        etag.strip().removeprefix("W/") for etag in if_none_match.split(",")
+    ]
+    if "*" not in etags and headers["ETag"] not in etags:
+        return None
+
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
@@ -0,0 +1,325 @@
+import asyncio
+import logging
+from array import array
+from bisect import bisect_left, bisect_right, insort
+from dataclasses import dataclass
+from datetime import date
+from heapq import merge
+from typing import Any, Optional, Sequence
+
+from api.app.catalog import CatalogState, get_catalog_state
+from api.app.models import Developer
+from api.app.pagination import decode_cursor
+from api.app.queries import NORMALIZED_SOURCE, GameFilters
+from api.app.schemas import GameSchema
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+# The fields with a posting list, as named by the listing filters
+INDEXED_FIELDS: tuple[str, ...] = (
+    "genre",
+    "platform",
+    "developer",
+    "publisher",
+    "release_date",
+)
+
+
+class GameRecord:
+    """
+    A compact, pre-serialized game of the in-memory catalog.
+
+    Attributes:
+        id (int): The id of the game.
+        release_date (date): The release date, part of the listing order.
+        genre (str): The genre of the game.
+        platform (str): The name of the platform.
+        developer (str): The name of the developer.
+        publisher (str): The name of the publisher.
+        payload (bytes): The game encoded as a `GameSchema` JSON object.
+    """
+
+    __slots__ = (
+        "id",
+        "release_date",
+        "genre",
+        "platform",
+        "developer",
+        "publisher",
+        "payload",
+    )
+
+    def __init__(self, game_id: int, game: GameSchema):
+        self.id: int = game_id
+        self.release_date: date = game.release_date
+        self.genre: str = game.genre
+        self.platform: str = game.platform
+        self.developer: str = game.developer
+        self.publisher: str = game.publisher
+        self.payload: bytes = game.model_dump_json().encode("utf-8")
+
+
+@dataclass
+class IndexListing:
+    """
+    A listing answered by the catalog index.
+
+    Attributes:
+        body (bytes): The JSON array of the games of the listing.
+        next_key (Optional[tuple[date, int]]): The keyset of the last game if a next page exists.
+    """
+
+    body: bytes
+    next_key: Optional[tuple[date, int]] = None
+
+
+class CatalogIndex:
+    """
+    An in-process index of the whole game catalog.
+
+    Records live in a list and every posting list is an `array` of record
+    positions kept sorted by the (release_date, id) listing order. A filtered
+    listing merges the posting lists of the values of each filter, intersects
+    the filters and slices the release date range with a bisect, so it is
+    answered without a database round trip nor any ORM or Pydantic object.
+
+    The index follows the catalog version: local writes are applied
+    incrementally, writes from other processes trigger a reload.
+    """
+
+    def __init__(self):
+        self.ready: bool = False
+        self.state: CatalogState = CatalogState(version=-1)
+        self.hits: int = 0
+        self.reloads: int = 0
+        self._records: list[GameRecord] = []
+        self._order: array = array("I")
+        self._postings: dict[str, dict[Any, array]] = {
+            field: {} for field in INDEXED_FIELDS
+        }
+        self._developers: set[str] = set()
+
+    @property
+    def version(self) -> int:
+        """The catalog version the index reflects."""
+        return self.state.version
+
+    def _key(self, position: int) -> tuple[int, int]:
+        record: GameRecord = self._records[position]
+        return (record.release_date.toordinal(), record.id)
+
+    def _insert(self, record: GameRecord) -> None:
+        position: int = len(self._records)
+        self._records.append(record)
+        insort(self._order, position, key=self._key)
+        for field in INDEXED_FIELDS:
+            postings: array = self._postings[field].setdefault(
+                getattr(record, field),
+                array("I"),
+            )
+            insort(postings, position, key=self._key)
+
+    def add(self, game_id: int, game: GameSchema, state: CatalogState) -> None:
+        """
+        Apply a committed game creation to the index.
+
+        Args:
+            game_id (int): The id of the created game.
+            game (GameSchema): The created game.
+            state (CatalogState): The catalog version set by the write.
+        """
+        self.add_all([(game_id, game)], state)
+
+    def add_all(
+        self,
+        games: Sequence[tuple[int, GameSchema]],
+        state: CatalogState,
+    ) -> None:
+        """
+        Apply the games created by one committed write to the index.
+
+        Args:
+            games (Sequence[tuple[int, GameSchema]]): The id and the content of each created game.
+            state (CatalogState): The catalog version set by the write.
+        """
+        if not self.ready:
+            return
+        if state.version != self.version + 1:
+            # Another process wrote in between, the next refresh reloads the index
+            logger.debug(f"Catalog index is behind version {state.version}")
+            return
+        for game_id, game in games:
+            self._insert(GameRecord(game_id, game))
+            self._developers.add(game.developer)
+        self.state = state
+
+    def _contains(self, postings: Sequence[int], position: int) -> bool:
+        i: int = bisect_left(postings, self._key(position), key=self._key)
+        return i < len(postings) and postings[i] == position
+
+    def _postings_of(self, field: str, values: tuple[Any, ...]) -> Sequence[int]:
+        postings: list[array] = [
+            self._postings[field][value]
+            for value in values
+            if value in self._postings[field]
+        ]
+        if len(postings) == 1:
+            return postings[0]
+        return list(merge(*postings, key=self._key))
+
+    def _select(self, filters: GameFilters) -> Sequence[int]:
+        postings: list[Sequence[int]] = [
+            self._postings_of(field, values)
+            for field, values in filters.values().items()
+        ]
+
+        positions: Sequence[int]
+        if not postings:
+            positions = self._order
+        else:
+            postings.sort(key=len)
+            smallest, others = postings[0], postings[1:]
+            positions = [
+                position
+                for position in smallest
+                if all(self._contains(other, position) for other in others)
+            ]
+
+        # Positions are in the listing order, so a release date range is a slice
+        start: int = 0
+        end: int = len(positions)
+        if filters.release_date_from is not None:
+            start = bisect_left(
+                positions,
+                (filters.release_date_from.toordinal(), 0),
+                key=self._key,
+            )
+        if filters.release_date_to is not None:
+            end = bisect_left(
+                positions,
+                (filters.release_date_to.toordinal() + 1, 0),
+                key=self._key,
+            )
+        return positions[start:end] if start or end < len(positions) else positions
+
+    def has_developer(self, developer: str) -> bool:
+        """Check whether a developer is known, even without any game."""
+        return developer in self._developers
+
+    def listing(
+        self,
+        filters: GameFilters,
+        limit: Optional[int] = None,
+        after: Optional[str] = None,
+    ) -> Optional[IndexListing]:
+        """
+        Answer a game listing from the index.
+
+        Args:
+            filters (GameFilters): The filters of the listing.
+            limit (Optional[int]): The page size, None to return every game.
+            after (Optional[str]): The pagination cursor of the previous page.
+
+        Returns:
+            Optional[IndexListing]: The listing, or None when the index is not
+            loaded and the caller must fall back to SQL.
+        """
+        if not self.ready:
+            return None
+
+        positions: Sequence[int] = self._select(filters)
+        start: int = 0
+        if after is not None:
+            after_date, after_id = decode_cursor(after)
+            start = bisect_right(
+                positions,
+                (after_date.toordinal(), after_id),
+                key=self._key,
+            )
+
+        end: int = (
+            len(positions) if limit is None else min(start + limit, len(positions))
+        )
+        page: list[GameRecord] = [
+            self._records[positions[i]] for i in range(start, end)
+        ]
+
+        next_key: Optional[tuple[date, int]] = None
+        if end < len(positions) and page:
+            next_key = (page[-1].release_date, page[-1].id)
+
+        self.hits += 1
+        return IndexListing(
+            body=b"[" + b",".join(record.payload for record in page) + b"]",
+            next_key=next_key,
+        )
+
+    async def load(self, db: AsyncSession) -> None:
+        """
+        Rebuild the index from the database.
+
+        Args:
+            db (AsyncSession): The database session to read the catalog with.
+        """
+        state: CatalogState = await get_catalog_state(db)
+        rows = (await db.execute(NORMALIZED_SOURCE.select())).all()
+        developers = (await db.execute(select(Developer.name))).scalars().all()
+
+        # Build the new structures aside and swap them without yielding to the loop
+        fresh: CatalogIndex = CatalogIndex()
+        for row in rows:
+            fresh._insert(GameRecord(row.id, GameSchema(**row._mapping)))
+
+        self._records = fresh._records
+        self._order = fresh._order
+        self._postings = fresh._postings
+        self._developers = set(developers)
+        self.state = state
+        self.ready = True
+        self.reloads += 1
+        logger.info(
+            f"Catalog index loaded {len(rows)} games at version {state.version}"
+        )
+
+    async def refresh_forever(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        interval_seconds: float,
+    ) -> None:
+        """
+        Reload the index whenever the catalog version moved, e.g. after a write
+        handled by another worker.
+
+        Args:
+            session_factory (async_sessionmaker[AsyncSession]): Factory of the refresh sessions.
+            interval_seconds (float): Delay between two version checks.
+        """
+        while True:
+            await asyncio.sleep(interval_seconds)
+            try:
+                async with session_factory() as db:
+                    state: CatalogState = await get_catalog_state(db)
+                    if state.version != self.version:
+                        await self.load(db)
+            except Exception as e:
+                logger.error(f"Error while refreshing the catalog index: {e}")
+
+    def stats(self) -> dict[str, int | bool]:
+        """
+        Get the index counters.
+
+        Returns:
+            dict[str, int | bool]: Size, version, hit and reload counters.
+        """
+        return {
+            "enabled": self.ready,
+            "games": len(self._records),
+            "version": self.version,
+            "hits": self.hits,
+            "reloads": self.reloads,
+        }
+
+
+catalog_index: CatalogIndex = CatalogIndex()
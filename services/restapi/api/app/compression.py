@@ -0,0 +1,260 @@
+import zlib
+from typing import Callable, Optional, Protocol
+
+from api.app.config import CompressionConfig
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Optional encoders, offered only when their package is installed
+try:
+    import brotli
+except ImportError:  # pragma: no cover
+    brotli = None  # type: ignore
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover
+    zstandard = None  # type: ignore
+
+# Media types worth compressing, by prefix
+COMPRESSIBLE_TYPES: tuple[str, ...] = (
+    "application/json",
+    "application/x-ndjson",
+    "text/",
+)
+
+
+class Encoder(Protocol):
+    """An incremental compressor of one response body."""
+
+    def flush(self, data: bytes) -> bytes:
+        """Compress a chunk and flush it, so the client can decode it right away."""
+        ...
+
+    def finish(self, data: bytes) -> bytes:
+        """Compress the last chunk and end the stream."""
+        ...
+
+
+class GzipEncoder:
+    def __init__(self, level: int):
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, zlib.MAX_WBITS | 16)
+
+    def flush(self, data: bytes) -> bytes:
+        return self._compressor.compress(data) + self._compressor.flush(
+            zlib.Z_SYNC_FLUSH,
+        )
+
+    def finish(self, data: bytes) -> bytes:
+        return self._compressor.compress(data) + self._compressor.flush()
+
+
+class BrotliEncoder:
+    def __init__(self, quality: int):
+        self._compressor = brotli.Compressor(quality=quality)
+
+    def flush(self, data: bytes) -> bytes:
+        return self._compressor.process(data) + self._compressor.flush()
+
+    def finish(self, data: bytes) -> bytes:
+        return self._compressor.process(data) + self._compressor.finish()
+
+
+class ZstdEncoder:
+    def __init__(self, level: int):
+        self._compressor = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def flush(self, data: bytes) -> bytes:
+        return self._compressor.compress(data) + self._compressor.flush(
+            zstandard.COMPRESSOBJ_FLUSH_BLOCK,
+        )
+
+    def finish(self, data: bytes) -> bytes:
+        return self._compressor.compress(data) + self._compressor.flush()
+
+
+def available_encoders(
+    compression_config: CompressionConfig,
+) -> dict[str, Callable[[], Encoder]]:
+    """
+    Get the encoders supported by this installation, the preferred one first.
+
+    Args:
+        compression_config (CompressionConfig): The compression levels.
+
+    Returns:
+        dict[str, Callable[[], Encoder]]: A factory of encoders per content coding.
+    """
+    encoders: dict[str, Callable[[], Encoder]] = {}
+    if zstandard is not None:
+        encoders["zstd"] = lambda: ZstdEncoder(compression_config.zstd_level)
+    if brotli is not None:
+        encoders["br"] = lambda: BrotliEncoder(compression_config.brotli_quality)
+    encoders["gzip"] = lambda: GzipEncoder(compression_config.gzip_level)
+    return encoders
+
+
+def negotiate_encoding(accept_encoding: str, supported: list[str]) -> Optional[str]:
+    """
+    Pick the content coding of a response from the `Accept-Encoding` request header.
+
+    Args:
+        accept_encoding (str): The value of the `Accept-Encoding` header.
+        supported (list[str]): The supported codings, the preferred one first.
+
+    Returns:
+        Optional[str]: The coding with the highest client weight (ties go to the
+        server preference), None to send the response as is.
+    """
+    weights: dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        coding, _, params = item.strip().partition(";")
+        weight: float = 1.0
+        name, _, value = params.strip().partition("=")
+        if name.strip() == "q":
+            try:
+                weight = float(value)
+            except ValueError:
+                weight = 0.0
+        if coding:
+            weights[coding.strip().lower()] = weight
+
+    best: Optional[str] = None
+    best_weight: float = 0.0
+    for coding in supported:
+        weight = weights.get(coding, weights.get("*", 0.0))
+        if weight > best_weight:
+            best, best_weight = coding, weight
+    return best
+
+
+def _add_vary(message: Message) -> None:
+    # Every representation of a compressible response depends on Accept-Encoding,
+    # the ones sent as is included, so shared caches keep them apart
+    headers: MutableHeaders = MutableHeaders(raw=message["headers"])
+    if message["status"] == 304 or headers.get("content-type", "").startswith(
+        COMPRESSIBLE_TYPES,
+    ):
+        headers.add_vary_header("Accept-Encoding")
+
+
+def _weaken_etag(headers: MutableHeaders) -> None:
+    etag: Optional[str] = headers.get("etag")
+    if etag is not None and not etag.startswith("W/"):
+        headers["ETag"] = f"W/{etag}"
+
+
+class CompressionMiddleware:
+    """
+    ASGI middleware compressing the responses with the coding negotiated
+    through `Accept-Encoding`.
+
+    Bodies sent in one message are compressed only above the minimum size.
+    Streamed bodies are compressed chunk by chunk, each chunk being flushed so
+    NDJSON lines still reach the client as soon as they are produced.
+    The `ETag` of a compressed response is made weak, as its bytes differ
+    from the identity representation. Every response of a compressible media
+    type varies on `Accept-Encoding`, whether it is compressed or not.
+    """
+
+    def __init__(self, app: ASGIApp, compression_config: CompressionConfig):
+        self.app: ASGIApp = app
+        self.enabled: bool = compression_config.enabled
+        self.minimum_size: int = compression_config.minimum_size
+        self.encoders: dict[str, Callable[[], Encoder]] = available_encoders(
+            compression_config,
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not self.enabled:
+            await self.app(scope, receive, send)
+            return
+
+        coding: Optional[str] = negotiate_encoding(
+            Headers(scope=scope).get("accept-encoding", ""),
+            list(self.encoders),
+        )
+        if coding is None:
+
+            async def send_identity(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    _add_vary(message)
+                await send(message)
+
+            await self.app(scope, receive, send_identity)
+            return
+
+        await _CompressedResponse(self, coding, send).run(scope, receive)
+
+
+class _CompressedResponse:
+    def __init__(self, middleware: CompressionMiddleware, coding: str, send: Send):
+        self.middleware: CompressionMiddleware = middleware
+        self.coding: str = coding
+        self.send: Send = send
+        self.start_message: Optional[Message] = None
+        self.encoder: Optional[Encoder] = None
+        self.passthrough: bool = False
+
+    async def run(self, scope: Scope, receive: Receive) -> None:
+        await self.middleware.app(scope, receive, self.send_compressed)
+
+    def _compress(self, headers: MutableHeaders, body: bytes, more_body: bool) -> bool:
+        if "content-encoding" in headers:
+            return False
+        content_type: str = headers.get("content-type", "")
+        if not content_type.startswith(COMPRESSIBLE_TYPES):
+            return False
+        return more_body or len(body) >= self.middleware.minimum_size
+
+    async def send_compressed(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            if message["status"] == 304:
+                # Revalidates the compressed representation the client holds
+                _weaken_etag(MutableHeaders(raw=message["headers"]))
+                _add_vary(message)
+                self.passthrough = True
+                await self.send(message)
+                return
+
+            # Wait for the first chunk to know whether the body is worth compressing
+            self.start_message = message
+            return
+
+        if message["type"] != "http.response.body" or self.passthrough:
+            await self.send(message)
+            return
+
+        body: bytes = message.get("body", b"")
+        more_body: bool = message.get("more_body", False)
+
+        if self.encoder is None:
+            assert self.start_message is not None
+            headers: MutableHeaders = MutableHeaders(raw=self.start_message["headers"])
+            if not self._compress(headers, body, more_body):
+                self.passthrough = True
+                _add_vary(self.start_message)
+                await self.send(self.start_message)
+                await self.send(message)
+                return
+
+            self.encoder = self.middleware.encoders[self.coding]()
+            headers["Content-Encoding"] = self.coding
+            headers.add_vary_header("Accept-Encoding")
+            _weaken_etag(headers)
+            if more_body:
+                del headers["Content-Length"]
+            else:
+                body = self.encoder.finish(body)
+                headers["Content-Length"] = str(len(body))
+                await self.send(self.start_message)
+                await self.send({"type": "http.response.body", "body": body})
+                return
+            await self.send(self.start_message)
+
+        chunk: bytes = (
+            self.encoder.flush(body) if more_body else self.encoder.finish(body)
+        )
+        await self.send(
+            {"type": "http.response.body", "body": chunk, "more_body": more_body},
+        )
@@ -1,4 +1,8 @@
-from pydantic import BaseModel
+import os
+from enum import Enum
+from typing import Optional
+
+from pydantic import BaseModel, Field, model_validator
 
 
 class APIAuthentication(BaseModel):
@@ -14,6 +18,166 @@ class APIAuthentication(BaseModel):
     password: str
 
 
+class ReadModel(str, Enum):
+    """
+    Tables the game listings are read from.
+
+    NORMALIZED joins game with platform, publisher and developer,
+    FLAT reads the trigger maintained `game_flat` table.
+    """
+
+    NORMALIZED = "normalized"
+    FLAT = "flat"
+
+
+class CacheConfig(BaseModel):
+    """
+    Represents the configuration of the game listing response cache.
+
+    Attributes:
+        enabled (bool): Whether the read endpoints are served from the cache.
+        max_entries (int): The maximum number of responses kept in the in-process LRU.
+        ttl_seconds (float): How long a cached response stays valid.
+        shared_path (Optional[str]): Path of a SQLite file shared by all workers, disabled when empty.
+    """
+
+    enabled: bool = False
+    max_entries: int = 256
+    ttl_seconds: float = 30.0
+    shared_path: Optional[str] = None
+
+
+class CatalogIndexConfig(BaseModel):
+    """
+    Represents the configuration of the in-memory catalog index.
+
+    Attributes:
+        enabled (bool): Whether the index is built at startup and serves the listings.
+        refresh_interval_seconds (float): How often the catalog version is checked to reload the index.
+    """
+
+    enabled: bool = False
+    refresh_interval_seconds: float = 5.0
+
+
+class IdempotencyConfig(BaseModel):
+    """
+    Represents the configuration of the `Idempotency-Key` support of `POST /game`.
+
+    Attributes:
+        enabled (bool): Whether the responses of requests carrying a key are stored and replayed.
+        max_entries (int): The maximum number of responses kept in the in-process LRU.
+        ttl_seconds (float): How long a response can be replayed.
+        shared_path (Optional[str]): Path of a SQLite file shared by all workers,
+            required with several workers, disabled when empty.
+    """
+
+    enabled: bool = True
+    max_entries: int = Field(default=10_000, ge=1)
+    ttl_seconds: float = Field(default=24 * 3600.0, gt=0)
+    shared_path: Optional[str] = None
+
+
+class WriteBehindConfig(BaseModel):
+    """
+    Represents the configuration of the write-behind mode of `POST /game`.
+
+    Attributes:
+        enabled (bool): Whether `POST /game` queues the games and answers `202 Accepted`,
+            only with a single worker.
+        queue_size (int): The maximum number of games waiting to be written, `503` above it.
+        batch_size (int): The maximum number of games committed in one transaction.
+        max_linger_seconds (float): How long the writer waits to fill a batch once a game is queued.
+        status_max_entries (int): The maximum number of write statuses kept.
+        status_ttl_seconds (float): How long the status of a write can be read.
+    """
+
+    enabled: bool = False
+    queue_size: int = Field(default=10_000, ge=1)
+    batch_size: int = Field(default=500, ge=1)
+    max_linger_seconds: float = Field(default=0.05, ge=0)
+    status_max_entries: int = Field(default=100_000, ge=1)
+    status_ttl_seconds: float = Field(default=3600.0, gt=0)
+
+
+class DimensionCacheConfig(BaseModel):
+    """
+    Represents the configuration of the platform, publisher and developer id cache.
+
+    Attributes:
+        enabled (bool): Whether the write path resolves the names from the cache first.
+        max_entries (int): The maximum number of names kept, over the three tables.
+    """
+
+    enabled: bool = True
+    max_entries: int = Field(default=4096, ge=1)
+
+
+class CompressionConfig(BaseModel):
+    """
+    Represents the configuration of the response compression.
+
+    Brotli and Zstandard are offered when the optional `brotli` and
+    `zstandard` packages are installed, gzip is always available.
+
+    Attributes:
+        enabled (bool): Whether responses are compressed when the client accepts it.
+        minimum_size (int): Responses with a smaller body (in bytes) are sent as is.
+        gzip_level (int): The gzip compression level, from 1 (fastest) to 9.
+        brotli_quality (int): The brotli quality, from 0 (fastest) to 11.
+        zstd_level (int): The zstd compression level, from 1 (fastest) to 22.
+    """
+
+    enabled: bool = True
+    minimum_size: int = 1024
+    gzip_level: int = Field(default=6, ge=1, le=9)
+    brotli_quality: int = Field(default=4, ge=0, le=11)
+    zstd_level: int = Field(default=3, ge=1, le=22)
+
+
+class EventLoop(str, Enum):
+    """
+    Event loop implementations of the server workers.
+
+    UVLOOP needs the optional `uvloop` package, ASYNCIO is used when it is missing.
+    """
+
+    ASYNCIO = "asyncio"
+    UVLOOP = "uvloop"
+
+
+class ServerConfig(BaseModel):
+    """
+    Represents the configuration of the Hypercorn server.
+
+    Attributes:
+        workers (int): The number of worker processes, 0 for one per CPU core.
+        event_loop (EventLoop): The event loop implementation of each worker.
+        backlog (int): The listen backlog of the socket shared by the workers.
+        keep_alive_timeout (float): Seconds an idle keep-alive connection is kept open.
+        keep_alive_max_requests (int): Requests served on a connection before it is closed.
+        h2_max_concurrent_streams (int): Concurrent streams allowed per HTTP/2 connection.
+        h2_max_inbound_frame_size (int): The largest HTTP/2 frame accepted, in bytes.
+    """
+
+    workers: int = Field(default=1, ge=0)
+    event_loop: EventLoop = EventLoop.ASYNCIO
+    backlog: int = Field(default=100, ge=1)
+    keep_alive_timeout: float = Field(default=5.0, gt=0)
+    keep_alive_max_requests: int = Field(default=1000, ge=1)
+    h2_max_concurrent_streams: int = Field(default=100, ge=1)
+    h2_max_inbound_frame_size: int = Field(default=2**14, ge=2**14, le=2**24 - 1)
+
+    def worker_count(self) -> int:
+        """
+        Get the number of worker processes.
+
+        Returns:
+            int: The configured number of workers, or the number of CPU cores when 0.
+        """
+        return self.workers or os.cpu_count() or 1
+
+
 class APIConfig(BaseModel):
     """
     Represents the configuration settings for the API.
@@ -21,7 +185,51 @@ class APIConfig(BaseModel):
     Attributes:
         auth (APIAuthentication): The authentication credentials required for the API.
         port (int): The port number on which the API server is running.
+        cache (CacheConfig): The response cache settings.
+        read_model (ReadModel): The tables the game listings are read from.
+        catalog_index (CatalogIndexConfig): The in-memory catalog index settings.
+        compression (CompressionConfig): The response compression settings.
+        dimension_cache (DimensionCacheConfig): The platform, publisher and developer id cache settings.
+        idempotency (IdempotencyConfig): The idempotency key settings.
+        write_behind (WriteBehindConfig): The write-behind mode settings.
+        server (ServerConfig): The server workers and connection settings.
     """
 
     auth: APIAuthentication
     port: int
+    cache: CacheConfig = CacheConfig()
+    read_model: ReadModel = ReadModel.NORMALIZED
+    catalog_index: CatalogIndexConfig = CatalogIndexConfig()
+    compression: CompressionConfig = CompressionConfig()
+    dimension_cache: DimensionCacheConfig = DimensionCacheConfig()
+    idempotency: IdempotencyConfig = IdempotencyConfig()
+    write_behind: WriteBehindConfig = WriteBehindConfig()
+    server: ServerConfig = ServerConfig()
+
+    @model_validator(mode="after")
+    def check_shared_state(self) -> "APIConfig":
+        """
+        Refuse the settings whose per-worker state breaks with several workers.
+
+        A request may reach any worker of the shared socket, so the state it
+        relies on must be visible to all of them.
+
+        Raises:
+            ValueError: If idempotency keys are enabled without a shared store,
+            or the write-behind mode is enabled.
+
+        Returns:
+            APIConfig: The validated settings.
+        """
+        if self.server.worker_count() > 1:
+            if self.idempotency.enabled and not self.idempotency.shared_path:
+                raise ValueError(
+                    "api.idempotency.shared_path is required with several workers, "
+                    "or a retry reaching another worker runs the write again",
+                )
+            if self.write_behind.enabled:
+                raise ValueError(
+                    "api.write_behind.enabled needs a single worker, the queue and "
+                    "the write statuses are kept by the worker that accepted the game",
+                )
+        return self
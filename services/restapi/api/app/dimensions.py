@@ -0,0 +1,210 @@
+import math
+from typing import Iterable, Optional
+
+from api.app.cache import TTLCache
+from api.app.config import DimensionCacheConfig
+from api.app.models import Developer, Game, Platform, Publisher
+from api.settings import config
+from sqlalchemy import event, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, SessionTransaction
+
+# The tables a game references by name
+DimensionModel = type[Platform] | type[Publisher] | type[Developer]
+
+# Every dimension model, in the order the names are loaded
+DIMENSION_MODELS: tuple[DimensionModel, ...] = (Platform, Publisher, Developer)
+
+# An insert supporting `ON CONFLICT`
+DialectInsert = postgresql.Insert | sqlite.Insert
+
+# The key of the session info holding the ids resolved by its transaction
+_PENDING_IDS: str = "dimension_ids"
+
+
+class DimensionIds:
+    """
+    A bounded, process-local cache of the ids of the platform, publisher and
+    developer names, consulted by the write path before the database.
+
+    The names are never renamed nor deleted by the API, so a cached id stays
+    valid and the entries only leave the cache when evicted. Ids resolved by
+    a transaction are only cached once it commits: an id created by a
+    transaction rolled back (a conflicting game) never reaches the cache.
+    """
+
+    def __init__(self, dimension_cache_config: DimensionCacheConfig):
+        self.enabled: bool = dimension_cache_config.enabled
+        self._ids: TTLCache[int] = TTLCache(
+            max_entries=dimension_cache_config.max_entries,
+            ttl_seconds=math.inf,
+        )
+
+    @staticmethod
+    def _key(model: DimensionModel, name: str) -> str:
+        return f"{model.__tablename__}:{name}"
+
+    def get(self, model: DimensionModel, name: str) -> Optional[int]:
+        """
+        Get the cached id of a name.
+
+        Args:
+            model (DimensionModel): The dimension model.
+            name (str): The name.
+
+        Returns:
+            Optional[int]: The id, or None if the name is not cached.
+        """
+        if not self.enabled:
+            return None
+        return self._ids.get(self._key(model, name))
+
+    def remember(
+        self,
+        db: AsyncSession,
+        model: DimensionModel,
+        ids: dict[str, int],
+    ) -> None:
+        """
+        Cache ids resolved in a transaction, once the transaction commits.
+
+        Args:
+            db (AsyncSession): The session of the transaction.
+            model (DimensionModel): The dimension model.
+            ids (dict[str, int]): The id of each name.
+        """
+        if self.enabled and ids:
+            db.sync_session.info.setdefault(_PENDING_IDS, []).append((model, ids))
+
+    def publish(self, model: DimensionModel, ids: dict[str, int]) -> None:
+        """
+        Cache committed ids.
+
+        Args:
+            model (DimensionModel): The dimension model.
+            ids (dict[str, int]): The id of each name.
+        """
+        if self.enabled:
+            for name, id_ in ids.items():
+                self._ids.set(self._key(model, name), id_)
+
+    async def load(self, db: AsyncSession) -> None:
+        """
+        Warm the cache with the names of the three tables, up to its size bound.
+
+        Args:
+            db (AsyncSession): The database session.
+        """
+        if not self.enabled:
+            return
+        for model in DIMENSION_MODELS:
+            rows = await db.execute(
+                select(model.name, model.id)
+                .order_by(model.id)
+                .limit(self._ids.max_entries),
+            )
+            self.publish(model, {name: id_ for name, id_ in rows.all()})
+
+    def clear(self) -> None:
+        """Drop every cached id."""
+        self._ids.clear()
+
+    def stats(self) -> dict[str, int | bool]:
+        """
+        Get the cache counters.
+
+        Returns:
+            dict[str, int | bool]: Size, hit, miss and eviction counters.
+        """
+        return {
+            "enabled": self.enabled,
+            "entries": len(self._ids),
+            "hits": self._ids.hits,
+            "misses": self._ids.misses,
+            "evictions": self._ids.evictions,
+        }
+
+
+dimension_ids: DimensionIds = DimensionIds(config.api.dimension_cache)
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_dimension_ids(session: Session) -> None:
+    for model, ids in session.info.pop(_PENDING_IDS, ()):
+        dimension_ids.publish(model, ids)
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _discard_dimension_ids(session: Session, transaction: SessionTransaction) -> None:
+    # Runs after the commit hook, ids left here belong to a rolled back transaction
+    if transaction.parent is None:
+        session.info.pop(_PENDING_IDS, None)
+
+
+def dialect_insert(model: DimensionModel | type[Game], dialect: str) -> DialectInsert:
+    """
+    Build an insert supporting `ON CONFLICT` on PostgreSQL and SQLite.
+
+    Args:
+        model (DimensionModel | type[Game]): The model to insert into.
+        dialect (str): The name of the database dialect.
+
+    Returns:
+        DialectInsert: The dialect specific insert of the model.
+    """
+    if dialect == "postgresql":
+        return postgresql.insert(model)
+    return sqlite.insert(model)
+
+
+async def resolve_dimension(
+    db: AsyncSession,
+    model: DimensionModel,
+    names: Iterable[str],
+) -> dict[str, int]:
+    """
+    Get the ids of platform, publisher or developer names, creating the missing ones.
+
+    The names found in `dimension_ids` cost no query. The others are resolved
+    as a set: one `INSERT ... ON CONFLICT DO NOTHING RETURNING` creates the
+    missing names and returns their ids, one `IN` lookup reads the ids of the
+    names that already existed. Names are inserted in sorted order so
+    concurrent writers lock them in the same order.
+
+    Args:
+        db (AsyncSession): The session of the write transaction.
+        model (DimensionModel): The dimension model (`Platform`, `Publisher` or `Developer`).
+        names (Iterable[str]): The names to resolve, possibly repeated.
+
+    Returns:
+        dict[str, int]: The id of every name.
+    """
+    ids: dict[str, int] = {}
+    wanted: list[str] = []
+    for name in sorted(set(names)):
+        cached: int | None = dimension_ids.get(model, name)
+        if cached is None:
+            wanted.append(name)
+        else:
+            ids[name] = cached
+    if not wanted:
+        return ids
+
+    created = await db.execute(
+        dialect_insert(model, db.get_bind().dialect.name)
+        .values([{"name": name} for name in wanted])
+        .on_conflict_do_nothing(index_elements=[model.name])
+        .returning(model.name, model.id),
+    )
+    resolved: dict[str, int] = {name: id_ for name, id_ in created.all()}
+
+    existing: list[str] = [name for name in wanted if name not in resolved]
+    if existing:
+        found = await db.execute(
+            select(model.name, model.id).where(model.name.in_(existing)),
+        )
+        resolved.update({name: id_ for name, id_ in found.all()})
+    dimension_ids.remember(db, model, resolved)
+    ids.update(resolved)
+    return ids
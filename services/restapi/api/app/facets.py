@@ -0,0 +1,132 @@
+from typing import Any, Sequence
+
+from api.app.queries import GameFilters, GameSource, filter_games
+from sqlalchemy import (
+    ColumnElement,
+    CTE,
+    Integer,
+    Row,
+    Select,
+    cast,
+    extract,
+    func,
+    literal,
+    null,
+    select,
+    tuple_,
+    union_all,
+)
+
+# The facets counted by `GET /games/facets`, in the order of the grouping mask bits
+FACETS: tuple[str, ...] = ("genre", "platform", "developer", "year")
+
+# `GROUPING(genre, platform, developer, year)` of the grand total row: nothing grouped
+TOTAL_MASK: int = (1 << len(FACETS)) - 1
+
+
+def _mask(facet: str) -> int:
+    # GROUPING() sets the bit of every column aggregated away, the first
+    # argument being the most significant bit
+    return TOTAL_MASK & ~(1 << (len(FACETS) - 1 - FACETS.index(facet)))
+
+
+def _facet_columns(games: CTE) -> list[ColumnElement[Any]]:
+    return [
+        games.c.genre,
+        games.c.platform,
+        games.c.developer,
+        cast(extract("year", games.c.release_date), Integer).label("year"),
+    ]
+
+
+def facet_counts_query(
+    source: GameSource, filters: GameFilters, dialect: str
+) -> Select:
+    """
+    Build the statement counting the games per facet value, in one SQL pass.
+
+    The filtered games are grouped once per facet: on PostgreSQL with
+    `GROUPING SETS`, plus the empty set for the total, so the games are read
+    a single time. Other databases (SQLite in the tests) get the equivalent
+    `UNION ALL` of one `GROUP BY` per facet.
+
+    Args:
+        source (GameSource): The source the listings are served from.
+        filters (GameFilters): The filters of `GET /games` to apply.
+        dialect (str): The name of the database dialect.
+
+    Returns:
+        Select: A statement returning the columns genre, platform, developer and
+        year (the one grouped on, the others NULL), count, and mask, the
+        `GROUPING()` bits telling which facet the row counts.
+    """
+    games: CTE = (
+        filter_games(
+            source.select(
+                ("genre", "platform", "developer", "release_date"),
+                filtered_on=filters.values(),
+            ),
+            source,
+            filters,
+        )
+        .order_by(None)
+        .cte("facet_games")
+    )
+    columns: list[ColumnElement[Any]] = _facet_columns(games)
+
+    if dialect == "postgresql":
+        return select(
+            *columns,
+            func.count().label("count"),
+            func.grouping(*columns).label("mask"),
+        ).group_by(
+            func.grouping_sets(*(tuple_(column) for column in columns), tuple_()),
+        )
+
+    def counts_of(grouped: ColumnElement[Any] | None, mask: int) -> Select:
+        return (
+            select(
+                *(
+                    column if column is grouped else null().label(column.key)
+                    for column in columns
+                ),
+                func.count().label("count"),
+                literal(mask).label("mask"),
+            )
+            .select_from(games)
+            .group_by(*([grouped] if grouped is not None else []))
+        )
+
+    return select(
+        union_all(
+            *(
+                counts_of(column, _mask(facet))
+                for column, facet in zip(columns, FACETS)
+            ),
+            counts_of(None, TOTAL_MASK),
+        ).subquery(),
+    )
+
+
+def facet_counts(rows: Sequence[Row]) -> dict[str, Any]:
+    """
+    Gather the rows of `facet_counts_query` by facet.
+
+    Args:
+        rows (Sequence[Row]): The grouped counts.
+
+    Returns:
+        dict[str, Any]: The total, and for each facet its values with their
+        count, the most frequent first (ties by value).
+    """
+    masks: dict[int, str] = {_mask(facet): facet for facet in FACETS}
+    counts: dict[str, Any] = {"total": 0, **{facet: [] for facet in FACETS}}
+    for row in rows:
+        if row.mask == TOTAL_MASK:
+            counts["total"] = row.count
+        else:
+            facet: str = masks[row.mask]
+            counts[facet].append({"value": row._mapping[facet], "count": row.count})
+    for facet in FACETS:
+        counts[facet].sort(key=lambda item: (-item["count"], item["value"]))
+    return counts
@@ -0,0 +1,96 @@
+import re
+
+from sqlalchemy import ColumnElement, func
+
+DEFAULT_SIMILARITY_THRESHOLD: float = 0.3
+
+_WORD: re.Pattern[str] = re.compile(r"[^\W_]+")
+
+
+def _trigrams(text: str) -> set[str]:
+    trigrams: set[str] = set()
+    for word in _WORD.findall(text.lower()):
+        padded: str = f"  {word} "
+        trigrams.update(map("".join, zip(padded, padded[1:], padded[2:])))
+    return trigrams
+
+
+def similarity(a: str, b: str) -> float:
+    """
+    Compute the pg_trgm `similarity` of two strings: the shared trigrams
+    over all the trigrams of both strings.
+
+    Args:
+        a (str): The first string.
+        b (str): The second string.
+
+    Returns:
+        float: The similarity, from 0 (no trigram in common) to 1.
+    """
+    if a is None or b is None:
+        return 0.0
+    trigrams_a, trigrams_b = _trigrams(a), _trigrams(b)
+    if not trigrams_a or not trigrams_b:
+        return 0.0
+    return len(trigrams_a & trigrams_b) / len(trigrams_a | trigrams_b)
+
+
+def word_similarity(query: str, text: str) -> float:
+    """
+    Approximate the pg_trgm `word_similarity`: the best similarity between
+    the query and any run of consecutive words of the text.
+
+    Args:
+        query (str): The searched words.
+        text (str): The text to search in.
+
+    Returns:
+        float: The similarity, from 0 to 1.
+    """
+    if query is None or text is None:
+        return 0.0
+    words: list[str] = _WORD.findall(text)
+    return max(
+        (
+            similarity(query, " ".join(words[start:end]))
+            for start in range(len(words))
+            for end in range(start + 1, len(words) + 1)
+        ),
+        default=0.0,
+    )
+
+
+def fuzzy_match(
+    column: ColumnElement[str],
+    value: str,
+    threshold: float,
+    dialect: str,
+    words: bool = False,
+) -> tuple[ColumnElement[bool], ColumnElement[float]]:
+    """
+    Build a trigram similarity condition and its relevance.
+
+    On PostgreSQL the pg_trgm operator (`%`, or `%>` for `words`) lets the
+    GIN trigram index of the column select the candidates, the exact
+    threshold is then applied on the computed similarity.
+
+    Args:
+        column (ColumnElement[str]): The column to match, with a trigram index.
+        value (str): The possibly misspelled value.
+        threshold (float): The minimum similarity, at least
+            `api.database.config.TRIGRAM_INDEX_THRESHOLD`.
+        dialect (str): The name of the database dialect.
+        words (bool): Whether the value may match any run of words of the column
+            (`word_similarity`) rather than the whole column (`similarity`).
+
+    Returns:
+        tuple[ColumnElement[bool], ColumnElement[float]]: The matching condition
+        and the similarity, higher is better.
+    """
+    score: ColumnElement[float] = (
+        func.word_similarity(value, column) if words else func.similarity(column, value)
+    )
+    match: ColumnElement[bool] = score >= threshold
+    if dialect == "postgresql":
+        match = column.bool_op("%>" if words else "%")(value) & match
+    return match, score
@@ -0,0 +1,216 @@
+import asyncio
+import hashlib
+import logging
+from dataclasses import dataclass
+from typing import Optional
+
+from api.app.cache import SQLiteStore, TTLCache
+from api.app.config import IdempotencyConfig
+from api.settings import config
+from fastapi import HTTPException, Response, status
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+# The request header carrying the key chosen by the client for an operation
+IDEMPOTENCY_KEY_HEADER: str = "Idempotency-Key"
+MAX_IDEMPOTENCY_KEY_LENGTH: int = 255
+
+# Set on the responses replayed from the store
+REPLAYED_HEADER: str = "Idempotent-Replayed"
+
+# How long a key stays claimed in the shared store by a worker that died
+# before finishing its request
+IN_FLIGHT_LEASE_SECONDS: float = 60.0
+_IN_FLIGHT_PREFIX: str = "in-flight:"
+
+
+@dataclass
+class StoredResponse:
+    """
+    A response kept for the retries of its idempotency key.
+
+    Attributes:
+        fingerprint (str): The hash of the request the response answered.
+        status_code (int): The status code of the response.
+        body (bytes): The JSON body of the response.
+    """
+
+    fingerprint: str
+    status_code: int
+    body: bytes
+
+    def dump(self) -> bytes:
+        """Serialize the response as a `status fingerprint` line followed by the body."""
+        return f"{self.status_code} {self.fingerprint}\n".encode() + self.body
+
+    @classmethod
+    def load(cls, raw: bytes) -> "StoredResponse":
+        """Deserialize a response produced by `dump`."""
+        head, body = raw.split(b"\n", 1)
+        status_code, fingerprint = head.decode().split(" ", 1)
+        return cls(fingerprint=fingerprint, status_code=int(status_code), body=body)
+
+    def replay(self) -> Response:
+        """Build the response sent again to a retry."""
+        return Response(
+            content=self.body,
+            status_code=self.status_code,
+            media_type="application/json",
+            headers={REPLAYED_HEADER: "true"},
+        )
+
+
+class IdempotencyStore:
+    """
+    Two-tier store of the responses sent for an idempotency key.
+
+    Like the `ResponseCache`, the first tier is an in-process LRU and the
+    optional second tier a `SQLiteStore` shared by all workers, both expiring
+    the responses after the configured TTL. A key whose request is still being
+    handled is claimed in process and in the shared store, so a retry racing
+    the original request, on any worker, is told to wait instead of running
+    the write again. The shared store is required with several workers (see
+    `APIConfig`), and queried in a worker thread.
+    """
+
+    def __init__(self, idempotency_config: IdempotencyConfig):
+        self.enabled: bool = idempotency_config.enabled
+        self.local: TTLCache[StoredResponse] = TTLCache(
+            max_entries=idempotency_config.max_entries,
+            ttl_seconds=idempotency_config.ttl_seconds,
+        )
+        self.shared: Optional[SQLiteStore] = (
+            SQLiteStore(idempotency_config.shared_path, idempotency_config.ttl_seconds)
+            if idempotency_config.enabled and idempotency_config.shared_path
+            else None
+        )
+        self._in_flight: set[str] = set()
+        self.replays: int = 0
+        self.mismatches: int = 0
+
+    @staticmethod
+    def fingerprint(body: bytes) -> str:
+        """
+        Hash a request, so a key reused for another request is detected.
+
+        Args:
+            body (bytes): The canonical encoding of the request.
+
+        Returns:
+            str: The hex digest of the request.
+        """
+        return hashlib.sha256(body).hexdigest()
+
+    async def _get(self, key: str) -> Optional[StoredResponse]:
+        stored: StoredResponse | None = self.local.get(key)
+        if stored is None and self.shared is not None:
+            raw: bytes | None = await asyncio.to_thread(self.shared.get, key)
+            if raw is not None:
+                stored = StoredResponse.load(raw)
+                self.local.set(key, stored)
+        return stored
+
+    async def _claim(self, key: str) -> bool:
+        if key in self._in_flight:
+            return False
+        self._in_flight.add(key)
+        if self.shared is not None and not await asyncio.to_thread(
+            self.shared.claim,
+            f"{_IN_FLIGHT_PREFIX}{key}",
+            IN_FLIGHT_LEASE_SECONDS,
+        ):
+            self._in_flight.discard(key)
+            return False
+        return True
+
+    async def begin(self, key: str, fingerprint: str) -> Optional[Response]:
+        """
+        Start handling a request carrying an idempotency key.
+
+        Args:
+            key (str): The idempotency key, scoped to the operation.
+            fingerprint (str): The fingerprint of the request.
+
+        Raises:
+            HTTPException: 422 if the key was used for another request, 409 if
+            the request of the key is still being handled (with `Retry-After`).
+
+        Returns:
+            Optional[Response]: The stored response to replay, or None if the
+            request must be handled, `end` being called once it is.
+        """
+        stored: StoredResponse | None = await self._get(key)
+        if stored is None:
+            if not await self._claim(key):
+                raise HTTPException(
+                    status_code=status.HTTP_409_CONFLICT,
+                    detail=f"A request with the same {IDEMPOTENCY_KEY_HEADER} is in progress.",
+                    headers={"Retry-After": "1"},
+                )
+            # The request holding the key may have ended since the lookup
+            stored = await self._get(key)
+            if stored is not None:
+                await self.end(key)
+
+        if stored is not None:
+            if stored.fingerprint != fingerprint:
+                self.mismatches += 1
+                raise HTTPException(
+                    status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                    detail=f"The {IDEMPOTENCY_KEY_HEADER} was already used for another request.",
+                )
+            self.replays += 1
+            logger.debug(f"Replaying the response of idempotency key {key}")
+            return stored.replay()
+        return None
+
+    async def record(
+        self,
+        key: str,
+        fingerprint: str,
+        status_code: int,
+        body: bytes,
+    ) -> None:
+        """
+        Store the final response of a request, for the replays of its key.
+
+        Args:
+            key (str): The idempotency key, scoped to the operation.
+            fingerprint (str): The fingerprint of the request.
+            status_code (int): The status code of the response.
+            body (bytes): The JSON body of the response.
+        """
+        stored: StoredResponse = StoredResponse(fingerprint, status_code, body)
+        self.local.set(key, stored)
+        if self.shared is not None:
+            await asyncio.to_thread(self.shared.set, key, stored.dump())
+
+    async def end(self, key: str) -> None:
+        """
+        Finish handling the request of a key, stored or not (e.g. after a 500).
+
+        Args:
+            key (str): The idempotency key, scoped to the operation.
+        """
+        if key in self._in_flight and self.shared is not None:
+            await asyncio.to_thread(self.shared.delete, f"{_IN_FLIGHT_PREFIX}{key}")
+        self._in_flight.discard(key)
+
+    def stats(self) -> dict[str, int | bool]:
+        """
+        Get the store counters.
+
+        Returns:
+            dict[str, int | bool]: Size, replay and mismatch counters.
+        """
+        return {
+            "enabled": self.enabled,
+            "entries": len(self.local),
+            "in_flight": len(self._in_flight),
+            "replays": self.replays,
+            "mismatches": self.mismatches,
+            "evictions": self.local.evictions,
+        }
+
+
+idempotency_store: IdempotencyStore = IdempotencyStore(config.api.idempotency)
@@ -0,0 +1,320 @@
+import zlib
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Iterator, Optional
+
+import orjson
+from api.app.bulk import insert_games, validation_detail
+from api.app.catalog import CatalogState, bump_catalog_version
+from api.app.dimensions import DimensionModel, dialect_insert
+from api.app.models import Developer, Game, Platform, Publisher
+from api.app.queries import DIMENSIONS, GAME_FIELDS
+from api.app.schemas import GameSchema
+from fastapi import HTTPException, status
+from pydantic import ValidationError
+from sqlalchemy import (
+    BigInteger,
+    Column,
+    Date,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    func,
+    literal,
+    select,
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.schema import CreateTable
+
+# Games staged with one COPY (PostgreSQL) or inserted together (other databases)
+INGEST_BATCH_SIZE: int = 5000
+
+# Longest accepted line of the NDJSON body, and most bytes inflated at once
+MAX_LINE_BYTES: int = 1 << 20
+
+# Invalid lines detailed in the report, the next ones are only counted
+MAX_REPORTED_ERRORS: int = 1000
+
+# The staging table of an ingest: temporary, so it is private to the
+# transaction, dropped by its commit and, like an unlogged table, never
+# written to the WAL
+game_ingest: Table = Table(
+    "game_ingest",
+    MetaData(),
+    Column("line", Integer, nullable=False),
+    *(
+        Column(name, Date if name == "release_date" else String, nullable=False)
+        for name in GAME_FIELDS
+    ),
+    prefixes=["TEMPORARY"],
+    postgresql_on_commit="DROP",
+)
+
+# The models of the names a game references, by field of `GameSchema`
+_DIMENSION_MODELS: dict[str, DimensionModel] = {
+    "platform": Platform,
+    "publisher": Publisher,
+    "developer": Developer,
+}
+
+
+@dataclass
+class IngestReport:
+    """
+    The outcome of an ingest.
+
+    Attributes:
+        lines (int): The number of non-blank lines read.
+        created (int): The number of created games.
+        conflicts (int): The number of games whose title already exists, in the
+            catalog or on an earlier line.
+        errors (int): The number of invalid lines.
+        error_details (list[tuple[int, str]]): The line number and the reason of
+            the first `MAX_REPORTED_ERRORS` invalid lines.
+    """
+
+    lines: int = 0
+    created: int = 0
+    conflicts: int = 0
+    errors: int = 0
+    error_details: list[tuple[int, str]] = field(default_factory=list)
+
+    def error(self, line: int, detail: str) -> None:
+        """
+        Record an invalid line.
+
+        Args:
+            line (int): The line number, starting at 1.
+            detail (str): Why the line was rejected.
+        """
+        self.errors += 1
+        if len(self.error_details) < MAX_REPORTED_ERRORS:
+            self.error_details.append((line, detail))
+
+
+def _invalid_body(detail: str) -> HTTPException:
+    return HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=detail)
+
+
+def _inflate(decompressor: Any, data: bytes) -> Iterator[bytes]:
+    # Bounded pieces, so a highly compressed chunk is never inflated at once
+    while data:
+        yield decompressor.decompress(data, MAX_LINE_BYTES)
+        data = decompressor.unconsumed_tail
+
+
+async def ndjson_lines(
+    chunks: AsyncIterator[bytes],
+    gzipped: bool = False,
+) -> AsyncIterator[bytes]:
+    """
+    Split a streamed NDJSON body into its lines, as the chunks arrive.
+
+    Only the current line is buffered, so the memory used does not depend on
+    the size of the body.
+
+    Args:
+        chunks (AsyncIterator[bytes]): The chunks of the request body.
+        gzipped (bool): Whether the body is gzip encoded.
+
+    Raises:
+        HTTPException: 400 if a line is longer than `MAX_LINE_BYTES` or the
+        gzip stream is invalid or truncated.
+
+    Returns:
+        AsyncIterator[bytes]: The lines, without their line break.
+    """
+    decompressor: Any = zlib.decompressobj(16 + zlib.MAX_WBITS) if gzipped else None
+    pending: bytes = b""
+    try:
+        async for chunk in chunks:
+            for data in (
+                _inflate(decompressor, chunk) if decompressor is not None else (chunk,)
+            ):
+                lines: list[bytes] = (pending + data).split(b"\n")
+                pending = lines.pop()
+                if len(pending) > MAX_LINE_BYTES:
+                    raise _invalid_body(f"Lines are limited to {MAX_LINE_BYTES} bytes")
+                for line in lines:
+                    yield line
+        if decompressor is not None:
+            if not decompressor.eof:
+                raise _invalid_body("Truncated gzip body")
+            pending += decompressor.flush()
+    except zlib.error as e:
+        raise _invalid_body(f"Invalid gzip body: {e}")
+    if pending:
+        yield pending
+
+
+async def ndjson_games(
+    lines: AsyncIterator[bytes],
+    report: IngestReport,
+) -> AsyncIterator[list[tuple[int, GameSchema]]]:
+    """
+    Validate the lines against `GameSchema`, in batches of `INGEST_BATCH_SIZE`.
+
+    Blank lines are skipped, invalid lines are recorded in the report.
+
+    Args:
+        lines (AsyncIterator[bytes]): The lines of the body.
+        report (IngestReport): The report of the ingest.
+
+    Returns:
+        AsyncIterator[list[tuple[int, GameSchema]]]: The line number and the
+        game of the valid lines.
+    """
+    batch: list[tuple[int, GameSchema]] = []
+    number: int = 0
+    async for line in lines:
+        number += 1
+        if not line.strip():
+            continue
+        report.lines += 1
+        try:
+            game: GameSchema = GameSchema.model_validate(orjson.loads(line))
+        except orjson.JSONDecodeError as e:
+            report.error(number, f"Invalid JSON: {e}")
+            continue
+        except ValidationError as e:
+            # Including the values longer than their column, so a single line
+            # cannot fail the whole merge
+            report.error(number, validation_detail(e))
+            continue
+
+        batch.append((number, game))
+        if len(batch) >= INGEST_BATCH_SIZE:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+async def _merge_staged_games(db: AsyncSession) -> int:
+    # The names are created first, sorted so concurrent writers lock them in
+    # the same order, then the catalog watermark is bumped and the games are
+    # inserted with their ids joined by name: like every other write, the
+    # names are locked before the watermark row
+    for name, model in _DIMENSION_MODELS.items():
+        await db.execute(
+            dialect_insert(model, "postgresql")
+            .from_select(
+                ["name"],
+                select(game_ingest.c[name]).distinct().order_by(game_ingest.c[name]),
+            )
+            .on_conflict_do_nothing(index_elements=[model.name]),
+        )
+
+    catalog: CatalogState = await bump_catalog_version(db)
+
+    # The first line of a title repeated in the body wins
+    staged = (
+        select(game_ingest)
+        .distinct(game_ingest.c.title)
+        .order_by(game_ingest.c.title, game_ingest.c.line)
+        .subquery("staged")
+    )
+    dimensions = {
+        name: model.__table__.alias(f"{name}_named")
+        for name, model in _DIMENSION_MODELS.items()
+    }
+    games = select(
+        staged.c.title,
+        staged.c.genre,
+        staged.c.description,
+        staged.c.release_date,
+        *(dimensions[name].c.id for name in DIMENSIONS),
+        literal(catalog.version, BigInteger),
+    ).order_by(staged.c.line)
+    for name in DIMENSIONS:
+        games = games.join(
+            dimensions[name],
+            dimensions[name].c.name == staged.c[name],
+        )
+
+    created = (
+        dialect_insert(Game, "postgresql")
+        .from_select(
+            [
+                "title",
+                "genre",
+                "description",
+                "release_date",
+                *(f"{name}_id" for name in DIMENSIONS),
+                "change_version",
+            ],
+            games,
+        )
+        .on_conflict_do_nothing(index_elements=[Game.title])
+        .returning(Game.id)
+        .cte("created")
+    )
+    return (await db.execute(select(func.count()).select_from(created))).scalar_one()
+
+
+async def _ingest_postgresql(
+    db: AsyncSession,
+    batches: AsyncIterator[list[tuple[int, GameSchema]]],
+) -> tuple[int, int]:
+    await db.execute(CreateTable(game_ingest))
+    connection = await (await db.connection()).get_raw_connection()
+    driver: Any = connection.driver_connection
+
+    staged: int = 0
+    async for batch in batches:
+        await driver.copy_records_to_table(
+            game_ingest.name,
+            records=[
+                (line, *(getattr(game, name) for name in GAME_FIELDS))
+                for line, game in batch
+            ],
+            columns=[column.name for column in game_ingest.columns],
+        )
+        staged += len(batch)
+
+    if not staged:
+        return 0, 0
+    created: int = await _merge_staged_games(db)
+    return created, staged - created
+
+
+async def ingest_games(
+    db: AsyncSession,
+    lines: AsyncIterator[bytes],
+) -> IngestReport:
+    """
+    Load the games of an NDJSON body in the current transaction, without committing it.
+
+    On PostgreSQL the valid lines are streamed with `COPY` into the
+    `game_ingest` staging table, then merged into the catalog with set-based
+    statements: one insert of the missing names per dimension table, one
+    insert of the games. Other databases (SQLite in the tests) write every
+    batch with `insert_games`. Either way, only one batch of games is held in
+    memory at a time, and the catalog watermark is bumped once the names are
+    created, right before the games are written (once per batch on other
+    databases), the games being stamped with its new version.
+
+    Args:
+        db (AsyncSession): The session of the write transaction.
+        lines (AsyncIterator[bytes]): The lines of the body, see `ndjson_lines`.
+
+    Raises:
+        HTTPException: 400 if the body is malformed.
+
+    Returns:
+        IngestReport: The counts of the ingest, and the invalid lines.
+    """
+    report: IngestReport = IngestReport()
+    batches = ndjson_games(lines, report)
+
+    if db.get_bind().dialect.name == "postgresql":
+        report.created, report.conflicts = await _ingest_postgresql(db, batches)
+        return report
+
+    async for batch in batches:
+        ids: list[Optional[int]]
+        ids, _ = await insert_games(db, [game for _, game in batch])
+        created: int = sum(game_id is not None for game_id in ids)
+        report.created += created
+        report.conflicts += len(ids) - created
+    return report
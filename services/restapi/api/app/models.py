@@ -1,8 +1,26 @@
 from typing import List
 
 from api.database.db import Base
-from sqlalchemy import Column, Date, ForeignKey, Integer, String
-from sqlalchemy.orm import Mapped, relationship
+from sqlalchemy import (
+    DDL,
+    BigInteger,
+    Column,
+    Date,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    event,
+    func,
+    text,
+)
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import Mapped, deferred, relationship
+
+# Text search configuration of game.search_vector, search queries must use the same one
+GAME_SEARCH_CONFIG: str = "english"
 
 
 class Platform(Base):
@@ -64,6 +82,15 @@ class Developer(Base):
     """
 
     __tablename__ = "developer"
+    __table_args__ = (
+        # Fuzzy lookup of misspelled names (pg_trgm)
+        Index(
+            "ix_developer_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
+    )
 
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
     name = Column(String(100), nullable=False, unique=True, index=True)
@@ -93,20 +120,79 @@ class Game(Base):
         platform (Platform): The platform on which the game is available, defined through the relationship with the Platform model.
         publisher (Publisher): The publisher of the game, defined through the relationship with the Publisher model.
         developer (Developer): The developer of the game, defined through the relationship with the Developer model.
+        search_vector (str): The weighted full-text document of the title and description, maintained by a trigger (PostgreSQL only).
+        created_at (datetime): The time the game was created.
+        updated_at (datetime): The time the game was last written.
+        change_version (int): The catalog version of the last write of the game, 0 for the games written before change tracking.
     """
 
     __tablename__ = "game"
+    __table_args__ = (
+        # Keyset used to order and paginate the game listing (and release_date lookups)
+        Index("ix_game_release_date_id", "release_date", "id"),
+        # One index per listing filter, each one already in the listing order, so a
+        # filtered page is an index range scan without sort
+        Index("ix_game_genre_release_date_id", "genre", "release_date", "id"),
+        Index(
+            "ix_game_platform_id_release_date_id",
+            "platform_id",
+            "release_date",
+            "id",
+        ),
+        Index(
+            "ix_game_developer_id_release_date_id",
+            "developer_id",
+            "release_date",
+            "id",
+        ),
+        # Change feed, the games written after a catalog version in write order
+        Index("ix_game_change_version_id", "change_version", "id"),
+        # Full-text and fuzzy title search
+        Index(
+            "ix_game_search_vector",
+            "search_vector",
+            postgresql_using="gin",
+        ).ddl_if(dialect="postgresql"),
+        Index(
+            "ix_game_title_trgm",
+            "title",
+            postgresql_using="gin",
+            postgresql_ops={"title": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
+    )
 
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
-    title = Column(String(255), nullable=False)
-    genre = Column(String(100), nullable=False, index=True)
+    title = Column(String(255), nullable=False, unique=True, index=True)
+    genre = Column(String(100), nullable=False)
     description = Column(String, nullable=False)
-    release_date = Column(Date, nullable=False, index=True)
+    release_date = Column(Date, nullable=False)
 
     platform_id = Column(Integer, ForeignKey("platform.id"), nullable=False)
-    publisher_id = Column(Integer, ForeignKey("publisher.id"), nullable=False)
+    publisher_id = Column(
+        Integer,
+        ForeignKey("publisher.id"),
+        nullable=False,
+        index=True,
+    )
     developer_id = Column(Integer, ForeignKey("developer.id"), nullable=False)
 
+    # Set by every write with the catalog version it bumped, see `GET /games/changes`
+    created_at = Column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
+    updated_at = Column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+        onupdate=func.now(),
+    )
+    change_version = Column(BigInteger, nullable=False, server_default=text("0"))
+
+    # Only read by the search endpoint, never loaded with the entity
+    search_vector = deferred(
+        Column(TSVECTOR().with_variant(Text(), "sqlite"), nullable=True),
+    )
+
     platform: Mapped["Platform"] = relationship(
         Platform,
         back_populates="games",
@@ -121,4 +207,205 @@ class Game(Base):
     )
 
     def __repr__(self):
-        return f"<Game(id={self.id}, title='{self.title}', release_date={self.release_date}, genre='{self.genre}', platform='{self.platform.name}', publisher='{self.publisher.name}', developer='{self.developer.name}')>"
+        # Only column attributes are used, so printing a game never triggers a lazy load
+        return f"<Game(id={self.id}, title='{self.title}', release_date={self.release_date}, genre='{self.genre}', platform_id={self.platform_id}, publisher_id={self.publisher_id}, developer_id={self.developer_id})>"
+
+
+class CatalogVersion(Base):
+    """
+    Represents the single-row watermark of the game catalog.
+
+    Attributes:
+        id (int): The primary key, the table only holds the row with id 1.
+        version (int): A counter incremented by every write to the catalog.
+        updated_at (datetime): The time of the last write to the catalog.
+    """
+
+    __tablename__ = "catalog_version"
+
+    id = Column(Integer, primary_key=True)
+    version = Column(BigInteger, nullable=False, default=0)
+    updated_at = Column(DateTime(timezone=True), nullable=False)
+
+    def __repr__(self):
+        return f"<CatalogVersion(version={self.version}, updated_at={self.updated_at})>"
+
+
+class GameFlat(Base):
+    """
+    Represents the denormalized read model of a game.
+
+    Each row mirrors a game with its platform, publisher and developer names
+    already resolved, so the listings are single-table index scans. The table
+    is maintained by database triggers on `game` and the dimension tables.
+
+    Attributes:
+        id (int): The id of the mirrored game.
+        title (str): The title of the game.
+        genre (str): The genre of the game.
+        description (str): The description of the game.
+        release_date (date): The release date of the game.
+        platform (str): The name of the platform.
+        publisher (str): The name of the publisher.
+        developer (str): The name of the developer.
+        platform_id (int): The id of the platform, used to propagate renames.
+        publisher_id (int): The id of the publisher, used to propagate renames.
+        developer_id (int): The id of the developer, used to propagate renames.
+    """
+
+    __tablename__ = "game_flat"
+    __table_args__ = (
+        Index("ix_game_flat_release_date_id", "release_date", "id"),
+        Index("ix_game_flat_genre_release_date_id", "genre", "release_date", "id"),
+        Index(
+            "ix_game_flat_platform_release_date_id",
+            "platform",
+            "release_date",
+            "id",
+        ),
+        Index(
+            "ix_game_flat_publisher_release_date_id",
+            "publisher",
+            "release_date",
+            "id",
+        ),
+        Index(
+            "ix_game_flat_developer_release_date_id",
+            "developer",
+            "release_date",
+            "id",
+        ),
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=False)
+    title = Column(String(255), nullable=False)
+    genre = Column(String(100), nullable=False)
+    description = Column(String, nullable=False)
+    release_date = Column(Date, nullable=False)
+    platform = Column(String(100), nullable=False)
+    publisher = Column(String(100), nullable=False)
+    developer = Column(String(100), nullable=False)
+
+    platform_id = Column(Integer, nullable=False)
+    publisher_id = Column(Integer, nullable=False)
+    developer_id = Column(Integer, nullable=False)
+
+    def __repr__(self):
+        return f"<GameFlat(id={self.id}, title='{self.title}', platform='{self.platform}', publisher='{self.publisher}', developer='{self.developer}')>"
+
+
+# The trigram operator classes of the fuzzy search indexes
+event.listen(
+    Base.metadata,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+)
+
+# Triggers keeping game_flat in sync, installed when the schema is created from the
+# metadata (the alembic migration installs the same ones on existing databases).
+_GAME_FLAT_SELECT: str = """
+    SELECT NEW.id, NEW.title, NEW.genre, NEW.description, NEW.release_date,
+           p.name, pu.name, d.name, NEW.platform_id, NEW.publisher_id, NEW.developer_id
+    FROM platform p, publisher pu, developer d
+    WHERE p.id = NEW.platform_id AND pu.id = NEW.publisher_id AND d.id = NEW.developer_id
+"""
+_GAME_FLAT_COLUMNS: str = (
+    "id, title, genre, description, release_date, platform, publisher, developer, "
+    "platform_id, publisher_id, developer_id"
+)
+# The game columns mirrored by game_flat, updating any other column (e.g. the
+# search vector) does not touch the read model
+_GAME_FLAT_SOURCE_COLUMNS: str = (
+    "title, genre, description, release_date, platform_id, publisher_id, developer_id"
+)
+
+# Title words rank above description words
+_GAME_SEARCH_VECTOR: str = (
+    f"setweight(to_tsvector('{GAME_SEARCH_CONFIG}', coalesce(NEW.title, '')), 'A') || "
+    f"setweight(to_tsvector('{GAME_SEARCH_CONFIG}', coalesce(NEW.description, '')), 'B')"
+)
+
+for _ddl in (
+    f"""
+    CREATE OR REPLACE FUNCTION game_flat_sync() RETURNS trigger AS $$
+    BEGIN
+        IF TG_OP = 'DELETE' THEN
+            DELETE FROM game_flat WHERE id = OLD.id;
+            RETURN OLD;
+        END IF;
+        INSERT INTO game_flat ({_GAME_FLAT_COLUMNS}) {_GAME_FLAT_SELECT}
+        ON CONFLICT (id) DO UPDATE SET
+            title = EXCLUDED.title, genre = EXCLUDED.genre,
+            description = EXCLUDED.description, release_date = EXCLUDED.release_date,
+            platform = EXCLUDED.platform, publisher = EXCLUDED.publisher,
+            developer = EXCLUDED.developer, platform_id = EXCLUDED.platform_id,
+            publisher_id = EXCLUDED.publisher_id, developer_id = EXCLUDED.developer_id;
+        RETURN NEW;
+    END;
+    $$ LANGUAGE plpgsql
+    """,
+    f"""
+    CREATE OR REPLACE TRIGGER game_flat_sync
+    AFTER INSERT OR UPDATE OF {_GAME_FLAT_SOURCE_COLUMNS} OR DELETE ON game
+    FOR EACH ROW EXECUTE FUNCTION game_flat_sync()
+    """,
+    f"""
+    CREATE OR REPLACE FUNCTION game_search_vector() RETURNS trigger AS $$
+    BEGIN
+        NEW.search_vector := {_GAME_SEARCH_VECTOR};
+        RETURN NEW;
+    END;
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE OR REPLACE TRIGGER game_search_vector
+    BEFORE INSERT OR UPDATE OF title, description ON game
+    FOR EACH ROW EXECUTE FUNCTION game_search_vector()
+    """,
+    *(
+        statement
+        for dimension in ("platform", "publisher", "developer")
+        for statement in (
+            f"""
+            CREATE OR REPLACE FUNCTION game_flat_{dimension}_rename() RETURNS trigger AS $$
+            BEGIN
+                UPDATE game_flat SET {dimension} = NEW.name WHERE {dimension}_id = NEW.id;
+                RETURN NEW;
+            END;
+            $$ LANGUAGE plpgsql
+            """,
+            f"""
+            CREATE OR REPLACE TRIGGER game_flat_{dimension}_rename AFTER UPDATE OF name ON {dimension}
+            FOR EACH ROW EXECUTE FUNCTION game_flat_{dimension}_rename()
+            """,
+        )
+    ),
+):
+    event.listen(
+        Base.metadata, "after_create", DDL(_ddl).execute_if(dialect="postgresql")
+    )
+
+for _ddl in (
+    *(
+        f"""
+        CREATE TRIGGER IF NOT EXISTS game_flat_{operation} AFTER {operation} ON game BEGIN
+            INSERT OR REPLACE INTO game_flat ({_GAME_FLAT_COLUMNS}) {_GAME_FLAT_SELECT};
+        END
+        """
+        for operation in ("insert", "update")
+    ),
+    """
+    CREATE TRIGGER IF NOT EXISTS game_flat_delete AFTER DELETE ON game BEGIN
+        DELETE FROM game_flat WHERE id = OLD.id;
+    END
+    """,
+    *(
+        f"""
+        CREATE TRIGGER IF NOT EXISTS game_flat_{dimension}_rename AFTER UPDATE OF name ON {dimension} BEGIN
+            UPDATE game_flat SET {dimension} = NEW.name WHERE {dimension}_id = NEW.id;
+        END
+        """
+        for dimension in ("platform", "publisher", "developer")
+    ),
+):
+    event.listen(Base.metadata, "after_create", DDL(_ddl).execute_if(dialect="sqlite"))
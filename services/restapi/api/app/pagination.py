@@ -0,0 +1,210 @@
+import base64
+import json
+from datetime import date
+from typing import Any
+
+from api.app.queries import GameSource
+from fastapi import HTTPException, status
+from sqlalchemy import ColumnElement, Select, and_, bindparam, or_, tuple_
+
+# Page size used when a cursor is given without an explicit limit
+DEFAULT_PAGE_SIZE: int = 100
+MAX_PAGE_SIZE: int = 1000
+
+
+def _encode(position: list) -> str:
+    raw: bytes = json.dumps(position).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def _decode(cursor: str) -> list:
+    padded: str = cursor + "=" * (-len(cursor) % 4)
+    return json.loads(base64.urlsafe_b64decode(padded))
+
+
+def _invalid_cursor() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail="Invalid pagination cursor",
+    )
+
+
+def encode_cursor(release_date: date, game_id: int) -> str:
+    """
+    Encode the keyset position of a game into an opaque cursor.
+
+    Args:
+        release_date (date): The release date of the last game of a page.
+        game_id (int): The id of the last game of a page.
+
+    Returns:
+        str: A url-safe cursor that points right after the given game.
+    """
+    return _encode([release_date.isoformat(), game_id])
+
+
+def decode_cursor(cursor: str) -> tuple[date, int]:
+    """
+    Decode a cursor produced by `encode_cursor`.
+
+    Args:
+        cursor (str): The opaque cursor received from the client.
+
+    Raises:
+        HTTPException: 400 if the cursor is malformed.
+
+    Returns:
+        tuple[date, int]: The (release_date, id) keyset position.
+    """
+    try:
+        release_date, game_id = _decode(cursor)
+        return date.fromisoformat(release_date), int(game_id)
+    except Exception:
+        raise _invalid_cursor()
+
+
+def encode_rank_cursor(rank: float, game_id: int) -> str:
+    """
+    Encode the position of a game in a relevance ranked listing.
+
+    Args:
+        rank (float): The relevance of the last game of a page.
+        game_id (int): The id of the last game of a page.
+
+    Returns:
+        str: A url-safe cursor that points right after the given game.
+    """
+    return _encode([rank, game_id])
+
+
+def decode_rank_cursor(cursor: str) -> tuple[float, int]:
+    """
+    Decode a cursor produced by `encode_rank_cursor`.
+
+    Args:
+        cursor (str): The opaque cursor received from the client.
+
+    Raises:
+        HTTPException: 400 if the cursor is malformed.
+
+    Returns:
+        tuple[float, int]: The (rank, id) position.
+    """
+    try:
+        rank, game_id = _decode(cursor)
+        return float(rank), int(game_id)
+    except Exception:
+        raise _invalid_cursor()
+
+
+def encode_change_cursor(until: int, change_version: int, game_id: int) -> str:
+    """
+    Encode the position of a game in the change feed.
+
+    Args:
+        until (int): The catalog version the feed is read up to.
+        change_version (int): The catalog version of the last game of a page.
+        game_id (int): The id of the last game of a page.
+
+    Returns:
+        str: A url-safe cursor that points right after the given game.
+    """
+    return _encode([until, change_version, game_id])
+
+
+def decode_change_cursor(cursor: str) -> tuple[int, int, int]:
+    """
+    Decode a cursor produced by `encode_change_cursor`.
+
+    Args:
+        cursor (str): The opaque cursor received from the client.
+
+    Raises:
+        HTTPException: 400 if the cursor is malformed.
+
+    Returns:
+        tuple[int, int, int]: The catalog version the feed is read up to, and
+        the (change_version, id) position.
+    """
+    try:
+        until, change_version, game_id = _decode(cursor)
+        return int(until), int(change_version), int(game_id)
+    except Exception:
+        raise _invalid_cursor()
+
+
+def page_params(limit: int, after: str | None) -> dict[str, Any]:
+    """
+    Get the values of the named bind parameters set by `paginate`.
+
+    Args:
+        limit (int): The number of games in the page.
+        after (str | None): The cursor returned with the previous page.
+
+    Raises:
+        HTTPException: 400 if the cursor is malformed.
+
+    Returns:
+        dict[str, Any]: The row limit and, after the first page, the cursor key.
+    """
+    params: dict[str, Any] = {"limit": limit + 1}
+    if after:
+        params["after_release_date"], params["after_id"] = decode_cursor(after)
+    return params
+
+
+def paginate(query: Select, source: GameSource, params: dict[str, Any]) -> Select:
+    """
+    Apply keyset pagination over the (release_date, id) key to a game query.
+
+    The row-value comparison lets the database seek straight into the
+    (release_date, id) index of the source, so a deep page costs the same as the first one.
+    One extra row is fetched to know whether a next page exists.
+    The key and the limit are named bind parameters, whose values are
+    decoded once from the cursor by `page_params`.
+
+    Args:
+        query (Select): The filtered game statement.
+        source (GameSource): The source the statement reads from.
+        params (dict[str, Any]): The values returned by `page_params`.
+
+    Returns:
+        Select: The statement restricted to the requested page.
+    """
+    if "after_id" in params:
+        query = query.where(
+            tuple_(source.release_date, source.id)
+            > tuple_(
+                bindparam("after_release_date", params["after_release_date"]),
+                bindparam("after_id", params["after_id"]),
+            ),
+        )
+    return query.limit(bindparam("limit", params["limit"]))
+
+
+def paginate_by_rank(
+    query: Select,
+    rank: ColumnElement[float],
+    game_id: ColumnElement[int],
+    limit: int,
+    after: str | None,
+) -> Select:
+    """
+    Apply keyset pagination to a listing ordered by descending rank, then by id.
+
+    Args:
+        query (Select): The statement, already ordered by (rank desc, id).
+        rank (ColumnElement[float]): The relevance expression of the statement.
+        game_id (ColumnElement[int]): The game id column of the statement.
+        limit (int): The number of games in the page.
+        after (str | None): The cursor returned with the previous page.
+
+    Returns:
+        Select: The statement restricted to the requested page.
+    """
+    if after:
+        after_rank, after_id = decode_rank_cursor(after)
+        query = query.where(
+            or_(rank < after_rank, and_(rank == after_rank, game_id > after_id)),
+        )
+    return query.limit(limit + 1)
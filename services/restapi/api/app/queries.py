@@ -0,0 +1,276 @@
+from dataclasses import dataclass
+from datetime import date
+from typing import Any, Iterable, Optional, Sequence
+
+from api.app.config import ReadModel
+from api.app.models import Developer, Game, GameFlat, Platform, Publisher
+from api.app.schemas import GameSchema
+from api.settings import config
+from fastapi import HTTPException, status
+from sqlalchemy import Select, bindparam, select
+
+# The fields of a game listing, in the `GameSchema` order
+GAME_FIELDS: tuple[str, ...] = tuple(GameSchema.model_fields)
+
+# The fields resolved through a join with their dimension table
+DIMENSIONS: tuple[str, ...] = ("platform", "publisher", "developer")
+
+
+@dataclass(frozen=True)
+class GameSource:
+    """
+    The columns a game listing is read from.
+
+    Filters, ordering and pagination are expressed against these columns, so
+    the same listing code runs on the normalized tables or on the read model.
+
+    Attributes:
+        id, title, genre, description, release_date, platform, publisher, developer:
+            The column expressions of the `GameSchema` fields (plus the game id).
+        joined (bool): Whether the names are resolved through joins on the dimension tables.
+    """
+
+    id: Any
+    title: Any
+    genre: Any
+    description: Any
+    release_date: Any
+    platform: Any
+    publisher: Any
+    developer: Any
+    joined: bool
+
+    def select(
+        self,
+        fields: Optional[Sequence[str]] = None,
+        filtered_on: Iterable[str] = (),
+    ) -> Select:
+        """
+        Build the base statement used by the game read endpoints.
+
+        Every returned row already holds the flat `GameSchema` fields, so no
+        lazy relationship load is issued while building the response.
+        Rows are ordered by the (release_date, id) keyset used for pagination.
+
+        Args:
+            fields (Optional[Sequence[str]]): The `GameSchema` fields to project,
+                None for all of them.
+            filtered_on (Iterable[str]): The fields the caller filters on, so their
+                dimension table is joined even when not projected.
+
+        Returns:
+            Select: A statement returning one row per game with the columns id,
+            release_date (the keyset) and the requested fields.
+        """
+        projected: Sequence[str] = GAME_FIELDS if fields is None else fields
+        query: Select = select(
+            self.id.label("id"),
+            self.release_date.label("release_date"),
+            *(
+                getattr(self, name).label(name)
+                for name in projected
+                if name != "release_date"
+            ),
+        )
+        if self.joined:
+            needed: set[str] = {*projected, *filtered_on}
+            for dimension in DIMENSIONS:
+                if dimension in needed:
+                    query = query.join(getattr(Game, dimension))
+        return query.order_by(self.release_date, self.id)
+
+
+# The normalized tables, names are projected through inner joins
+NORMALIZED_SOURCE: GameSource = GameSource(
+    id=Game.id,
+    title=Game.title,
+    genre=Game.genre,
+    description=Game.description,
+    release_date=Game.release_date,
+    platform=Platform.name,
+    publisher=Publisher.name,
+    developer=Developer.name,
+    joined=True,
+)
+
+# The trigger maintained read model, every listing is a single-table scan
+FLAT_SOURCE: GameSource = GameSource(
+    id=GameFlat.id,
+    title=GameFlat.title,
+    genre=GameFlat.genre,
+    description=GameFlat.description,
+    release_date=GameFlat.release_date,
+    platform=GameFlat.platform,
+    publisher=GameFlat.publisher,
+    developer=GameFlat.developer,
+    joined=False,
+)
+
+
+def game_source() -> GameSource:
+    """
+    Get the source the listings are served from, as configured by `api.read_model`.
+
+    Returns:
+        GameSource: The flat read model or the normalized tables.
+    """
+    if config.api.read_model == ReadModel.FLAT:
+        return FLAT_SOURCE
+    return NORMALIZED_SOURCE
+
+
+def select_games() -> Select:
+    """
+    Build the base statement of the game listings on the configured source.
+
+    Returns:
+        Select: See `GameSource.select`.
+    """
+    return game_source().select()
+
+
+def parse_fields(value: Optional[str]) -> Optional[tuple[str, ...]]:
+    """
+    Parse a sparse fieldset, e.g. `title,genre,platform`.
+
+    Args:
+        value (Optional[str]): The raw `fields` query parameter.
+
+    Raises:
+        HTTPException: 422 if a field is not a `GameSchema` field.
+
+    Returns:
+        Optional[tuple[str, ...]]: The requested fields in the `GameSchema` order,
+        None when every field is requested.
+    """
+    requested: tuple[str, ...] = split_values(value)
+    if not requested:
+        return None
+    unknown: list[str] = [name for name in requested if name not in GAME_FIELDS]
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Unknown fields: {', '.join(unknown)}",
+        )
+    return tuple(name for name in GAME_FIELDS if name in requested)
+
+
+def split_values(value: Optional[str]) -> tuple[str, ...]:
+    """
+    Parse a comma-separated list filter.
+
+    Args:
+        value (Optional[str]): The raw query parameter, e.g. `Action,Adventure`.
+
+    Returns:
+        tuple[str, ...]: The distinct non-empty values, sorted so equal filters
+        always build the same statement and cache key.
+    """
+    if not value:
+        return ()
+    return tuple(sorted({part.strip() for part in value.split(",") if part.strip()}))
+
+
+# The dimensions filtered by a list of values
+VALUE_FILTERS: tuple[str, ...] = ("genre", "platform", "developer", "publisher")
+
+
+@dataclass(frozen=True)
+class GameFilters:
+    """
+    The filters of a game listing.
+
+    Attributes:
+        genre, platform, developer, publisher (tuple[str, ...]): The accepted
+            values of each dimension, empty to accept any.
+        release_date (Optional[date]): The exact release date.
+        release_date_from (Optional[date]): The first release date, inclusive.
+        release_date_to (Optional[date]): The last release date, inclusive.
+    """
+
+    genre: tuple[str, ...] = ()
+    platform: tuple[str, ...] = ()
+    developer: tuple[str, ...] = ()
+    publisher: tuple[str, ...] = ()
+    release_date: Optional[date] = None
+    release_date_from: Optional[date] = None
+    release_date_to: Optional[date] = None
+
+    def values(self) -> dict[str, tuple[Any, ...]]:
+        """
+        Get the value filters, including the exact release date.
+
+        Returns:
+            dict[str, tuple[Any, ...]]: The accepted values of each filtered field.
+        """
+        values: dict[str, tuple[Any, ...]] = {
+            name: getattr(self, name) for name in VALUE_FILTERS if getattr(self, name)
+        }
+        if self.release_date is not None:
+            values["release_date"] = (self.release_date,)
+        return values
+
+    def params(self) -> dict[str, Optional[str]]:
+        """
+        Get the normalized query parameters of the filters, e.g. for cache keys.
+
+        Returns:
+            dict[str, Optional[str]]: The filters as query parameters, None when unset.
+        """
+        return {
+            **{name: ",".join(getattr(self, name)) or None for name in VALUE_FILTERS},
+            **{
+                name: getattr(self, name) and getattr(self, name).isoformat()
+                for name in ("release_date", "release_date_from", "release_date_to")
+            },
+        }
+
+    def bind_params(self) -> dict[str, Any]:
+        """
+        Get the values of the named bind parameters set by `filter_games`.
+
+        Returns:
+            dict[str, Any]: A value per single-valued filter, a list per
+            multi-valued filter, and the release date bounds.
+        """
+        params: dict[str, Any] = {
+            name: values[0] if len(values) == 1 else list(values)
+            for name, values in self.values().items()
+        }
+        if self.release_date_from is not None:
+            params["release_date_from"] = self.release_date_from
+        if self.release_date_to is not None:
+            params["release_date_to"] = self.release_date_to
+        return params
+
+
+def filter_games(query: Select, source: GameSource, filters: GameFilters) -> Select:
+    """
+    Apply the listing filters of `GET /games` to a game statement.
+
+    Whatever the number of values, a filter stays a single `=` or `IN`
+    predicate, served by one of the (filter, release_date, id) indexes of the source.
+    The values are named bind parameters (see `GameFilters.bind_params`), so the
+    statement can be executed again with the values of other filters of the same shape.
+
+    Args:
+        query (Select): The statement built with `GameSource.select`.
+        source (GameSource): The source the statement reads from.
+        filters (GameFilters): The filters to apply.
+
+    Returns:
+        Select: The filtered statement.
+    """
+    for name, value in filters.bind_params().items():
+        if name == "release_date_from":
+            query = query.where(source.release_date >= bindparam(name, value))
+        elif name == "release_date_to":
+            query = query.where(source.release_date <= bindparam(name, value))
+        elif isinstance(value, list):
+            query = query.where(
+                getattr(source, name).in_(bindparam(name, value, expanding=True)),
+            )
+        else:
+            query = query.where(getattr(source, name) == bindparam(name, value))
+
+    return query
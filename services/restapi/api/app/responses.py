@@ -22,8 +22,20 @@ create_game_responses: dict[int | str, dict[str, Any]] = {
             },
         },
     },
+    status.HTTP_202_ACCEPTED: {
+        "description": "Accepted - Write-behind mode, the game is queued, its status is at the Location header.",
+        "content": {
+            "application/json": {
+                "example": {
+                    "id": "6f1c0a3e9b2d4c5e8f7a6b5c4d3e2f1a",
+                    "title": "Example Game",
+                    "status": "pending",
+                },
+            },
+        },
+    },
     status.HTTP_409_CONFLICT: {
-        "description": "Conflict - Game already exists.",
+        "description": "Conflict - Game already exists, or the request of the Idempotency-Key is in progress.",
         "content": {
             "application/json": {
                 "example": {
@@ -34,6 +46,24 @@ create_game_responses: dict[int | str, dict[str, Any]] = {
             },
         },
     },
+    status.HTTP_422_UNPROCESSABLE_ENTITY: {
+        "description": "Unprocessable Entity - Invalid game, or Idempotency-Key already used for another game.",
+        "content": {
+            "application/json": {
+                "example": {
+                    "detail": "The Idempotency-Key was already used for another request.",
+                },
+            },
+        },
+    },
+    status.HTTP_503_SERVICE_UNAVAILABLE: {
+        "description": "Service Unavailable - Write-behind mode, the write queue is full.",
+        "content": {
+            "application/json": {
+                "example": {"detail": "The write queue is full, retry later."},
+            },
+        },
+    },
     status.HTTP_500_INTERNAL_SERVER_ERROR: {
         "description": "Internal Server Error - Something went wrong.",
         "content": {
@@ -67,6 +97,22 @@ get_game_responses: dict[int | str, dict[str, Any]] = {
                     },
                 ],
             },
+            "application/x-ndjson": {
+                "example": '{"title": "Example Game", "genre": "Action", "release_date": "2023-06-01", "description": "Example Description", "platform": "PC", "publisher": "Example Publisher", "developer": "Example Developer"}\n',
+            },
+        },
+    },
+    status.HTTP_304_NOT_MODIFIED: {
+        "description": "Not Modified - The `If-None-Match` copy is still current.",
+    },
+    status.HTTP_400_BAD_REQUEST: {
+        "description": "Bad Request - The pagination cursor is invalid.",
+        "content": {
+            "application/json": {
+                "example": {
+                    "detail": "Invalid pagination cursor",
+                },
+            },
         },
     },
     status.HTTP_404_NOT_FOUND: {
@@ -82,3 +128,196 @@ get_game_responses: dict[int | str, dict[str, Any]] = {
         },
     },
 }
+
+
+search_game_responses: dict[int | str, dict[str, Any]] = {
+    status.HTTP_200_OK: {
+        "description": "Found - Matching games, the most relevant first. The next page is linked in the `Link` header.",
+        "content": {
+            "application/json": {
+                "example": [
+                    {
+                        "title": "Example Game",
+                        "genre": "Action",
+                        "description": "Example Description",
+                        "release_date": "2023-06-01",
+                        "platform": "PC",
+                        "publisher": "Example Publisher",
+                        "developer": "Example Developer",
+                    },
+                ],
+            },
+        },
+    },
+    status.HTTP_304_NOT_MODIFIED: get_game_responses[status.HTTP_304_NOT_MODIFIED],
+    status.HTTP_400_BAD_REQUEST: get_game_responses[status.HTTP_400_BAD_REQUEST],
+}
+
+
+search_developer_responses: dict[int | str, dict[str, Any]] = {
+    status.HTTP_200_OK: {
+        "description": "Found - Developers with a similar name, the closest first.",
+        "content": {
+            "application/json": {
+                "example": [
+                    {
+                        "name": "Example Developer",
+                        "similarity": 0.65,
+                    },
+                ],
+            },
+        },
+    },
+}
+
+
+get_game_facets_responses: dict[int | str, dict[str, Any]] = {
+    status.HTTP_200_OK: {
+        "description": "Found - Counts of the games matching the filters, per genre, platform, developer and release year.",
+        "content": {
+            "application/json": {
+                "example": {
+                    "total": 3,
+                    "genre": [
+                        {"value": "Action", "count": 2},
+                        {"value": "RPG", "count": 1},
+                    ],
+                    "platform": [{"value": "PC", "count": 3}],
+                    "developer": [{"value": "Example Developer", "count": 3}],
+                    "year": [{"value": 2023, "count": 3}],
+                },
+            },
+        },
+    },
+    status.HTTP_304_NOT_MODIFIED: get_game_responses[status.HTTP_304_NOT_MODIFIED],
+}
+
+
+get_game_changes_responses: dict[int | str, dict[str, Any]] = {
+    status.HTTP_200_OK: {
+        "description": "Found - The games written after the `since` catalog version, in write order. A `Link` header points to the next page.",
+        "content": {
+            "application/json": {
+                "example": {
+                    "until": 42,
+                    "changes": [
+                        {
+                            "title": "Example Game",
+                            "genre": "Action",
+                            "release_date": "2023-01-01",
+                            "description": "This is an example game.",
+                            "platform": "PC",
+                            "publisher": "Example Publisher",
+                            "developer": "Example Developer",
+                            "id": 7,
+                            "change_version": 41,
+                            "created_at": "2024-06-01T12:00:00+00:00",
+                            "updated_at": "2024-06-01T12:00:00+00:00",
+                        },
+                    ],
+                },
+            },
+        },
+    },
+    status.HTTP_304_NOT_MODIFIED: get_game_responses[status.HTTP_304_NOT_MODIFIED],
+    status.HTTP_400_BAD_REQUEST: get_game_responses[status.HTTP_400_BAD_REQUEST],
+}
+
+
+create_games_bulk_responses: dict[int | str, dict[str, Any]] = {
+    status.HTTP_200_OK: {
+        "description": "Processed - The outcome of each game, created ones are committed together.",
+        "content": {
+            "application/json": {
+                "example": {
+                    "created": 1,
+                    "conflicts": 1,
+                    "errors": 1,
+                    "results": [
+                        {"index": 0, "title": "New Game", "status": "created"},
+                        {
+                            "index": 1,
+                            "title": "Example Game",
+                            "status": "conflict",
+                            "detail": "A game with the same title Example Game already exists.",
+                        },
+                        {
+                            "index": 2,
+                            "title": "Future Game",
+                            "status": "error",
+                            "detail": "release_date: Value error, Release date cannot be in the future.",
+                        },
+                    ],
+                },
+            },
+        },
+    },
+    status.HTTP_500_INTERNAL_SERVER_ERROR: create_game_responses[
+        status.HTTP_500_INTERNAL_SERVER_ERROR
+    ],
+}
+
+ingest_games_responses: dict[int | str, dict[str, Any]] = {
+    status.HTTP_200_OK: {
+        "description": "Processed - The counts of the ingest, valid lines are committed together.",
+        "content": {
+            "application/json": {
+                "example": {
+                    "lines": 3,
+                    "created": 1,
+                    "conflicts": 1,
+                    "errors": 1,
+                    "error_details": [
+                        {
+                            "line": 3,
+                            "detail": "release_date: Value error, Release date cannot be in the future.",
+                        },
+                    ],
+                },
+            },
+        },
+    },
+    status.HTTP_400_BAD_REQUEST: {
+        "description": "Bad Request - The body is not valid NDJSON (line too long, broken gzip stream).",
+        "content": {
+            "application/json": {
+                "example": {"detail": "Truncated gzip body"},
+            },
+        },
+    },
+    status.HTTP_415_UNSUPPORTED_MEDIA_TYPE: {
+        "description": "Unsupported Media Type - The body encoding is neither identity nor gzip.",
+        "content": {
+            "application/json": {
+                "example": {"detail": "Unsupported content encoding: br"},
+            },
+        },
+    },
+    status.HTTP_500_INTERNAL_SERVER_ERROR: create_game_responses[
+        status.HTTP_500_INTERNAL_SERVER_ERROR
+    ],
+}
+
+get_game_write_responses: dict[int | str, dict[str, Any]] = {
+    status.HTTP_200_OK: {
+        "description": "Successful Response - The state of the queued game.",
+        "content": {
+            "application/json": {
+                "example": {
+                    "id": "6f1c0a3e9b2d4c5e8f7a6b5c4d3e2f1a",
+                    "title": "Example Game",
+                    "status": "conflict",
+                    "detail": "A game with the same title Example Game already exists.",
+                },
+            },
+        },
+    },
+    status.HTTP_404_NOT_FOUND: {
+        "description": "Not Found - Unknown or expired write.",
+        "content": {
+            "application/json": {
+                "example": {"detail": "Write not found"},
+            },
+        },
+    },
+}
@@ -0,0 +1,71 @@
+import logging
+
+from api.app.fuzzy import DEFAULT_SIMILARITY_THRESHOLD, fuzzy_match
+from api.app.models import Developer
+from api.app.responses import search_developer_responses
+from api.app.schemas import DeveloperMatchSchema
+from api.app.search import MAX_QUERY_LENGTH
+from api.database.config import TRIGRAM_INDEX_THRESHOLD
+from api.database.db import get_async_db
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy import Select, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+router: APIRouter = APIRouter(tags=["Developers"])
+logger: logging.Logger = logging.getLogger(__name__)
+
+# Maximum number of candidates returned by a fuzzy search
+MAX_CANDIDATES: int = 100
+
+
+@router.get(
+    "/developers/search",
+    response_model=list[DeveloperMatchSchema],
+    responses=search_developer_responses,
+)
+async def search_developers(
+    q: str = Query(
+        ...,
+        min_length=1,
+        max_length=MAX_QUERY_LENGTH,
+        description="The developer name, possibly misspelled.",
+    ),
+    threshold: float = Query(
+        DEFAULT_SIMILARITY_THRESHOLD,
+        ge=TRIGRAM_INDEX_THRESHOLD,
+        le=1,
+        description="Minimum trigram similarity of the returned names.",
+    ),
+    limit: int = Query(
+        10,
+        ge=1,
+        le=MAX_CANDIDATES,
+        description="Maximum number of candidates.",
+    ),
+    db: AsyncSession = Depends(get_async_db),
+) -> list[DeveloperMatchSchema]:
+    try:
+        # Rank the candidates selected by the trigram index, the closest name first
+        match, score = fuzzy_match(
+            Developer.name,
+            q,
+            threshold,
+            db.get_bind().dialect.name,
+        )
+        query: Select = (
+            select(Developer.name, score.label("similarity"))
+            .where(match)
+            .order_by(score.desc(), Developer.name)
+            .limit(limit)
+        )
+        return [
+            DeveloperMatchSchema(name=row.name, similarity=row.similarity)
+            for row in (await db.execute(query)).all()
+        ]
+
+    except Exception as e:
+        logger.error(f"An error occurred: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=str(e),
+        )
@@ -1,57 +1,564 @@
 import logging
-from datetime import datetime
-from typing import Optional
+from datetime import date
+from typing import Any, Optional
 
-from api.app.models import Developer, Game, Platform, Publisher
-from api.app.responses import create_game_responses, get_game_responses
-from api.app.schemas import GameCreateResponse, GameSchema
-from api.database.db import get_db
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from sqlalchemy.orm.query import Query
+import orjson
+from api.app.bulk import MAX_BULK_GAMES, insert_games, validation_detail
+from api.app.cache import CachedResponse, response_cache
+from api.app.catalog_index import IndexListing, catalog_index
+from api.app.catalog import (
+    CatalogState,
+    get_catalog_state,
+    not_modified,
+)
+from api.app.facets import facet_counts, facet_counts_query
+from api.app.fuzzy import DEFAULT_SIMILARITY_THRESHOLD, fuzzy_match
+from api.app.idempotency import (
+    IDEMPOTENCY_KEY_HEADER,
+    MAX_IDEMPOTENCY_KEY_LENGTH,
+    idempotency_store,
+)
+from api.app.ingest import IngestReport, ingest_games, ndjson_lines
+from api.app.models import Game
+from api.app.pagination import (
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE,
+    encode_change_cursor,
+    encode_cursor,
+    encode_rank_cursor,
+    paginate_by_rank,
+)
+from api.app.queries import (
+    GAME_FIELDS,
+    NORMALIZED_SOURCE,
+    GameFilters,
+    GameSource,
+    game_source,
+    parse_fields,
+    split_values,
+)
+from api.app.responses import (
+    create_game_responses,
+    create_games_bulk_responses,
+    get_game_changes_responses,
+    get_game_facets_responses,
+    get_game_responses,
+    get_game_write_responses,
+    ingest_games_responses,
+    search_game_responses,
+)
+from api.app.schemas import (
+    BulkGameResult,
+    BulkGamesResponse,
+    BulkGameStatus,
+    GameChangesResponse,
+    GameCreateResponse,
+    GameFacetsSchema,
+    GameSchema,
+    GameWriteSchema,
+    IngestGamesResponse,
+    IngestLineError,
+)
+from api.app.search import MAX_QUERY_LENGTH, match_games
+from api.app.serialization import encode_games, game_dicts
+from api.app.statements import (
+    CHANGES_STATEMENT,
+    changes_params,
+    developer_id_by_name,
+    listing_statement,
+)
+from api.app.streaming import NDJSON_MEDIA_TYPE, stream_games, wants_ndjson
+from api.app.write_behind import write_behind
+from api.app.writes import insert_game
+from api.database.config import TRIGRAM_INDEX_THRESHOLD
+from api.database.db import get_async_db, get_db_sessionmaker
+from fastapi import (
+    APIRouter,
+    Body,
+    Depends,
+    Header,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    status,
+)
+from fastapi.responses import StreamingResponse
+from pydantic import ValidationError
+from sqlalchemy import ColumnElement, Row, Select, and_
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from starlette.datastructures import URL
 
 router: APIRouter = APIRouter(tags=["Games"])
 logger: logging.Logger = logging.getLogger(__name__)
 
+# The fields of a game in the change feed, in the order of `GameChangeSchema`
+CHANGE_FIELDS: tuple[str, ...] = (
+    *GAME_FIELDS,
+    "id",
+    "change_version",
+    "created_at",
+    "updated_at",
+)
+
+
+def _json_response(cached: CachedResponse, validators: dict[str, str]) -> Response:
+    """
+    Build the HTTP response of an already serialized game listing.
+
+    Args:
+        cached (CachedResponse): The serialized body and its headers.
+        validators (dict[str, str]): The `ETag`/`Last-Modified` headers of the listing.
+
+    Returns:
+        Response: A JSON response sending the body as is.
+    """
+    return Response(
+        content=cached.body,
+        media_type="application/json",
+        headers={**cached.headers, **validators},
+    )
+
+
+def _next_link(request: Request, release_date: date, game_id: int, limit: int) -> str:
+    """
+    Build the `Link` header pointing to the page after the given game.
+
+    Args:
+        request (Request): The request of the current page.
+        release_date (date): The release date of the last game of the page.
+        game_id (int): The id of the last game of the page.
+        limit (int): The page size.
+
+    Returns:
+        str: The `Link` header value with the `next` relation.
+    """
+    next_url: URL = request.url.include_query_params(
+        after=encode_cursor(release_date, game_id),
+        limit=limit,
+    )
+    return f'<{next_url}>; rel="next"'
+
+
+def game_filters(
+    platform: Optional[str] = Query(
+        None,
+        description="Comma-separated platform names.",
+    ),
+    release_date: Optional[date] = None,
+    release_date_from: Optional[date] = Query(
+        None,
+        description="First release date, inclusive.",
+    ),
+    release_date_to: Optional[date] = Query(
+        None,
+        description="Last release date, inclusive.",
+    ),
+    genre: Optional[str] = Query(None, description="Comma-separated genres."),
+    developer: Optional[str] = Query(
+        None,
+        description="Comma-separated developer names.",
+    ),
+    publisher: Optional[str] = Query(
+        None,
+        description="Comma-separated publisher names.",
+    ),
+) -> GameFilters:
+    """
+    Read the listing filters shared by `GET /games` and `GET /games/facets`.
+
+    Args:
+        platform (Optional[str]): Comma-separated platform names.
+        release_date (Optional[date]): The exact release date.
+        release_date_from (Optional[date]): The first release date, inclusive.
+        release_date_to (Optional[date]): The last release date, inclusive.
+        genre (Optional[str]): Comma-separated genres.
+        developer (Optional[str]): Comma-separated developer names.
+        publisher (Optional[str]): Comma-separated publisher names.
+
+    Returns:
+        GameFilters: The parsed filters.
+    """
+    return GameFilters(
+        genre=split_values(genre),
+        platform=split_values(platform),
+        developer=split_values(developer),
+        publisher=split_values(publisher),
+        release_date=release_date,
+        release_date_from=release_date_from,
+        release_date_to=release_date_to,
+    )
+
 
 @router.get("/games", response_model=list[GameSchema], responses=get_game_responses)
 async def get_games(
-    platform: Optional[str] = None,
-    release_date: Optional[str] = None,
-    genre: Optional[str] = None,
-    db: Session = Depends(get_db),
-) -> list[GameSchema]:
+    request: Request,
+    filters: GameFilters = Depends(game_filters),
+    fields: Optional[str] = Query(
+        None,
+        description="Comma-separated fields to return (e.g. `title,genre,platform`), all by default.",
+    ),
+    limit: Optional[int] = Query(
+        None,
+        ge=1,
+        le=MAX_PAGE_SIZE,
+        description="Maximum number of games per page, enables pagination.",
+    ),
+    after: Optional[str] = Query(
+        None,
+        description="Cursor of the next page, as returned in the `Link` header.",
+    ),
+    stream: bool = Query(
+        False,
+        description="Stream every matching game as NDJSON (same as `Accept: application/x-ndjson`).",
+    ),
+    use_index: bool = Query(
+        True,
+        description="Set to false to bypass the in-memory catalog index and read from SQL (consistency checks).",
+    ),
+    db: AsyncSession = Depends(get_async_db),
+    db_sessionmaker: async_sessionmaker[AsyncSession] = Depends(get_db_sessionmaker),
+) -> Response:
     try:
-        query: Query[Game] = db.query(Game)
-
-        if genre:
-            query = query.filter(Game.genre == genre)
-
-        if release_date:
-            query = query.filter(Game.release_date == release_date)
-
-        if platform:
-            query = query.join(Game.platform).filter(Platform.name == platform)
-
-        db_games: list[Game] = query.all()
-
-        games: list[GameSchema] = [
-            GameSchema(
-                title=str(game.title),
-                genre=str(game.genre),
-                description=str(game.description),
-                platform=str(game.platform.name),
-                developer=str(game.developer.name),
-                publisher=str(game.publisher.name),
-                release_date=datetime.strptime(
-                    str(game.release_date),
-                    "%Y-%m-%d",
-                ),
+        # Only the requested columns are selected, and only their joins are made
+        projection: Optional[tuple[str, ...]] = parse_fields(fields)
+        source: GameSource = game_source()
+
+        if stream or wants_ndjson(request.headers.get("accept")):
+            query, params = listing_statement(source, filters, projection)
+            return StreamingResponse(
+                stream_games(db_sessionmaker, query, params, projection),
+                media_type=NDJSON_MEDIA_TYPE,
             )
-            for game in db_games
-        ]
 
-        return games
+        if after is not None:
+            limit = limit or DEFAULT_PAGE_SIZE
+
+        # Serve the listing from the in-memory index, without any database round trip.
+        # The index holds whole games, so sparse fieldsets are read from SQL.
+        listing: IndexListing | None = (
+            catalog_index.listing(filters, limit=limit, after=after)
+            if use_index and projection is None
+            else None
+        )
+        if listing is not None:
+            cache_key: str = response_cache.make_key(
+                "/games",
+                **filters.params(),
+                limit=limit,
+                after=after,
+                catalog=catalog_index.version,
+            )
+            validators: dict[str, str] = catalog_index.state.headers(cache_key)
+            unchanged: Response | None = not_modified(request, validators)
+            if unchanged is not None:
+                return unchanged
+
+            headers: dict[str, str] = {}
+            if listing.next_key is not None and limit is not None:
+                headers["Link"] = _next_link(request, *listing.next_key, limit)
+            return _json_response(CachedResponse(listing.body, headers), validators)
+
+        # Answer pollers whose copy is still current without running the query
+        catalog: CatalogState = await get_catalog_state(db)
+        cache_key = response_cache.make_key(
+            "/games",
+            **filters.params(),
+            fields=projection and ",".join(projection),
+            limit=limit,
+            after=after,
+            catalog=catalog.version,
+        )
+        validators = catalog.headers(cache_key)
+        unchanged = not_modified(request, validators)
+        if unchanged is not None:
+            return unchanged
+
+        cache_version: int = await response_cache.current_version()
+        cached: CachedResponse | None = await response_cache.get(
+            cache_key, cache_version
+        )
+        if cached is not None:
+            return _json_response(cached, validators)
+
+        headers = {}
+        query, params = listing_statement(source, filters, projection, limit, after)
+        rows: list[Row] = list((await db.execute(query, params)).all())
+
+        # The extra row fetched by a paginated statement tells us there is a next page
+        if limit is not None and len(rows) > limit:
+            rows = rows[:limit]
+            headers["Link"] = _next_link(
+                request,
+                rows[-1].release_date,
+                rows[-1].id,
+                limit,
+            )
+
+        cached = CachedResponse(
+            body=encode_games(rows, projection or GAME_FIELDS),
+            headers=headers,
+        )
+        await response_cache.set(cache_key, cache_version, cached)
+        return _json_response(cached, validators)
+
+    except HTTPException as http_exc:
+        logger.error(f"HTTP error occurred: {http_exc.detail}")
+        raise http_exc
+
+    except Exception as e:
+        logger.error(f"An error occurred: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=str(e),
+        )
+
+
+@router.get(
+    "/games/facets",
+    response_model=GameFacetsSchema,
+    responses=get_game_facets_responses,
+)
+async def get_game_facets(
+    request: Request,
+    filters: GameFilters = Depends(game_filters),
+    db: AsyncSession = Depends(get_async_db),
+) -> Response:
+    try:
+        catalog: CatalogState = await get_catalog_state(db)
+        cache_key: str = response_cache.make_key(
+            "/games/facets",
+            **filters.params(),
+            catalog=catalog.version,
+        )
+        validators: dict[str, str] = catalog.headers(cache_key)
+        unchanged: Response | None = not_modified(request, validators)
+        if unchanged is not None:
+            return unchanged
+
+        cache_version: int = await response_cache.current_version()
+        cached: CachedResponse | None = await response_cache.get(
+            cache_key, cache_version
+        )
+        if cached is not None:
+            return _json_response(cached, validators)
+
+        # Every facet is counted by the same statement, in one pass over the games
+        query: Select = facet_counts_query(
+            game_source(),
+            filters,
+            db.get_bind().dialect.name,
+        )
+        facets: GameFacetsSchema = GameFacetsSchema(
+            **facet_counts((await db.execute(query)).all()),
+        )
+
+        cached = CachedResponse(body=facets.model_dump_json().encode("utf-8"))
+        await response_cache.set(cache_key, cache_version, cached)
+        return _json_response(cached, validators)
+
+    except HTTPException as http_exc:
+        logger.error(f"HTTP error occurred: {http_exc.detail}")
+        raise http_exc
+
+    except Exception as e:
+        logger.error(f"An error occurred: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=str(e),
+        )
+
+
+@router.get(
+    "/games/changes",
+    response_model=GameChangesResponse,
+    responses=get_game_changes_responses,
+)
+async def get_game_changes(
+    request: Request,
+    since: Optional[int] = Query(
+        None,
+        ge=0,
+        description="Catalog version the client is up to date with (the `until` of its last poll), the whole catalog if omitted.",
+    ),
+    limit: int = Query(
+        DEFAULT_PAGE_SIZE,
+        ge=1,
+        le=MAX_PAGE_SIZE,
+        description="Maximum number of games per page.",
+    ),
+    after: Optional[str] = Query(
+        None,
+        description="Cursor of the next page, as returned in the `Link` header.",
+    ),
+    db: AsyncSession = Depends(get_async_db),
+) -> Response:
+    try:
+        # The watermark is bumped under the lock of its row, so every game up to
+        # the current version is committed: a page never skips a later commit
+        catalog: CatalogState = await get_catalog_state(db)
+        until, params = changes_params(since, catalog.version, limit, after)
+        cache_key: str = response_cache.make_key(
+            "/games/changes",
+            since=since,
+            limit=limit,
+            after=after,
+            catalog=catalog.version,
+        )
+        validators: dict[str, str] = catalog.headers(cache_key)
+        unchanged: Response | None = not_modified(request, validators)
+        if unchanged is not None:
+            return unchanged
+
+        cache_version: int = await response_cache.current_version()
+        cached: CachedResponse | None = await response_cache.get(
+            cache_key, cache_version
+        )
+        if cached is not None:
+            return _json_response(cached, validators)
+
+        headers: dict[str, str] = {}
+        rows: list[Row] = list((await db.execute(CHANGES_STATEMENT, params)).all())
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_url: URL = request.url.include_query_params(
+                after=encode_change_cursor(until, rows[-1].change_version, rows[-1].id),
+                limit=limit,
+            )
+            headers["Link"] = f'<{next_url}>; rel="next"'
+
+        cached = CachedResponse(
+            body=orjson.dumps(
+                {
+                    "until": until,
+                    "changes": game_dicts(rows, CHANGE_FIELDS),
+                },
+            ),
+            headers=headers,
+        )
+        await response_cache.set(cache_key, cache_version, cached)
+        return _json_response(cached, validators)
+
+    except HTTPException as http_exc:
+        logger.error(f"HTTP error occurred: {http_exc.detail}")
+        raise http_exc
+
+    except Exception as e:
+        logger.error(f"An error occurred: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=str(e),
+        )
+
+
+@router.get(
+    "/games/search",
+    response_model=list[GameSchema],
+    responses=search_game_responses,
+)
+async def search_games(
+    request: Request,
+    q: Optional[str] = Query(
+        None,
+        min_length=1,
+        max_length=MAX_QUERY_LENGTH,
+        description='Words to search in the titles and descriptions (supports "quoted phrases", `or` and `-word`).',
+    ),
+    title_like: Optional[str] = Query(
+        None,
+        alias="title~",
+        min_length=1,
+        max_length=MAX_QUERY_LENGTH,
+        description="A title, possibly misspelled, matched by trigram similarity.",
+    ),
+    threshold: float = Query(
+        DEFAULT_SIMILARITY_THRESHOLD,
+        ge=TRIGRAM_INDEX_THRESHOLD,
+        le=1,
+        description="Minimum trigram similarity of the titles matched by `title~`.",
+    ),
+    limit: int = Query(
+        DEFAULT_PAGE_SIZE,
+        ge=1,
+        le=MAX_PAGE_SIZE,
+        description="Maximum number of games per page.",
+    ),
+    after: Optional[str] = Query(
+        None,
+        description="Cursor of the next page, as returned in the `Link` header.",
+    ),
+    db: AsyncSession = Depends(get_async_db),
+) -> Response:
+    try:
+        if q is None and title_like is None:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail="A search needs `q` or `title~`",
+            )
+
+        catalog: CatalogState = await get_catalog_state(db)
+        cache_key: str = response_cache.make_key(
+            "/games/search",
+            q=q,
+            title_like=title_like,
+            threshold=threshold if title_like is not None else None,
+            limit=limit,
+            after=after,
+            catalog=catalog.version,
+        )
+        validators: dict[str, str] = catalog.headers(cache_key)
+        unchanged: Response | None = not_modified(request, validators)
+        if unchanged is not None:
+            return unchanged
+
+        cache_version: int = await response_cache.current_version()
+        cached: CachedResponse | None = await response_cache.get(
+            cache_key, cache_version
+        )
+        if cached is not None:
+            return _json_response(cached, validators)
+
+        # Rank the matching games, the most relevant first; with both searches a
+        # game must match both and their relevances add up
+        dialect: str = db.get_bind().dialect.name
+        conditions: list[tuple[ColumnElement[bool], ColumnElement[float]]] = []
+        if q is not None:
+            conditions.append(match_games(q, dialect))
+        if title_like is not None:
+            conditions.append(
+                fuzzy_match(Game.title, title_like, threshold, dialect, words=True),
+            )
+        match: ColumnElement[bool] = and_(*(condition for condition, _ in conditions))
+        rank: ColumnElement[float] = sum(
+            (rank for _, rank in conditions[1:]),
+            conditions[0][1],
+        )
+        query: Select = (
+            NORMALIZED_SOURCE.select()
+            .add_columns(rank.label("rank"))
+            .where(match)
+            .order_by(None)
+            .order_by(rank.desc(), Game.id)
+        )
+        rows: list[Row] = list(
+            (
+                await db.execute(paginate_by_rank(query, rank, Game.id, limit, after))
+            ).all(),
+        )
+
+        # The extra row fetched by paginate_by_rank tells us there is a next page
+        headers: dict[str, str] = {}
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_url: URL = request.url.include_query_params(
+                after=encode_rank_cursor(rows[-1].rank, rows[-1].id),
+                limit=limit,
+            )
+            headers["Link"] = f'<{next_url}>; rel="next"'
+
+        cached = CachedResponse(body=encode_games(rows), headers=headers)
+        await response_cache.set(cache_key, cache_version, cached)
+        return _json_response(cached, validators)
 
     except HTTPException as http_exc:
         logger.error(f"HTTP error occurred: {http_exc.detail}")
@@ -67,39 +574,78 @@ async def get_games(
 
 @router.get("/games/{developer}", response_model=list[GameSchema])
 async def get_games_by_developer(
+    request: Request,
     developer: str,
-    db: Session = Depends(get_db),
-) -> list[GameSchema]:
+    use_index: bool = Query(
+        True,
+        description="Set to false to bypass the in-memory catalog index and read from SQL (consistency checks).",
+    ),
+    db: AsyncSession = Depends(get_async_db),
+) -> Response:
     try:
-        # Query the developer from the database
-        game_dev: Developer | None = (
-            db.query(Developer).filter(Developer.name == developer).first()
+        # Serve the listing from the in-memory index, without any database round trip
+        listing: IndexListing | None = (
+            catalog_index.listing(GameFilters(developer=(developer,)))
+            if use_index
+            else None
         )
+        if listing is not None:
+            if listing.body == b"[]" and not catalog_index.has_developer(developer):
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="Developer not found",
+                )
 
-        # If developer not found, raise a 404 error
-        if not game_dev:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Developer not found",
+            cache_key: str = response_cache.make_key(
+                f"/games/{developer}",
+                catalog=catalog_index.version,
             )
+            validators: dict[str, str] = catalog_index.state.headers(cache_key)
+            unchanged: Response | None = not_modified(request, validators)
+            if unchanged is not None:
+                return unchanged
+            return _json_response(CachedResponse(listing.body), validators)
 
-        reponse: list[GameSchema] = [
-            GameSchema(
-                title=str(game.title),
-                genre=str(game.genre),
-                description=str(game.description),
-                platform=str(game.platform.name),
-                developer=str(game.developer.name),
-                publisher=str(game.publisher.name),
-                release_date=datetime.strptime(
-                    str(game.release_date),
-                    "%Y-%m-%d",
-                ),
-            )
-            for game in game_dev.games
-        ]
+        catalog: CatalogState = await get_catalog_state(db)
+        cache_key = response_cache.make_key(
+            f"/games/{developer}",
+            catalog=catalog.version,
+        )
+        validators = catalog.headers(cache_key)
+        unchanged = not_modified(request, validators)
+        if unchanged is not None:
+            return unchanged
 
-        return reponse
+        cache_version: int = await response_cache.current_version()
+        cached: CachedResponse | None = await response_cache.get(
+            cache_key, cache_version
+        )
+        if cached is not None:
+            return _json_response(cached, validators)
+
+        # Query the games of the developer, joined on the developer name
+        query, params = listing_statement(
+            game_source(),
+            GameFilters(developer=(developer,)),
+        )
+        rows: list[Row] = list((await db.execute(query, params)).all())
+
+        # Only an empty listing needs to tell an unknown developer apart
+        if not rows:
+            game_dev: int | None = (
+                await db.execute(developer_id_by_name(developer))
+            ).scalar_one_or_none()
+
+            # If developer not found, raise a 404 error
+            if game_dev is None:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="Developer not found",
+                )
+
+        cached = CachedResponse(body=encode_games(rows))
+        await response_cache.set(cache_key, cache_version, cached)
+        return _json_response(cached, validators)
 
     except HTTPException as http_exc:
         logger.error(f"HTTP error occurred: {http_exc.detail}")
@@ -121,98 +667,275 @@ async def get_games_by_developer(
 )
 async def create_game(
     game: GameSchema,
-    db: Session = Depends(get_db),
-) -> GameCreateResponse:
+    idempotency_key: Optional[str] = Header(
+        None,
+        alias=IDEMPOTENCY_KEY_HEADER,
+        max_length=MAX_IDEMPOTENCY_KEY_LENGTH,
+        description="Key chosen by the client, a retry with the same key gets the first response back.",
+    ),
+    db: AsyncSession = Depends(get_async_db),
+) -> GameCreateResponse | Response:
+    replay_key: str | None = None
     try:
-        # VALIDATION - Check if the game already exists
-        existing_game: Game | None = (
-            db.query(Game)
-            .filter(
-                Game.title == game.title,
+        # A retry of a handled request is answered from the store, without any query
+        fingerprint: str = ""
+        if idempotency_key is not None and idempotency_store.enabled:
+            fingerprint = idempotency_store.fingerprint(game.model_dump_json().encode())
+            replayed: Response | None = await idempotency_store.begin(
+                f"POST /game:{idempotency_key}",
+                fingerprint,
+            )
+            if replayed is not None:
+                return replayed
+            replay_key = f"POST /game:{idempotency_key}"
+
+        # In write-behind mode the game is queued, the writer commits it with others
+        if write_behind.enabled:
+            accepted: GameWriteSchema = write_behind.submit(game)
+            body: bytes = accepted.model_dump_json().encode()
+            if replay_key is not None:
+                await idempotency_store.record(
+                    replay_key,
+                    fingerprint,
+                    status.HTTP_202_ACCEPTED,
+                    body,
+                )
+            return Response(
+                content=body,
+                status_code=status.HTTP_202_ACCEPTED,
+                media_type="application/json",
+                headers={"Location": f"/game/writes/{accepted.id}"},
             )
-            .first()
+
+        # Create the game, its title being unique in the catalog
+        created: tuple[int, CatalogState] | None = await insert_game(db, game)
+        if created is None:
+            logger.debug(f"Game already exists: {game.title}")
+            detail: dict[str, str] = {
+                "message": f"A game with the same title {game.title} already exists.",
+            }
+            if replay_key is not None:
+                await idempotency_store.record(
+                    replay_key,
+                    fingerprint,
+                    status.HTTP_409_CONFLICT,
+                    orjson.dumps({"detail": detail}),
+                )
+            raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=detail)
+
+        game_id, catalog = created
+        await db.commit()
+        catalog_index.add(game_id, game, catalog)
+        await response_cache.invalidate()
+        logger.debug(f"Created new game: {game_id}")
+
+        response: GameCreateResponse = GameCreateResponse(
+            game=game,
         )
-        if existing_game:
-            logger.debug(f"Game already exists: {existing_game}")
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail={
-                    "message": f"A game with the same title {existing_game.title} already exists.",
-                },
+        if replay_key is not None:
+            await idempotency_store.record(
+                replay_key,
+                fingerprint,
+                status.HTTP_201_CREATED,
+                response.model_dump_json().encode(),
             )
+        return response
+
+    except HTTPException as http_exc:
+        await db.rollback()
+        logger.error(f"HTTP error occurred: {http_exc.detail}")
+        raise http_exc
 
-        # Check if platform already exists, if not create it.
-        platform: Platform | None = (
-            db.query(Platform).filter(Platform.name == game.platform).first()
+    except Exception as e:
+        await db.rollback()
+        logger.error(f"An error occurred: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=str(e),
         )
-        if not platform:
-            platform = Platform(name=game.platform)
-            db.add(platform)
-            db.flush()
-            logger.debug(f"Created new platform: {platform}")
-        else:
-            logger.debug(f"Found existing platform: {platform}")
 
-        # Check if publisher already exists, if not create it.
-        publisher: Publisher | None = (
-            db.query(Publisher)
-            .filter(
-                Publisher.name == game.publisher,
-            )
-            .first()
+    finally:
+        # Failed requests are not stored, their key can be retried
+        if replay_key is not None:
+            await idempotency_store.end(replay_key)
+
+
+@router.get(
+    "/game/writes/{write_id}",
+    response_model=GameWriteSchema,
+    responses=get_game_write_responses,
+)
+async def get_game_write(write_id: str) -> GameWriteSchema:
+    # The state of a game queued by `POST /game` in write-behind mode
+    write: GameWriteSchema | None = write_behind.status(write_id)
+    if write is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Write not found",
         )
-        if not publisher:
-            publisher = Publisher(name=game.publisher)
-            db.add(publisher)
-            db.flush()
-            logger.debug(f"Created new publisher: {publisher}")
+    return write
+
+
+@router.post(
+    "/games/bulk",
+    response_model=BulkGamesResponse,
+    responses=create_games_bulk_responses,
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {
+                    "schema": {
+                        "type": "array",
+                        "items": {"$ref": "#/components/schemas/GameSchema"},
+                        "maxItems": MAX_BULK_GAMES,
+                    },
+                },
+            },
+        },
+    },
+)
+async def create_games_bulk(
+    games: list[Any] = Body(..., min_length=1, max_length=MAX_BULK_GAMES),
+    db: AsyncSession = Depends(get_async_db),
+) -> BulkGamesResponse:
+    try:
+        # Each game is validated on its own, an invalid game does not reject the others
+        results: list[BulkGameResult] = []
+        valid: list[tuple[int, GameSchema]] = []
+        for index, item in enumerate(games):
+            try:
+                valid.append((index, GameSchema.model_validate(item)))
+            except ValidationError as e:
+                results.append(
+                    BulkGameResult(
+                        index=index,
+                        title=item.get("title") if isinstance(item, dict) else None,
+                        status=BulkGameStatus.ERROR,
+                        detail=validation_detail(e),
+                    ),
+                )
+
+        # Every valid game is written in a single transaction, stamped with
+        # its catalog version
+        ids: list[Optional[int]] = []
+        catalog: CatalogState = CatalogState()
+        if valid:
+            ids, catalog = await insert_games(db, [game for _, game in valid])
+        created: list[tuple[int, GameSchema]] = [
+            (game_id, game)
+            for game_id, (_, game) in zip(ids, valid)
+            if game_id is not None
+        ]
+        if created:
+            await db.commit()
+            catalog_index.add_all(created, catalog)
+            await response_cache.invalidate()
         else:
-            logger.debug(f"Found existing publisher: {publisher}")
+            await db.rollback()
 
-        # Check if developer already exists, if not create it.
-        developer: Developer | None = (
-            db.query(Developer)
-            .filter(
-                Developer.name == game.developer,
+        for game_id, (index, game) in zip(ids, valid):
+            results.append(
+                BulkGameResult(
+                    index=index,
+                    title=game.title,
+                    status=(
+                        BulkGameStatus.CREATED
+                        if game_id is not None
+                        else BulkGameStatus.CONFLICT
+                    ),
+                    detail=(
+                        None
+                        if game_id is not None
+                        else f"A game with the same title {game.title} already exists."
+                    ),
+                ),
             )
-            .first()
+        results.sort(key=lambda result: result.index)
+        logger.debug(f"Created {len(created)} of {len(games)} games")
+
+        return BulkGamesResponse(
+            created=len(created),
+            conflicts=sum(r.status == BulkGameStatus.CONFLICT for r in results),
+            errors=sum(r.status == BulkGameStatus.ERROR for r in results),
+            results=results,
         )
-        if not developer:
-            developer = Developer(name=game.developer)
-            db.add(developer)
-            db.flush()
-            logger.debug(f"Created new developer: {developer}")
-        else:
-            logger.debug(f"Found existing developer: {developer}")
 
-        # Create game
-        new_game: Game = Game(
-            title=game.title,
-            genre=game.genre,
-            description=game.description,
-            platform=platform,
-            publisher=publisher,
-            developer=developer,
-            release_date=game.release_date,
+    except HTTPException as http_exc:
+        await db.rollback()
+        logger.error(f"HTTP error occurred: {http_exc.detail}")
+        raise http_exc
+
+    except Exception as e:
+        await db.rollback()
+        logger.error(f"An error occurred: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=str(e),
         )
 
-        db.add(new_game)
-        db.commit()
-        db.refresh(new_game)
-        logger.debug(f"Created new game: {new_game}")
 
-        response: GameCreateResponse = GameCreateResponse(
-            game=game,
+@router.post(
+    "/games/ingest",
+    response_model=IngestGamesResponse,
+    responses=ingest_games_responses,
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                NDJSON_MEDIA_TYPE: {
+                    "schema": {"$ref": "#/components/schemas/GameSchema"},
+                },
+            },
+        },
+    },
+)
+async def ingest_games_ndjson(
+    request: Request,
+    db: AsyncSession = Depends(get_async_db),
+) -> IngestGamesResponse:
+    try:
+        # The body is read as it streams in, one game per line, gzip encoded or not
+        encoding: str = request.headers.get("content-encoding", "identity").lower()
+        if encoding not in ("identity", "gzip"):
+            raise HTTPException(
+                status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+                detail=f"Unsupported content encoding: {encoding}",
+            )
+
+        report: IngestReport = await ingest_games(
+            db,
+            ndjson_lines(request.stream(), gzipped=encoding == "gzip"),
+        )
+        # The catalog index is reloaded: the batches of an ingest may have
+        # moved the catalog version more than once
+        if report.created:
+            await db.commit()
+            if catalog_index.ready:
+                await catalog_index.load(db)
+            await response_cache.invalidate()
+        else:
+            await db.rollback()
+        logger.debug(f"Ingested {report.created} of {report.lines} games")
+
+        return IngestGamesResponse(
+            lines=report.lines,
+            created=report.created,
+            conflicts=report.conflicts,
+            errors=report.errors,
+            error_details=[
+                IngestLineError(line=line, detail=detail)
+                for line, detail in report.error_details
+            ],
         )
-        return response
 
     except HTTPException as http_exc:
-        db.rollback()
+        await db.rollback()
         logger.error(f"HTTP error occurred: {http_exc.detail}")
         raise http_exc
 
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         logger.error(f"An error occurred: {e}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
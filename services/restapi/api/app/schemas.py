@@ -1,7 +1,14 @@
-from datetime import date
+from datetime import date, datetime
+from enum import Enum
+from typing import Optional
 
 from pydantic import BaseModel, Field, field_validator
 
+# The longest values stored by the catalog columns (see `api.app.models`), so an
+# overlong game is rejected on validation instead of failing its write
+TITLE_MAX_LENGTH: int = 255
+NAME_MAX_LENGTH: int = 100
+
 
 class PlatformSchema(BaseModel):
     """
@@ -36,6 +43,20 @@ class DeveloperSchema(BaseModel):
     name: str = Field(description="The name of the developer.")
 
 
+class DeveloperMatchSchema(DeveloperSchema):
+    """
+    Schema representing a developer found by a fuzzy name search.
+
+    Attributes:
+        name (str): The name of the developer.\n
+        similarity (float): The trigram similarity with the searched name, from 0 to 1.\n
+    """
+
+    similarity: float = Field(
+        description="The trigram similarity with the searched name, from 0 to 1.",
+    )
+
+
 class GameSchema(BaseModel):
     """
     Schema representing the details of a game.
@@ -50,18 +71,27 @@ class GameSchema(BaseModel):
         developer (str): The name of the developer of the game.\n
     """
 
-    title: str = Field(description="The title of the game.")
-    genre: str = Field(description="The genre of the game.")
+    title: str = Field(
+        description="The title of the game.",
+        max_length=TITLE_MAX_LENGTH,
+    )
+    genre: str = Field(
+        description="The genre of the game.",
+        max_length=NAME_MAX_LENGTH,
+    )
     release_date: date = Field(description="The release date of the game.")
     description: str = Field(description="The description of th egame")
     platform: str = Field(
         description="The name of the platform on which the game is available.",
+        max_length=NAME_MAX_LENGTH,
     )
     publisher: str = Field(
         description="The name of the publisher of the game.",
+        max_length=NAME_MAX_LENGTH,
     )
     developer: str = Field(
         description="The name of the developer of the game.",
+        max_length=NAME_MAX_LENGTH,
     )
 
     @field_validator("release_date")
@@ -88,3 +118,212 @@ class GameSchema(BaseModel):
 class GameCreateResponse(BaseModel):
     message: str = "Game created successfully."
     game: GameSchema
+
+
+class FacetCountSchema(BaseModel):
+    """
+    Schema representing the number of games sharing a facet value.
+
+    Attributes:
+        value (str): The genre, platform or developer name.\n
+        count (int): The number of matching games with this value.\n
+    """
+
+    value: str = Field(description="The genre, platform or developer name.")
+    count: int = Field(description="The number of matching games with this value.")
+
+
+class YearCountSchema(BaseModel):
+    """
+    Schema representing the number of games released in a year.
+
+    Attributes:
+        value (int): The release year.\n
+        count (int): The number of matching games released this year.\n
+    """
+
+    value: int = Field(description="The release year.")
+    count: int = Field(
+        description="The number of matching games released this year.",
+    )
+
+
+class GameFacetsSchema(BaseModel):
+    """
+    Schema representing the counts of the matching games per facet.
+
+    Attributes:
+        total (int): The number of matching games.\n
+        genre (list[FacetCountSchema]): The counts per genre.\n
+        platform (list[FacetCountSchema]): The counts per platform.\n
+        developer (list[FacetCountSchema]): The counts per developer.\n
+        year (list[YearCountSchema]): The counts per release year.\n
+    """
+
+    total: int = Field(description="The number of matching games.")
+    genre: list[FacetCountSchema] = Field(
+        description="The counts per genre, the most frequent first.",
+    )
+    platform: list[FacetCountSchema] = Field(
+        description="The counts per platform, the most frequent first.",
+    )
+    developer: list[FacetCountSchema] = Field(
+        description="The counts per developer, the most frequent first.",
+    )
+    year: list[YearCountSchema] = Field(
+        description="The counts per release year, the most frequent first.",
+    )
+
+
+class GameChangeSchema(GameSchema):
+    """
+    Schema representing a game of the change feed.
+
+    Attributes:
+        id (int): The id of the game.\n
+        change_version (int): The catalog version of the last write of the game.\n
+        created_at (datetime): The time the game was created.\n
+        updated_at (datetime): The time the game was last written.\n
+    """
+
+    id: int = Field(description="The id of the game.")
+    change_version: int = Field(
+        description="The catalog version of the last write of the game.",
+    )
+    created_at: datetime = Field(description="The time the game was created.")
+    updated_at: datetime = Field(description="The time the game was last written.")
+
+
+class GameChangesResponse(BaseModel):
+    """
+    Schema representing a page of the change feed.
+
+    Attributes:
+        until (int): The catalog version the feed is read up to.\n
+        changes (list[GameChangeSchema]): The games written in the page, in write order.\n
+    """
+
+    until: int = Field(
+        description="The catalog version the feed is read up to, the `since` of the next poll.",
+    )
+    changes: list[GameChangeSchema] = Field(
+        description="The games written after `since`, in write order.",
+    )
+
+
+class BulkGameStatus(str, Enum):
+    """
+    Outcome of one game of a bulk creation.
+    """
+
+    CREATED = "created"
+    CONFLICT = "conflict"
+    ERROR = "error"
+
+
+class BulkGameResult(BaseModel):
+    """
+    Schema representing the outcome of one game of a bulk creation.
+
+    Attributes:
+        index (int): The position of the game in the request.\n
+        title (Optional[str]): The title of the game, when it could be read.\n
+        status (BulkGameStatus): Whether the game was created, conflicted or was invalid.\n
+        detail (Optional[str]): Why the game was not created.\n
+    """
+
+    index: int = Field(description="The position of the game in the request.")
+    title: Optional[str] = Field(
+        None,
+        description="The title of the game, when it could be read.",
+    )
+    status: BulkGameStatus = Field(description="The outcome of the game.")
+    detail: Optional[str] = Field(None, description="Why the game was not created.")
+
+
+class BulkGamesResponse(BaseModel):
+    """
+    Schema representing the outcome of a bulk creation.
+
+    Attributes:
+        created (int): The number of created games.\n
+        conflicts (int): The number of games whose title already exists.\n
+        errors (int): The number of invalid games.\n
+        results (list[BulkGameResult]): The outcome of each game, in the request order.\n
+    """
+
+    created: int = Field(description="The number of created games.")
+    conflicts: int = Field(
+        description="The number of games whose title already exists."
+    )
+    errors: int = Field(description="The number of invalid games.")
+    results: list[BulkGameResult] = Field(
+        description="The outcome of each game, in the request order.",
+    )
+
+
+class IngestLineError(BaseModel):
+    """
+    Schema representing an invalid line of an ingest.
+
+    Attributes:
+        line (int): The line number in the body, starting at 1.\n
+        detail (str): Why the line was rejected.\n
+    """
+
+    line: int = Field(description="The line number in the body, starting at 1.")
+    detail: str = Field(description="Why the line was rejected.")
+
+
+class IngestGamesResponse(BaseModel):
+    """
+    Schema representing the outcome of an ingest.
+
+    Attributes:
+        lines (int): The number of non-blank lines read.\n
+        created (int): The number of created games.\n
+        conflicts (int): The number of games whose title already exists.\n
+        errors (int): The number of invalid lines.\n
+        error_details (list[IngestLineError]): The first invalid lines, in the body order.\n
+    """
+
+    lines: int = Field(description="The number of non-blank lines read.")
+    created: int = Field(description="The number of created games.")
+    conflicts: int = Field(
+        description="The number of games whose title already exists, in the catalog or on an earlier line."
+    )
+    errors: int = Field(description="The number of invalid lines.")
+    error_details: list[IngestLineError] = Field(
+        description="The first invalid lines, in the body order.",
+    )
+
+
+class GameWriteStatus(str, Enum):
+    """
+    State of a game queued by the write-behind mode of `POST /game`.
+    """
+
+    PENDING = "pending"
+    CREATED = "created"
+    CONFLICT = "conflict"
+    FAILED = "failed"
+
+
+class GameWriteSchema(BaseModel):
+    """
+    Schema representing a game queued by the write-behind mode of `POST /game`.
+
+    Attributes:
+        id (str): The handle of the write, to read its status from `/game/writes/{id}`.\n
+        title (str): The title of the game.\n
+        status (GameWriteStatus): Whether the game is waiting, was created, conflicted or failed.\n
+        detail (Optional[str]): Why the game was not created.\n
+    """
+
+    id: str = Field(description="The handle of the write.")
+    title: str = Field(description="The title of the game.")
+    status: GameWriteStatus = Field(description="The state of the write.")
+    detail: Optional[str] = Field(
+        default=None,
+        description="Why the game was not created.",
+    )
@@ -0,0 +1,55 @@
+from api.app.models import GAME_SEARCH_CONFIG, Game
+from sqlalchemy import ColumnElement, and_, case, func, literal
+
+# Maximum length of a search query
+MAX_QUERY_LENGTH: int = 200
+
+
+def match_games(
+    q: str,
+    dialect: str,
+) -> tuple[ColumnElement[bool], ColumnElement[float]]:
+    """
+    Build the match condition and the relevance of a game search.
+
+    On PostgreSQL the query is parsed with `websearch_to_tsquery` (quoted phrases,
+    `or`, `-word`) and matched against the GIN indexed `game.search_vector`,
+    ranked with `ts_rank` (title words weigh more than description words).
+    Other databases fall back to a case-insensitive substring match of every
+    word, ranked by the number of words found in the title.
+
+    Args:
+        q (str): The search query.
+        dialect (str): The name of the database dialect.
+
+    Returns:
+        tuple[ColumnElement[bool], ColumnElement[float]]: The condition selecting
+        the matching games and their relevance, higher is better.
+    """
+    if dialect == "postgresql":
+        tsquery = func.websearch_to_tsquery(GAME_SEARCH_CONFIG, q)
+        return (
+            Game.search_vector.bool_op("@@")(tsquery),
+            func.ts_rank(Game.search_vector, tsquery),
+        )
+
+    words: list[str] = q.lower().split()
+    in_title: list[ColumnElement[bool]] = [
+        func.lower(Game.title).contains(word, autoescape=True) for word in words
+    ]
+    in_description: list[ColumnElement[bool]] = [
+        func.lower(Game.description).contains(word, autoescape=True) for word in words
+    ]
+    rank: ColumnElement[float] = sum(
+        (case((title, 1.0), else_=0.0) for title in in_title),
+        literal(0.0),
+    )
+    return (
+        and_(
+            *(
+                title | description
+                for title, description in zip(in_title, in_description)
+            )
+        ),
+        rank,
+    )
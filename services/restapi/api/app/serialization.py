@@ -0,0 +1,74 @@
+from typing import Any, Iterable, Sequence
+
+import orjson
+from api.app.queries import GAME_FIELDS
+from sqlalchemy import Row
+
+
+def _positions(row: Row, fields: Sequence[str]) -> list[int]:
+    names: tuple[str, ...] = tuple(row._fields)
+    return [names.index(name) for name in fields]
+
+
+def game_dicts(
+    rows: Iterable[Row],
+    fields: Sequence[str] = GAME_FIELDS,
+) -> list[dict[str, Any]]:
+    """
+    Turn listing rows into plain dicts holding the requested fields.
+
+    The column positions are resolved once from the first row, each row is
+    then read by index: no mapping view nor model is built per row.
+
+    Args:
+        rows (Iterable[Row]): Rows of a `GameSource.select` statement.
+        fields (Sequence[str]): The fields to keep, in output order.
+
+    Returns:
+        list[dict[str, Any]]: One dict per row.
+    """
+    games: list[dict[str, Any]] = []
+    positions: list[int] | None = None
+    for row in rows:
+        if positions is None:
+            positions = _positions(row, fields)
+        games.append({name: row[i] for name, i in zip(fields, positions)})
+    return games
+
+
+def encode_games(rows: Iterable[Row], fields: Sequence[str] = GAME_FIELDS) -> bytes:
+    """
+    Encode listing rows straight to a JSON array.
+
+    The rows come from SQL and the catalog is validated on write, so they are
+    not validated again through `GameSchema`: the bytes are the ones
+    `GameSchema` would produce (same keys and order, ISO dates), built by orjson.
+
+    Args:
+        rows (Iterable[Row]): Rows of a `GameSource.select` statement.
+        fields (Sequence[str]): The fields of each game, in output order.
+
+    Returns:
+        bytes: The JSON array of the games.
+    """
+    return orjson.dumps(game_dicts(rows, fields))
+
+
+def encode_game_lines(
+    rows: Iterable[Row],
+    fields: Sequence[str] = GAME_FIELDS,
+) -> bytes:
+    """
+    Encode listing rows as newline delimited JSON, one game per line.
+
+    Args:
+        rows (Iterable[Row]): Rows of a `GameSource.select` statement.
+        fields (Sequence[str]): The fields of each game, in output order.
+
+    Returns:
+        bytes: The NDJSON chunk.
+    """
+    return b"".join(
+        orjson.dumps(game, option=orjson.OPT_APPEND_NEWLINE)
+        for game in game_dicts(rows, fields)
+    )
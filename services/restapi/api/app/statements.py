@@ -0,0 +1,210 @@
+import math
+from typing import Any, Optional, Sequence
+
+from api.app.cache import TTLCache
+from api.app.models import Developer, Game
+from api.app.pagination import decode_change_cursor, page_params, paginate
+from api.app.queries import NORMALIZED_SOURCE, GameFilters, GameSource, filter_games
+from sqlalchemy import Engine, Select, bindparam, event, lambda_stmt, select, tuple_
+from sqlalchemy.engine.default import CacheStats
+from sqlalchemy.sql.lambdas import StatementLambdaElement
+
+# Number of listing statements kept, one per shape (source, fields, filters, page)
+LISTING_STATEMENTS_SIZE: int = 256
+
+
+class CompiledCacheStats:
+    """
+    Counters of the SQLAlchemy compiled cache, updated by every statement
+    executed on the engines it watches.
+
+    Attributes:
+        hits (int): Executions whose SQL was found compiled in the engine cache.
+        misses (int): Executions whose SQL had to be compiled and cached.
+        uncached (int): Executions without a cache key (raw SQL, DDL, uncacheable constructs).
+    """
+
+    def __init__(self):
+        self.hits: int = 0
+        self.misses: int = 0
+        self.uncached: int = 0
+
+    def record(self, cache_hit: CacheStats) -> None:
+        """
+        Count an execution.
+
+        Args:
+            cache_hit (CacheStats): The cache outcome of the execution context.
+        """
+        if cache_hit is CacheStats.CACHE_HIT:
+            self.hits += 1
+        elif cache_hit is CacheStats.CACHE_MISS:
+            self.misses += 1
+        else:
+            self.uncached += 1
+
+    def _count(
+        self,
+        conn: Any,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: Any,
+        executemany: bool,
+    ) -> None:
+        if context is not None:
+            self.record(context.cache_hit)
+
+    def watch(self, engine: Engine) -> None:
+        """
+        Count the statements executed on an engine.
+
+        Args:
+            engine (Engine): The engine, the `sync_engine` of an async engine.
+        """
+        event.listen(engine, "before_cursor_execute", self._count)
+
+
+compiled_cache_stats: CompiledCacheStats = CompiledCacheStats()
+
+# The games written after a catalog version and up to another one, in write
+# order, read through the (change_version, id) index. The first page starts
+# after (since, 0): the games are stamped with a version above `since`.
+CHANGES_STATEMENT: Select = (
+    NORMALIZED_SOURCE.select()
+    .add_columns(Game.change_version, Game.created_at, Game.updated_at)
+    .where(
+        Game.change_version > bindparam("since"),
+        Game.change_version <= bindparam("until"),
+        tuple_(Game.change_version, Game.id)
+        > tuple_(bindparam("after_version"), bindparam("after_id")),
+    )
+    .order_by(None)
+    .order_by(Game.change_version, Game.id)
+    .limit(bindparam("limit"))
+)
+
+# The built listing statements, executed again with the values of each request.
+# A statement never goes stale, so entries only leave the cache when evicted.
+listing_statements: TTLCache[Select] = TTLCache(
+    max_entries=LISTING_STATEMENTS_SIZE,
+    ttl_seconds=math.inf,
+)
+
+
+def statement_stats() -> dict[str, int]:
+    """
+    Get the reuse counters of the statements, as exposed on `/metrics`.
+
+    Returns:
+        dict[str, int]: The hits and misses of the compiled cache and of the
+        listing statement cache.
+    """
+    return {
+        "compiled_hits": compiled_cache_stats.hits,
+        "compiled_misses": compiled_cache_stats.misses,
+        "compiled_uncached": compiled_cache_stats.uncached,
+        "listing_hits": listing_statements.hits,
+        "listing_misses": listing_statements.misses,
+        "listing_size": len(listing_statements),
+    }
+
+
+def listing_statement(
+    source: GameSource,
+    filters: GameFilters,
+    fields: Optional[Sequence[str]] = None,
+    limit: Optional[int] = None,
+    after: Optional[str] = None,
+) -> tuple[Select, dict[str, Any]]:
+    """
+    Get the game listing statement for a shape of request, built once and reused.
+
+    Requests differing only by their values (the filtered names, the cursor)
+    share the same statement object, so neither the statement nor its cache
+    key are built again, and its SQL is always found in the compiled cache.
+
+    Args:
+        source (GameSource): The source the listing is served from.
+        filters (GameFilters): The filters of the listing.
+        fields (Optional[Sequence[str]]): The fields to project, None for all of them.
+        limit (Optional[int]): The page size, None for an unpaginated listing.
+        after (Optional[str]): The cursor of the page.
+
+    Raises:
+        HTTPException: 400 if the cursor is malformed.
+
+    Returns:
+        tuple[Select, dict[str, Any]]: The statement and the values of its bind parameters.
+    """
+    params: dict[str, Any] = filters.bind_params()
+    page: dict[str, Any] = {} if limit is None else page_params(limit, after)
+    params.update(page)
+
+    shape: str = ",".join(
+        f"{name}[]" if isinstance(value, list) else name
+        for name, value in params.items()
+    )
+    projection: str = "*" if fields is None else ",".join(fields)
+    key: str = f"{source.id.table.name}:{projection}:{shape}"
+    query: Select | None = listing_statements.get(key)
+    if query is None:
+        query = filter_games(
+            source.select(fields, filtered_on=filters.values()),
+            source,
+            filters,
+        )
+        if page:
+            query = paginate(query, source, page)
+        listing_statements.set(key, query)
+    return query, params
+
+
+def changes_params(
+    since: Optional[int],
+    until: int,
+    limit: int,
+    after: Optional[str],
+) -> tuple[int, dict[str, Any]]:
+    """
+    Get the values of the bind parameters of `CHANGES_STATEMENT`.
+
+    Args:
+        since (Optional[int]): The catalog version the client is up to date
+            with, None to read the whole catalog.
+        until (int): The current catalog version, ignored after the first page.
+        limit (int): The number of games in the page.
+        after (Optional[str]): The cursor returned with the previous page.
+
+    Raises:
+        HTTPException: 400 if the cursor is malformed.
+
+    Returns:
+        tuple[int, dict[str, Any]]: The catalog version the feed is read up to
+        (the one of the cursor after the first page), and the parameters.
+    """
+    # Games written before the change tracking are stamped with version 0
+    lower: int = -1 if since is None else since
+    after_version, after_id = lower, 0
+    if after:
+        until, after_version, after_id = decode_change_cursor(after)
+    return until, {
+        "since": lower,
+        "until": until,
+        "after_version": after_version,
+        "after_id": after_id,
+        "limit": limit + 1,
+    }
+
+
+def developer_id_by_name(name: str) -> StatementLambdaElement:
+    """
+    Build the lookup of the id of a developer by name.
+
+    Args:
+        name (str): The name of the developer.
+
+    Returns:
+        StatementLambdaElement: The cached statement selecting the developer id.
+    """
+    return lambda_stmt(lambda: select(Developer.id).where(Developer.name == name))
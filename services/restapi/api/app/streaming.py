@@ -0,0 +1,71 @@
+import logging
+from typing import Any, AsyncIterator, Optional
+
+from api.app.queries import GAME_FIELDS
+from api.app.serialization import encode_game_lines
+from sqlalchemy import Select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+NDJSON_MEDIA_TYPE: str = "application/x-ndjson"
+
+# Number of rows fetched from the server-side cursor and written per chunk
+STREAM_BATCH_SIZE: int = 1000
+
+
+def wants_ndjson(accept: str | None) -> bool:
+    """
+    Check whether the client negotiated a newline delimited JSON response.
+
+    Args:
+        accept (str | None): The value of the `Accept` request header.
+
+    Returns:
+        bool: True if `application/x-ndjson` is one of the accepted media types.
+    """
+    if not accept:
+        return False
+    return any(
+        media_range.split(";")[0].strip() == NDJSON_MEDIA_TYPE
+        for media_range in accept.split(",")
+    )
+
+
+async def stream_games(
+    session_factory: async_sessionmaker[AsyncSession],
+    query: Select,
+    params: dict[str, Any],
+    fields: Optional[tuple[str, ...]] = None,
+) -> AsyncIterator[bytes]:
+    """
+    Stream the games matched by `query` as newline delimited JSON chunks.
+
+    Rows are read through a server-side cursor (`yield_per`), so only one batch
+    is held in memory at a time and the first chunk is sent as soon as the
+    first batch arrives, no matter how large the catalog is.
+
+    The session is owned by the generator because the request scoped session
+    is closed before the response body is sent.
+
+    Args:
+        session_factory (async_sessionmaker[AsyncSession]): Factory used to open the streaming session.
+        query (Select): The filtered game statement.
+        params (dict[str, Any]): The values of its bind parameters.
+        fields (Optional[tuple[str, ...]]): The fields of each game, None for a whole `GameSchema`.
+
+    Yields:
+        bytes: One chunk of NDJSON encoded games per batch.
+    """
+    async with session_factory() as session:
+        try:
+            result = await session.stream(
+                query,
+                params,
+                execution_options={"yield_per": STREAM_BATCH_SIZE},
+            )
+            async for partition in result.partitions():
+                yield encode_game_lines(partition, fields or GAME_FIELDS)
+        except Exception as e:
+            logger.error(f"Error while streaming games: {e}")
+            raise e
@@ -0,0 +1,259 @@
+import asyncio
+import logging
+import time
+import uuid
+from typing import Any, Optional
+
+from api.app.bulk import insert_games
+from api.app.cache import TTLCache, response_cache
+from api.app.catalog import CatalogState
+from api.app.catalog_index import catalog_index
+from api.app.config import WriteBehindConfig
+from api.app.schemas import GameSchema, GameWriteSchema, GameWriteStatus
+from api.settings import config
+from fastapi import HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+class WriteBehindQueue:
+    """
+    The bounded queue of the games accepted by `POST /game` in write-behind mode.
+
+    A background writer drains the queue in batches of up to `batch_size`
+    games, waiting at most `max_linger_seconds` to fill a batch, and commits
+    each batch in a single transaction: under a burst, many games share one
+    commit (and one fsync) instead of paying one each. A batch that fails is
+    written again one game per transaction, so only the games that cannot be
+    written are failed. The status of every write is kept for
+    `status_ttl_seconds`, in the process: the mode needs a single worker
+    (see `APIConfig`).
+    """
+
+    def __init__(self, write_behind_config: WriteBehindConfig):
+        self.enabled: bool = write_behind_config.enabled
+        self.batch_size: int = write_behind_config.batch_size
+        self.max_linger_seconds: float = write_behind_config.max_linger_seconds
+        self._queue: asyncio.Queue[GameWriteSchema] = asyncio.Queue(
+            maxsize=write_behind_config.queue_size,
+        )
+        self._games: dict[str, GameSchema] = {}
+        self.statuses: TTLCache[GameWriteSchema] = TTLCache(
+            max_entries=write_behind_config.status_max_entries,
+            ttl_seconds=write_behind_config.status_ttl_seconds,
+        )
+        self.accepting: bool = True
+        self.rejected: int = 0
+        self.batches: int = 0
+        self.written: int = 0
+        self.failed: int = 0
+        self.last_commit_ms: float = 0.0
+        self.max_commit_ms: float = 0.0
+        self._total_commit_ms: float = 0.0
+
+    def submit(self, game: GameSchema) -> GameWriteSchema:
+        """
+        Queue a validated game for the background writer.
+
+        `GameSchema` bounds the values to the length of their columns, so an
+        overlong game is answered with 422 before it is ever queued.
+
+        Args:
+            game (GameSchema): The game to create.
+
+        Raises:
+            HTTPException: 503 if the queue is full or the API is shutting down.
+
+        Returns:
+            GameWriteSchema: The pending write, with its handle.
+        """
+        write: GameWriteSchema = GameWriteSchema(
+            id=uuid.uuid4().hex,
+            title=game.title,
+            status=GameWriteStatus.PENDING,
+        )
+        try:
+            if not self.accepting:
+                raise asyncio.QueueFull
+            self._queue.put_nowait(write)
+        except asyncio.QueueFull:
+            self.rejected += 1
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="The write queue is full, retry later.",
+                headers={"Retry-After": "1"},
+            )
+        self._games[write.id] = game
+        self.statuses.set(write.id, write)
+        return write
+
+    def status(self, write_id: str) -> Optional[GameWriteSchema]:
+        """
+        Get the state of a write.
+
+        Args:
+            write_id (str): The handle returned by `submit`.
+
+        Returns:
+            Optional[GameWriteSchema]: The write, or None if unknown or expired.
+        """
+        return self.statuses.get(write_id)
+
+    def _take(self, limit: int) -> list[GameWriteSchema]:
+        batch: list[GameWriteSchema] = []
+        while len(batch) < limit and not self._queue.empty():
+            batch.append(self._queue.get_nowait())
+        return batch
+
+    async def _commit(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        games: list[GameSchema],
+    ) -> list[Optional[int]]:
+        # The games are written in one transaction, rolled back if none is created
+        async with session_factory() as db:
+            ids: list[Optional[int]]
+            catalog: CatalogState
+            ids, catalog = await insert_games(db, games)
+            created: list[tuple[int, GameSchema]] = [
+                (game_id, game)
+                for game_id, game in zip(ids, games)
+                if game_id is not None
+            ]
+            if created:
+                await db.commit()
+                catalog_index.add_all(created, catalog)
+                await response_cache.invalidate()
+            else:
+                await db.rollback()
+        return ids
+
+    async def _commit_each(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        games: list[GameSchema],
+    ) -> list[Optional[int] | Exception]:
+        # One transaction per game, so a game that cannot be written only fails itself
+        outcomes: list[Optional[int] | Exception] = []
+        for game in games:
+            try:
+                outcomes.extend(await self._commit(session_factory, [game]))
+            except Exception as e:
+                logger.error(f"Error while writing the queued game {game.title}: {e}")
+                outcomes.append(e)
+        return outcomes
+
+    async def _write(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        batch: list[GameWriteSchema],
+    ) -> None:
+        games: list[GameSchema] = [self._games.pop(write.id) for write in batch]
+        start: float = time.perf_counter()
+        outcomes: list[Optional[int] | Exception]
+        try:
+            try:
+                outcomes = list(await self._commit(session_factory, games))
+            except Exception as e:
+                logger.error(f"Error while writing {len(batch)} queued games: {e}")
+                outcomes = (
+                    await self._commit_each(session_factory, games)
+                    if len(games) > 1
+                    else [e]
+                )
+        finally:
+            for _ in batch:
+                self._queue.task_done()
+
+        elapsed_ms: float = (time.perf_counter() - start) * 1000
+        self.batches += 1
+        self.last_commit_ms = elapsed_ms
+        self.max_commit_ms = max(self.max_commit_ms, elapsed_ms)
+        self._total_commit_ms += elapsed_ms
+        for write, outcome in zip(batch, outcomes):
+            update: dict[str, Any]
+            if isinstance(outcome, Exception):
+                self.failed += 1
+                update = {"status": GameWriteStatus.FAILED, "detail": str(outcome)}
+            elif outcome is None:
+                update = {
+                    "status": GameWriteStatus.CONFLICT,
+                    "detail": f"A game with the same title {write.title} already exists.",
+                }
+            else:
+                self.written += 1
+                update = {"status": GameWriteStatus.CREATED}
+            self.statuses.set(write.id, write.model_copy(update=update))
+        logger.debug(f"Wrote {len(batch)} queued games")
+
+    async def flush(self, session_factory: async_sessionmaker[AsyncSession]) -> None:
+        """
+        Write every queued game now, in batches of up to `batch_size`.
+
+        Args:
+            session_factory (async_sessionmaker[AsyncSession]): Factory of the write sessions.
+        """
+        while batch := self._take(self.batch_size):
+            await self._write(session_factory, batch)
+
+    async def run_forever(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+    ) -> None:
+        """
+        Drain the queue as games arrive, lingering to fill each batch.
+
+        Args:
+            session_factory (async_sessionmaker[AsyncSession]): Factory of the write sessions.
+        """
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        while True:
+            batch: list[GameWriteSchema] = [await self._queue.get()]
+            deadline: float = loop.time() + self.max_linger_seconds
+            while len(batch) < self.batch_size:
+                batch.extend(self._take(self.batch_size - len(batch)))
+                remaining: float = deadline - loop.time()
+                if len(batch) >= self.batch_size or remaining <= 0:
+                    break
+                try:
+                    batch.append(
+                        await asyncio.wait_for(self._queue.get(), remaining),
+                    )
+                except asyncio.TimeoutError:
+                    break
+            await self._write(session_factory, batch)
+
+    async def stop(self, writer: asyncio.Task) -> None:
+        """
+        Stop accepting games, wait for the queued ones to be written, then stop the writer.
+
+        Args:
+            writer (asyncio.Task): The task running `run_forever`.
+        """
+        self.accepting = False
+        await self._queue.join()
+        writer.cancel()
+
+    def stats(self) -> dict[str, int | float | bool]:
+        """
+        Get the queue counters.
+
+        Returns:
+            dict[str, int | float | bool]: Queue depth, batch and commit latency counters.
+        """
+        return {
+            "enabled": self.enabled,
+            "depth": self._queue.qsize(),
+            "capacity": self._queue.maxsize,
+            "rejected": self.rejected,
+            "batches": self.batches,
+            "written": self.written,
+            "failed": self.failed,
+            "last_commit_ms": round(self.last_commit_ms, 3),
+            "max_commit_ms": round(self.max_commit_ms, 3),
+            "avg_commit_ms": round(self._total_commit_ms / max(self.batches, 1), 3),
+        }
+
+
+write_behind: WriteBehindQueue = WriteBehindQueue(config.api.write_behind)
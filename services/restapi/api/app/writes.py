@@ -0,0 +1,183 @@
+from datetime import datetime, timezone
+from typing import Optional
+
+from api.app.catalog import CatalogState, bump_catalog_version, catalog_bump_statement
+from api.app.dimensions import (
+    DimensionModel,
+    dialect_insert,
+    dimension_ids,
+    resolve_dimension,
+)
+from api.app.models import Developer, Game, Platform, Publisher
+from api.app.schemas import GameSchema
+from sqlalchemy import (
+    CTE,
+    Row,
+    Select,
+    func,
+    select,
+    true,
+    update,
+)
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+# The names a game references, by field of `GameSchema`
+_DIMENSIONS: tuple[tuple[str, DimensionModel], ...] = (
+    ("platform", Platform),
+    ("publisher", Publisher),
+    ("developer", Developer),
+)
+
+
+def create_game_statement(
+    game: GameSchema,
+    now: datetime,
+    names: dict[str, int],
+) -> Select:
+    """
+    Build the single PostgreSQL statement creating a game.
+
+    The catalog watermark is bumped and the game inserted with
+    `ON CONFLICT (title) DO NOTHING`, stamped with the new catalog version,
+    through a data-modifying CTE: the write is one round trip, and the unique
+    title index settles concurrent creations of the same title. The insert
+    reads the new version, so the watermark row is always locked before the
+    title. The names are resolved beforehand, by their own statements: the
+    order in which PostgreSQL runs the CTEs of a statement is not defined,
+    and every writer must lock the names before the watermark row. The
+    watermark is bumped even on a conflict, the caller rolls it back.
+
+    Args:
+        game (GameSchema): The game to create.
+        now (datetime): The time of the write.
+        names (dict[str, int]): The id of the platform, publisher and
+            developer of the game, by field of `GameSchema`.
+
+    Returns:
+        Select: A statement returning the id of the game and the new catalog
+        version (NULL if the watermark row does not exist yet), or no row when
+        the title already exists.
+    """
+    bumped: CTE = catalog_bump_statement(now).cte("catalog_bumped")
+    created: CTE = (
+        dialect_insert(Game, "postgresql")
+        .values(
+            title=game.title,
+            genre=game.genre,
+            description=game.description,
+            release_date=game.release_date,
+            **{f"{field}_id": names[field] for field, _ in _DIMENSIONS},
+            # 0 if the watermark row does not exist yet
+            change_version=func.coalesce(select(bumped.c.version).scalar_subquery(), 0),
+        )
+        .on_conflict_do_nothing(index_elements=[Game.title])
+        .returning(Game.id)
+        .cte("game_created")
+    )
+    return select(created.c.id, bumped.c.version).select_from(
+        created.outerjoin(bumped, true()),
+    )
+
+
+async def _resolve_names(db: AsyncSession, game: GameSchema) -> dict[str, int]:
+    # The names missing from `dimension_ids` are upserted in the order of the
+    # other writers: platforms, publishers, then developers
+    names: dict[str, int] = {}
+    for field, model in _DIMENSIONS:
+        name: str = getattr(game, field)
+        names[field] = (await resolve_dimension(db, model, [name]))[name]
+    return names
+
+
+async def _insert_game_postgresql(
+    db: AsyncSession,
+    game: GameSchema,
+) -> Optional[tuple[int, CatalogState]]:
+    now: datetime = datetime.now(timezone.utc)
+    try:
+        row: Row | None = (
+            await db.execute(
+                create_game_statement(game, now, await _resolve_names(db, game)),
+            )
+        ).first()
+    except IntegrityError:
+        # A cached name id may have gone stale: the ids are dropped and the
+        # names resolved again. A write failing again is reported as a
+        # conflict, the caller rolls it back.
+        await db.rollback()
+        dimension_ids.clear()
+        try:
+            row = (
+                await db.execute(
+                    create_game_statement(game, now, await _resolve_names(db, game)),
+                )
+            ).first()
+        except IntegrityError:
+            return None
+
+    if row is None:
+        return None
+    if row.version is None:
+        # The first write creates the watermark row, then stamps the game
+        catalog: CatalogState = await bump_catalog_version(db)
+        await db.execute(
+            update(Game)
+            .where(Game.id == row.id)
+            .values(change_version=catalog.version),
+        )
+        return row.id, catalog
+    return row.id, CatalogState(version=row.version, updated_at=now)
+
+
+async def insert_game(
+    db: AsyncSession,
+    game: GameSchema,
+) -> Optional[tuple[int, CatalogState]]:
+    """
+    Create a game in the current transaction, without committing it.
+
+    The catalog watermark is bumped before the game is written, so the lock
+    on its row orders the commits of the writers by catalog version.
+
+    The names are resolved first with `resolve_dimension`, then the watermark
+    is bumped and the game inserted, like every other write. On PostgreSQL
+    the bump and the insert are the single statement of
+    `create_game_statement`. Other databases (SQLite in the tests) run them
+    one after the other, with the same `ON CONFLICT (title) DO NOTHING`.
+    Either way, names found in `dimension_ids` are not looked up.
+
+    Args:
+        db (AsyncSession): The session of the write transaction.
+        game (GameSchema): The validated game.
+
+    Returns:
+        Optional[tuple[int, CatalogState]]: The id of the game and the catalog
+        version set by the write, None if a game with the same title exists
+        (the transaction must then be rolled back).
+    """
+    dialect: str = db.get_bind().dialect.name
+    if dialect == "postgresql":
+        return await _insert_game_postgresql(db, game)
+
+    names: dict[str, int] = await _resolve_names(db, game)
+    catalog: CatalogState = await bump_catalog_version(db)
+    game_id: int | None = (
+        await db.execute(
+            dialect_insert(Game, dialect)
+            .values(
+                title=game.title,
+                genre=game.genre,
+                description=game.description,
+                release_date=game.release_date,
+                **{f"{field}_id": names[field] for field, _ in _DIMENSIONS},
+                change_version=catalog.version,
+            )
+            .on_conflict_do_nothing(index_elements=[Game.title])
+            .returning(Game.id),
+        )
+    ).scalar_one_or_none()
+    if game_id is None:
+        return None
+    return game_id, catalog
@@ -1,9 +1,18 @@
-from pydantic import BaseModel, SecretStr
+from pydantic import BaseModel, Field, SecretStr
+
+# Similarity the pg_trgm operators are set to on every connection (see `api.database.db`),
+# so the trigram indexes return every candidate a lower bound than this could select
+TRIGRAM_INDEX_THRESHOLD: float = 0.2
 
 
 class PostgresqlDBConfig(BaseModel):
     """
     Configuration for MongoDB connection.
+
+    Attributes:
+        pool_size (int): The connections kept open by the whole API, split between its workers.
+        max_overflow (int): The extra connections the whole API may open under load,
+            split between its workers.
     """
 
     username: str
@@ -11,6 +20,21 @@ class PostgresqlDBConfig(BaseModel):
     host: str
     port: int
     database: str
+    pool_size: int = Field(100, ge=1)
+    max_overflow: int = Field(10, ge=0)
+
+    def worker_pool(self, workers: int) -> tuple[int, int]:
+        """
+        Split the connection budget between the worker processes, each one
+        having its own pool.
+
+        Args:
+            workers (int): The number of worker processes.
+
+        Returns:
+            tuple[int, int]: The pool size (at least 1) and the max overflow of one worker.
+        """
+        return max(1, self.pool_size // workers), self.max_overflow // workers
 
     def get_url(self) -> str:
         """
@@ -20,3 +44,12 @@ class PostgresqlDBConfig(BaseModel):
             str: The Postgresql connection URL.
         """
         return f"postgresql://{self.username}:{self.password.get_secret_value()}@{self.host}:{self.port}/{self.database}"
+
+    def get_async_url(self) -> str:
+        """
+        Generate Postgresql connection URL for the asyncio (asyncpg) driver.
+
+        Returns:
+            str: The asyncpg Postgresql connection URL.
+        """
+        return f"postgresql+asyncpg://{self.username}:{self.password.get_secret_value()}@{self.host}:{self.port}/{self.database}"
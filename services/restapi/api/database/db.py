@@ -1,11 +1,18 @@
 import logging
 import time
-from contextlib import contextmanager
-from typing import Any, Generator
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, AsyncGenerator, Generator
 
+from api.database.config import TRIGRAM_INDEX_THRESHOLD
 from api.settings import config
 from sqlalchemy import create_engine
 from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import Session, declarative_base, sessionmaker
 
 log: logging.Logger = logging.getLogger(__name__)
@@ -13,12 +20,16 @@ log: logging.Logger = logging.getLogger(__name__)
 # Base class for declarative class definitions
 Base = declarative_base()
 
-# Create an engine instance
+# Every worker process has its own pool, sized so all workers stay within the budget
+_pool_size, _max_overflow = config.db.worker_pool(config.api.server.worker_count())
+
+# Create an engine instance. No route uses it, so it holds at most one
+# connection and the budget goes to the async engine.
 engine: Engine = create_engine(
     config.db.get_url(),
     echo=False,
-    pool_size=100,
-    max_overflow=10,
+    pool_size=1,
+    max_overflow=0,
 )
 
 # Create a configured "Session" class
@@ -28,6 +39,29 @@ SessionLocal: sessionmaker = sessionmaker(
     bind=engine,
 )
 
+# Create an asyncio engine instance, used by the async route handlers.
+# The pg_trgm operators are lowered to the floor of the fuzzy search threshold,
+# the exact threshold of each search is applied on top of the index scan.
+async_engine: AsyncEngine = create_async_engine(
+    config.db.get_async_url(),
+    echo=False,
+    pool_size=_pool_size,
+    max_overflow=_max_overflow,
+    connect_args={
+        "server_settings": {
+            "pg_trgm.similarity_threshold": str(TRIGRAM_INDEX_THRESHOLD),
+            "pg_trgm.word_similarity_threshold": str(TRIGRAM_INDEX_THRESHOLD),
+        },
+    },
+)
+
+# Create a configured "AsyncSession" class
+AsyncSessionLocal: async_sessionmaker[AsyncSession] = async_sessionmaker(
+    autoflush=False,
+    expire_on_commit=False,
+    bind=async_engine,
+)
+
 
 # Provide a context manager for session handling
 @contextmanager
@@ -53,7 +87,42 @@ def get_db_session() -> Generator[Session, Any, None]:
         session.close()
 
 
+# Provide an async context manager for session handling
+@asynccontextmanager
+async def get_async_db_session() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Provide a transactional scope around a series of asynchronous operations.
+    Database round trips are awaited, so they never block the event loop.
+    """
+    session: AsyncSession = AsyncSessionLocal()
+    start_time = time.time()
+    try:
+        yield session
+        await session.commit()
+    except Exception as e:
+        await session.rollback()
+        log.error(f"Session rollback due to: {e}")
+        raise e
+    finally:
+        end_time = time.time()
+        log.debug(
+            f"DB Total Session Query Time: {(end_time - start_time):.4f} seconds",
+        )
+        await session.close()
+
+
 # Dependency to get the database session
 def get_db() -> Generator[Session, Any, None]:
     with get_db_session() as db:
         yield db
+
+
+# Dependency to get the asynchronous database session
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    async with get_async_db_session() as db:
+        yield db
+
+
+# Dependency to get the session factory, used by responses that outlive the request scope
+def get_db_sessionmaker() -> async_sessionmaker[AsyncSession]:
+    return AsyncSessionLocal
@@ -0,0 +1,23 @@
+from typing import Any, Iterator
+
+import pytest
+from api.app.fuzzy import similarity, word_similarity
+from sqlalchemy import Engine, event
+
+
+def _register_sqlite_functions(dbapi_connection: Any, connection_record: Any) -> None:
+    # SQLite gets the pg_trgm functions as Python functions, so the fuzzy
+    # queries run unchanged, without index
+    if "sqlite" in type(dbapi_connection).__module__:
+        dbapi_connection.create_function("similarity", 2, similarity)
+        dbapi_connection.create_function("word_similarity", 2, word_similarity)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def sqlite_trigram_functions() -> Iterator[None]:
+    """
+    Register the pg_trgm functions on the SQLite connections opened by the tests.
+    """
+    event.listen(Engine, "connect", _register_sqlite_functions)
+    yield
+    event.remove(Engine, "connect", _register_sqlite_functions)
@@ -1,18 +1,38 @@
+import asyncio
 import base64
+import gzip
+import json
 import os
-from datetime import date
+import tempfile
+from contextlib import contextmanager
+from datetime import date, datetime, timezone
+from typing import Any, Iterator
 
 import pytest
+from api.app import catalog, ingest
 from api.app.app import app
+from api.app.bulk import MAX_BULK_GAMES
+from api.app.cache import response_cache
+from api.app.catalog_index import CatalogIndex, catalog_index
+from api.app.config import IdempotencyConfig, ReadModel, WriteBehindConfig
+from api.app.dimensions import dimension_ids
+from api.app.idempotency import IdempotencyStore, idempotency_store
 from api.app.models import Developer, Game, Platform, Publisher
-from api.database.db import Base, get_db
+from api.app.routers import game as game_router
+from api.app.schemas import GameSchema
+from api.app.statements import compiled_cache_stats
+from api.app.write_behind import WriteBehindQueue
+from api.database.db import Base, get_async_db, get_db_sessionmaker
 from api.settings import config
-from fastapi import status
+from fastapi import HTTPException, status
 from fastapi.testclient import TestClient
-from sqlalchemy import Engine, create_engine
+from sqlalchemy import Engine, create_engine, event, insert
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
 
 TEST_DATABASE_URL: str = "sqlite:///./test.db"
+TEST_ASYNC_DATABASE_URL: str = "sqlite+aiosqlite:///./test.db"
 
 # Create a new engine instance
 engine: Engine = create_engine(
@@ -28,17 +48,37 @@ TestingSessionLocal = sessionmaker(
 )
 
 
-# Override the dependency to use the testing database session
-def override_get_db():
-    try:
-        db = TestingSessionLocal()
-        yield db
-    finally:
-        db.close()
+# Create an asyncio engine on the same database for the async route handlers
+async_engine: AsyncEngine = create_async_engine(
+    TEST_ASYNC_DATABASE_URL,
+    poolclass=NullPool,
+)
+
+# Create a configured "AsyncSession" class
+TestingAsyncSessionLocal = async_sessionmaker(
+    autoflush=False,
+    expire_on_commit=False,
+    bind=async_engine,
+)
+
+
+def _override_database(session_factory: async_sessionmaker) -> None:
+    """
+    Point the database dependencies of the API at the given session factory.
+    """
+
+    async def override_get_async_db():
+        async with session_factory() as db:
+            yield db
+
+    app.dependency_overrides[get_async_db] = override_get_async_db
+    app.dependency_overrides[get_db_sessionmaker] = lambda: session_factory
+    # The cached ids belong to the previous database
+    dimension_ids.clear()
 
 
-# Apply the dependency override
-app.dependency_overrides[get_db] = override_get_db
+# Apply the dependency overrides
+_override_database(TestingAsyncSessionLocal)
 
 # Create all the tables in the test database
 Base.metadata.create_all(bind=engine)
@@ -262,3 +302,1427 @@ def test_create_game_missing_fields(create_test_data):
         response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
     )  # Unprocessable Entity
     assert "detail" in response.json()
+
+
+def _seed_catalog(session, size: int) -> None:
+    """
+    Seed a catalog of `size` games spread over a handful of dimensions.
+    """
+    platforms = [Platform(name=f"Platform {i}") for i in range(3)]
+    developers = [Developer(name=f"Developer {i}") for i in range(3)]
+    publishers = [Publisher(name=f"Publisher {i}") for i in range(3)]
+    session.add_all(platforms + developers + publishers)
+    session.flush()
+
+    session.execute(
+        insert(Game),
+        [
+            {
+                "title": f"Catalog Game {i}",
+                "genre": "Action",
+                "description": f"Description of catalog game {i}",
+                "platform_id": platforms[i % 3].id,
+                "developer_id": developers[0].id,
+                "publisher_id": publishers[i % 3].id,
+                "release_date": date(2020, 1, 1),
+            }
+            for i in range(size)
+        ],
+    )
+    session.commit()
+
+
+@contextmanager
+def _isolated_catalog(size: int) -> Iterator[list[str]]:
+    """
+    Serve the API from a fresh database seeded with `size` games,
+    yielding the list of SQL statements executed while the context is open.
+    """
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        catalog_path: str = os.path.join(tmp_dir, "catalog.db")
+        catalog_engine: Engine = create_engine(f"sqlite:///{catalog_path}")
+        Base.metadata.create_all(bind=catalog_engine)
+        with sessionmaker(autoflush=False, bind=catalog_engine)() as session:
+            _seed_catalog(session, size)
+        catalog_engine.dispose()
+
+        catalog_async_engine: AsyncEngine = create_async_engine(
+            f"sqlite+aiosqlite:///{catalog_path}",
+            poolclass=NullPool,
+        )
+        statements: list[str] = []
+
+        def count_statement(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(
+            catalog_async_engine.sync_engine,
+            "before_cursor_execute",
+            count_statement,
+        )
+        compiled_cache_stats.watch(catalog_async_engine.sync_engine)
+        _override_database(
+            async_sessionmaker(
+                autoflush=False,
+                expire_on_commit=False,
+                bind=catalog_async_engine,
+            ),
+        )
+        try:
+            yield statements
+        finally:
+            _override_database(TestingAsyncSessionLocal)
+            asyncio.run(catalog_async_engine.dispose())
+
+
+@pytest.mark.parametrize(
+    "url",
+    ["/games", "/games?platform=Platform 1", "/games/Developer 0"],
+)
+def test_read_statement_count_is_fixed(url):
+    """
+    Test that the read endpoints issue the same number of SQL statements
+    regardless of how many games are in the catalog (no N+1 lazy loads).
+    """
+    statement_counts: dict[int, int] = {}
+    for size in (10, 10_000):
+        with _isolated_catalog(size) as statements:
+            response = client.get(url, headers=_get_auth_headers())
+            assert response.status_code == status.HTTP_200_OK
+            assert len(response.json()) > 0
+            statement_counts[size] = len(statements)
+
+    assert statement_counts[10] == statement_counts[10_000], statement_counts
+    assert statement_counts[10] <= 2, statement_counts
+
+
+@pytest.mark.parametrize("query_params", [{}, {"platform": "Platform 1"}])
+def test_get_games_keyset_pagination(query_params):
+    """
+    Test that following the `Link` header walks the whole catalog once,
+    in (release_date, id) order, seeking pages through the keyset predicate.
+    """
+    with _isolated_catalog(250) as statements:
+        expected = client.get(
+            "/games",
+            params=query_params,
+            headers=_get_auth_headers(),
+        ).json()
+
+        titles: list[str] = []
+        response = client.get(
+            "/games",
+            params={**query_params, "limit": 40},
+            headers=_get_auth_headers(),
+        )
+        while True:
+            assert response.status_code == status.HTTP_200_OK
+            page = response.json()
+            assert len(page) <= 40
+            titles.extend(game["title"] for game in page)
+            if "next" not in response.links:
+                break
+            response = client.get(
+                response.links["next"]["url"],
+                headers=_get_auth_headers(),
+            )
+
+        assert titles == [game["title"] for game in expected]
+        assert any(
+            "(game.release_date, game.id) > (?, ?)" in statement
+            for statement in statements
+        )
+
+
+def test_get_games_invalid_cursor():
+    """
+    Test that a malformed pagination cursor is rejected.
+    """
+    response = client.get(
+        "/games",
+        params={"limit": 10, "after": "not-a-cursor"},
+        headers=_get_auth_headers(),
+    )
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.json()["detail"] == "Invalid pagination cursor"
+
+
+@pytest.mark.parametrize(
+    "query_params, headers",
+    [
+        ({"stream": 1}, {}),
+        ({}, {"Accept": "application/x-ndjson"}),
+        ({"stream": 1, "platform": "Platform 2"}, {}),
+    ],
+)
+def test_get_games_stream_ndjson(query_params, headers):
+    """
+    Test that the streaming mode returns the same games as the JSON list,
+    one JSON document per line.
+    """
+    with _isolated_catalog(2_500):
+        expected = client.get(
+            "/games",
+            params={k: v for k, v in query_params.items() if k != "stream"},
+            headers=_get_auth_headers(),
+        ).json()
+
+        response = client.get(
+            "/games",
+            params=query_params,
+            headers={**_get_auth_headers(), **headers},
+        )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines: list[str] = response.text.splitlines()
+    assert [json.loads(line) for line in lines] == expected
+
+
+@pytest.fixture
+def enabled_response_cache():
+    """
+    Enable the response cache for the duration of a test.
+    """
+    response_cache.enabled = True
+    asyncio.run(response_cache.invalidate())
+    yield response_cache
+    response_cache.enabled = False
+    asyncio.run(response_cache.invalidate())
+
+
+def test_get_games_served_from_cache(enabled_response_cache):
+    """
+    Test that a repeated listing is answered from the cache with only the
+    catalog version lookup, and that creating a game invalidates it.
+    """
+    with _isolated_catalog(10) as statements:
+        first = client.get("/games?genre=Action", headers=_get_auth_headers())
+        statements.clear()
+        second = client.get("/games?genre=Action", headers=_get_auth_headers())
+
+        assert second.status_code == status.HTTP_200_OK
+        assert second.json() == first.json()
+        assert len(statements) == 1 and "catalog_version" in statements[0]
+        assert (
+            client.get("/metrics", headers=_get_auth_headers()).json()["cache"]["hits"]
+            == 1
+        )
+
+        created = client.post(
+            "/game",
+            json={
+                "title": "Cached Catalog Game",
+                "genre": "Action",
+                "description": "A game created after the listing was cached",
+                "platform": "Platform 0",
+                "developer": "Developer 0",
+                "publisher": "Publisher 0",
+                "release_date": "2021-01-01",
+            },
+            headers=_get_auth_headers(),
+        )
+        assert created.status_code == status.HTTP_201_CREATED
+
+        third = client.get("/games?genre=Action", headers=_get_auth_headers())
+        assert len(third.json()) == len(first.json()) + 1
+
+
+class _FrozenDatetime(datetime):
+    """A clock stopped within a second, for writes made in the same second."""
+
+    @classmethod
+    def now(cls, tz=None):
+        return datetime(2024, 5, 5, 12, 0, 0, 200000, tzinfo=timezone.utc)
+
+
+@pytest.mark.parametrize("url", ["/games?genre=Action", "/games/Developer 0"])
+def test_get_games_conditional_requests(url, monkeypatch):
+    """
+    Test that the listings carry validators, that a matching If-None-Match
+    is answered with 304 without running the listing query, that creating a
+    game changes the ETag, and that If-Modified-Since, precise to the second,
+    is ignored.
+    """
+    monkeypatch.setattr(catalog, "datetime", _FrozenDatetime)
+    with _isolated_catalog(10) as statements:
+        # The first write stores the catalog watermark
+        client.post(
+            "/game",
+            json={
+                "title": "Watermark Game",
+                "genre": "Action",
+                "description": "A game that moves the catalog watermark",
+                "platform": "Platform 0",
+                "developer": "Developer 0",
+                "publisher": "Publisher 0",
+                "release_date": "2021-01-01",
+            },
+            headers=_get_auth_headers(),
+        )
+        first = client.get(url, headers=_get_auth_headers())
+        etag: str = first.headers["ETag"]
+        last_modified: str = first.headers["Last-Modified"]
+
+        statements.clear()
+        by_etag = client.get(
+            url,
+            headers={**_get_auth_headers(), "If-None-Match": etag},
+        )
+        assert by_etag.status_code == status.HTTP_304_NOT_MODIFIED
+        assert by_etag.content == b""
+        assert by_etag.headers["ETag"] == etag
+        assert len(statements) == 1 and "catalog_version" in statements[0]
+
+        by_date = client.get(
+            url,
+            headers={**_get_auth_headers(), "If-Modified-Since": last_modified},
+        )
+        assert by_date.status_code == status.HTTP_200_OK
+
+        client.post(
+            "/game",
+            json={
+                "title": "Another Watermark Game",
+                "genre": "Action",
+                "description": "A game that moves the catalog watermark again",
+                "platform": "Platform 0",
+                "developer": "Developer 0",
+                "publisher": "Publisher 0",
+                "release_date": "2021-01-01",
+            },
+            headers=_get_auth_headers(),
+        )
+        changed = client.get(
+            url,
+            headers={**_get_auth_headers(), "If-None-Match": etag},
+        )
+        assert changed.status_code == status.HTTP_200_OK
+        assert changed.headers["ETag"] != etag
+        assert len(changed.json()) == len(first.json()) + 1
+
+        # A write in the same second as the copy is not missed
+        same_second = client.get(
+            url,
+            headers={**_get_auth_headers(), "If-Modified-Since": last_modified},
+        )
+        assert same_second.headers["Last-Modified"] == last_modified
+        assert same_second.status_code == status.HTTP_200_OK
+        assert len(same_second.json()) == len(first.json()) + 1
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "/games",
+        "/games?genre=Action&platform=Platform 1",
+        "/games?limit=7",
+        "/games/Developer 0",
+    ],
+)
+def test_get_games_from_flat_read_model(url, monkeypatch):
+    """
+    Test that the flat read model, kept in sync by triggers, serves the same
+    listings as the normalized tables with single-table statements.
+    """
+    with _isolated_catalog(50) as statements:
+        client.post(
+            "/game",
+            json={
+                "title": "Flat Game",
+                "genre": "Action",
+                "description": "A game mirrored into game_flat by a trigger",
+                "platform": "Platform 1",
+                "developer": "Developer 0",
+                "publisher": "Publisher 0",
+                "release_date": "2019-01-01",
+            },
+            headers=_get_auth_headers(),
+        )
+        normalized = client.get(url, headers=_get_auth_headers())
+
+        monkeypatch.setattr(config.api, "read_model", ReadModel.FLAT)
+        statements.clear()
+        flat = client.get(url, headers=_get_auth_headers())
+
+    assert flat.status_code == status.HTTP_200_OK
+    assert flat.json() == normalized.json()
+    assert "Flat Game" in [game["title"] for game in flat.json()]
+    listing: str = statements[-1]
+    assert "FROM game_flat" in listing and "JOIN" not in listing
+
+
+@contextmanager
+def _loaded_catalog_index() -> Iterator[CatalogIndex]:
+    """
+    Build the in-memory catalog index from the database currently served by the API.
+    """
+
+    async def load():
+        session_factory = app.dependency_overrides[get_db_sessionmaker]()
+        async with session_factory() as db:
+            await catalog_index.load(db)
+
+    asyncio.run(load())
+    try:
+        yield catalog_index
+    finally:
+        catalog_index.ready = False
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "/games",
+        "/games?genre=Action",
+        "/games?platform=Platform 2&release_date=2020-01-01",
+        "/games?platform=Platform 2&genre=Adventure",
+        "/games?limit=9",
+        "/games?platform=Platform 1&limit=4",
+        "/games/Developer 0",
+    ],
+)
+def test_get_games_from_catalog_index(url):
+    """
+    Test that the in-memory catalog index answers the listings like SQL,
+    without any SQL statement, including the pages behind the `Link` header.
+    """
+
+    def walk(url: str, params: dict[str, str]) -> list[list[str]]:
+        pages: list[list[str]] = []
+        response = client.get(url, params=params, headers=_get_auth_headers())
+        while True:
+            assert response.status_code == status.HTTP_200_OK
+            pages.append([game["title"] for game in response.json()])
+            if "next" not in response.links:
+                return pages
+            response = client.get(
+                response.links["next"]["url"],
+                headers=_get_auth_headers(),
+            )
+
+    with _isolated_catalog(40) as statements:
+        with _loaded_catalog_index() as index:
+            expected = walk(url, {"use_index": "false"})
+
+            statements.clear()
+            assert walk(url, {}) == expected
+            assert statements == []
+            assert index.stats()["hits"] > 0
+
+
+def test_catalog_index_follows_writes():
+    """
+    Test that a created game is applied to the index, and that an unknown
+    developer is still a 404.
+    """
+    with _isolated_catalog(5):
+        with _loaded_catalog_index() as index:
+            version: int = index.version
+            created = client.post(
+                "/game",
+                json={
+                    "title": "Indexed Game",
+                    "genre": "Puzzle",
+                    "description": "A game applied to the catalog index",
+                    "platform": "Platform 0",
+                    "developer": "Indexed Developer",
+                    "publisher": "Publisher 0",
+                    "release_date": "2021-01-01",
+                },
+                headers=_get_auth_headers(),
+            )
+            assert created.status_code == status.HTTP_201_CREATED
+            assert index.version == version + 1
+
+            puzzles = client.get("/games?genre=Puzzle", headers=_get_auth_headers())
+            assert [game["title"] for game in puzzles.json()] == ["Indexed Game"]
+            by_dev = client.get(
+                "/games/Indexed Developer",
+                headers=_get_auth_headers(),
+            )
+            assert [game["title"] for game in by_dev.json()] == ["Indexed Game"]
+
+            unknown = client.get("/games/Nobody", headers=_get_auth_headers())
+            assert unknown.status_code == status.HTTP_404_NOT_FOUND
+
+
+def test_search_games():
+    """
+    Test that the search matches titles and descriptions, ranks title matches
+    first and paginates through the `Link` header.
+    """
+    with _isolated_catalog(20):
+        for title, description in (
+            ("Savanna Run", "A zebra crosses the savanna"),
+            ("Zebra Quest", "An adventure on the plains"),
+        ):
+            created = client.post(
+                "/game",
+                json={
+                    "title": title,
+                    "genre": "Adventure",
+                    "description": description,
+                    "platform": "Platform 0",
+                    "developer": "Developer 0",
+                    "publisher": "Publisher 0",
+                    "release_date": "2021-01-01",
+                },
+                headers=_get_auth_headers(),
+            )
+            assert created.status_code == status.HTTP_201_CREATED
+
+        response = client.get(
+            "/games/search",
+            params={"q": "zebra"},
+            headers=_get_auth_headers(),
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert [game["title"] for game in response.json()] == [
+            "Zebra Quest",
+            "Savanna Run",
+        ]
+
+        first_page = client.get(
+            "/games/search",
+            params={"q": "zebra", "limit": 1},
+            headers=_get_auth_headers(),
+        )
+        assert [game["title"] for game in first_page.json()] == ["Zebra Quest"]
+        second_page = client.get(
+            first_page.links["next"]["url"],
+            headers=_get_auth_headers(),
+        )
+        assert [game["title"] for game in second_page.json()] == ["Savanna Run"]
+        assert "next" not in second_page.links
+
+        every_word = client.get(
+            "/games/search",
+            params={"q": "ZEBRA quest"},
+            headers=_get_auth_headers(),
+        )
+        assert [game["title"] for game in every_word.json()] == ["Zebra Quest"]
+
+        wildcard = client.get(
+            "/games/search",
+            params={"q": "%"},
+            headers=_get_auth_headers(),
+        )
+        assert wildcard.json() == []
+
+
+def test_search_games_requires_a_query():
+    """
+    Test that a search without query is rejected.
+    """
+    response = client.get("/games/search", headers=_get_auth_headers())
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+def test_search_games_by_misspelled_title():
+    """
+    Test that `title~` ranks the titles by trigram similarity, above a threshold.
+    """
+    with _isolated_catalog(20):
+        response = client.get(
+            "/games/search",
+            params={"title~": "Catalg Gme 3"},
+            headers=_get_auth_headers(),
+        )
+        assert response.status_code == status.HTTP_200_OK
+        titles: list[str] = [game["title"] for game in response.json()]
+        assert titles[0] == "Catalog Game 3"
+        assert len(titles) == 20
+
+        strict = client.get(
+            "/games/search",
+            params={"title~": "Catalg Gme 3", "threshold": 0.45},
+            headers=_get_auth_headers(),
+        )
+        assert [game["title"] for game in strict.json()] == ["Catalog Game 3"]
+
+        too_loose = client.get(
+            "/games/search",
+            params={"title~": "Catalg Gme 3", "threshold": 0.05},
+            headers=_get_auth_headers(),
+        )
+        assert too_loose.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+def test_search_developers():
+    """
+    Test that a misspelled developer name returns the closest names first.
+    """
+    with _isolated_catalog(5):
+        response = client.get(
+            "/developers/search",
+            params={"q": "Devloper 2"},
+            headers=_get_auth_headers(),
+        )
+        assert response.status_code == status.HTTP_200_OK
+        matches = response.json()
+        assert [match["name"] for match in matches] == [
+            "Developer 2",
+            "Developer 0",
+            "Developer 1",
+        ]
+        assert matches[0]["similarity"] > matches[1]["similarity"] >= 0.3
+
+
+def test_search_developers_threshold():
+    """
+    Test that the similarity threshold filters the candidates.
+    """
+    with _isolated_catalog(5):
+        response = client.get(
+            "/developers/search",
+            params={"q": "Devloper 2", "threshold": 0.5},
+            headers=_get_auth_headers(),
+        )
+        assert [match["name"] for match in response.json()] == ["Developer 2"]
+
+        unknown = client.get(
+            "/developers/search",
+            params={"q": "Nintendo"},
+            headers=_get_auth_headers(),
+        )
+        assert unknown.json() == []
+
+
+@pytest.mark.parametrize(
+    "query_params, expected",
+    [
+        ({"genre": "Puzzle,Racing"}, ["Range A", "Range B", "Range C"]),
+        ({"genre": " Racing , Puzzle,"}, ["Range A", "Range B", "Range C"]),
+        (
+            {"platform": "Platform 8,Platform 9", "release_date_from": "2019-05-01"},
+            ["Range B", "Range C"],
+        ),
+        ({"release_date_to": "2019-06-01"}, ["Range A", "Range B"]),
+        (
+            {"release_date_from": "2019-04-01", "release_date_to": "2019-08-31"},
+            ["Range B"],
+        ),
+        ({"developer": "Developer 8", "publisher": "Publisher 9"}, ["Range C"]),
+        ({"release_date": "2019-06-01"}, ["Range B"]),
+        ({"genre": "Puzzle,Racing", "limit": 2}, ["Range A", "Range B"]),
+    ],
+)
+def test_get_games_multi_value_and_range_filters(query_params, expected):
+    """
+    Test the comma-separated and release date range filters, answered alike
+    by SQL and by the catalog index.
+    """
+    with _isolated_catalog(6):
+        for title, genre, release_date, platform, publisher, developer in (
+            (
+                "Range A",
+                "Puzzle",
+                "2019-03-01",
+                "Platform 9",
+                "Publisher 9",
+                "Developer 9",
+            ),
+            (
+                "Range B",
+                "Racing",
+                "2019-06-01",
+                "Platform 8",
+                "Publisher 8",
+                "Developer 8",
+            ),
+            (
+                "Range C",
+                "Puzzle",
+                "2019-09-01",
+                "Platform 8",
+                "Publisher 9",
+                "Developer 8",
+            ),
+        ):
+            created = client.post(
+                "/game",
+                json={
+                    "title": title,
+                    "genre": genre,
+                    "description": "A game to filter",
+                    "platform": platform,
+                    "developer": developer,
+                    "publisher": publisher,
+                    "release_date": release_date,
+                },
+                headers=_get_auth_headers(),
+            )
+            assert created.status_code == status.HTTP_201_CREATED
+
+        sql = client.get(
+            "/games",
+            params={**query_params, "use_index": "false"},
+            headers=_get_auth_headers(),
+        )
+        assert sql.status_code == status.HTTP_200_OK
+        assert [game["title"] for game in sql.json()] == expected
+
+        with _loaded_catalog_index():
+            indexed = client.get(
+                "/games",
+                params=query_params,
+                headers=_get_auth_headers(),
+            )
+            assert indexed.json() == sql.json()
+            assert ("next" in indexed.links) == ("next" in sql.links)
+
+
+def test_get_games_invalid_release_date():
+    """
+    Test that a malformed release date is rejected.
+    """
+    response = client.get(
+        "/games",
+        params={"release_date_from": "yesterday"},
+        headers=_get_auth_headers(),
+    )
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+def test_get_games_sparse_fieldset():
+    """
+    Test that `fields` narrows both the response and the SQL projection and joins.
+    """
+    with _isolated_catalog(30) as statements:
+        response = client.get(
+            "/games",
+            params={"fields": "platform,title,genre", "limit": 10},
+            headers=_get_auth_headers(),
+        )
+        assert response.status_code == status.HTTP_200_OK
+        games = response.json()
+        assert len(games) == 10
+        assert all(list(game) == ["title", "genre", "platform"] for game in games)
+        assert "next" in response.links
+
+        listing: str = next(
+            statement for statement in statements if "FROM game" in statement
+        )
+        assert "description" not in listing
+        assert "JOIN platform" in listing
+        assert "JOIN publisher" not in listing
+        assert "JOIN developer" not in listing
+
+        streamed = client.get(
+            "/games",
+            params={"fields": "title", "stream": True},
+            headers=_get_auth_headers(),
+        )
+        lines = [json.loads(line) for line in streamed.text.splitlines()]
+        assert len(lines) == 30
+        assert all(list(line) == ["title"] for line in lines)
+
+
+def test_get_games_unknown_field():
+    """
+    Test that requesting a field that does not exist is rejected.
+    """
+    response = client.get(
+        "/games",
+        params={"fields": "title,price"},
+        headers=_get_auth_headers(),
+    )
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+    assert response.json()["detail"] == "Unknown fields: price"
+
+
+def test_get_game_facets(enabled_response_cache):
+    """
+    Test the counts per facet, computed in one statement, filtered like `GET /games`
+    and refreshed once a game is created.
+    """
+    with _isolated_catalog(6) as statements:
+        response = client.get("/games/facets", headers=_get_auth_headers())
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == {
+            "total": 6,
+            "genre": [{"value": "Action", "count": 6}],
+            "platform": [
+                {"value": "Platform 0", "count": 2},
+                {"value": "Platform 1", "count": 2},
+                {"value": "Platform 2", "count": 2},
+            ],
+            "developer": [{"value": "Developer 0", "count": 6}],
+            "year": [{"value": 2020, "count": 6}],
+        }
+        assert len([s for s in statements if "facet_games" in s]) == 1
+
+        # Served from the cache until the catalog changes
+        assert client.get("/games/facets", headers=_get_auth_headers()).json() == (
+            response.json()
+        )
+        assert len([s for s in statements if "facet_games" in s]) == 1
+
+        created = client.post(
+            "/game",
+            json={
+                "title": "Facet Game",
+                "genre": "Puzzle",
+                "description": "A game to count",
+                "platform": "Platform 1",
+                "developer": "Developer 1",
+                "publisher": "Publisher 1",
+                "release_date": "2019-05-01",
+            },
+            headers=_get_auth_headers(),
+        )
+        assert created.status_code == status.HTTP_201_CREATED
+
+        filtered = client.get(
+            "/games/facets",
+            params={"platform": "Platform 1", "release_date_to": "2019-12-31"},
+            headers=_get_auth_headers(),
+        ).json()
+        assert filtered["total"] == 1
+        assert filtered["genre"] == [{"value": "Puzzle", "count": 1}]
+        assert filtered["year"] == [{"value": 2019, "count": 1}]
+
+        facets = client.get("/games/facets", headers=_get_auth_headers()).json()
+        assert facets["total"] == 7
+        assert facets["platform"][0] == {"value": "Platform 1", "count": 3}
+        assert facets["genre"] == [
+            {"value": "Action", "count": 6},
+            {"value": "Puzzle", "count": 1},
+        ]
+
+
+def test_create_game_idempotency_key():
+    """
+    Test that a retry carrying the same Idempotency-Key gets the first
+    response back without any query, and that a key cannot be reused for
+    another game.
+    """
+    game_data: dict[str, str] = {
+        "title": "Idempotent Game",
+        "genre": "Puzzle",
+        "description": "A game created once",
+        "platform": "Platform 0",
+        "developer": "Developer 0",
+        "publisher": "Publisher 0",
+        "release_date": "2022-02-22",
+    }
+
+    def post(key: str, **overrides) -> Any:
+        return client.post(
+            "/game",
+            json={**game_data, **overrides},
+            headers={**_get_auth_headers(), "Idempotency-Key": key},
+        )
+
+    with _isolated_catalog(3) as statements:
+        created = post("create-1")
+        assert created.status_code == status.HTTP_201_CREATED
+        assert "Idempotent-Replayed" not in created.headers
+
+        statements.clear()
+        for key, expected in (
+            ("create-1", status.HTTP_201_CREATED),
+            ("create-2", status.HTTP_409_CONFLICT),
+        ):
+            first = post(key)
+            assert first.status_code == expected
+            statements.clear()
+            retried = post(key)
+            assert retried.status_code == expected
+            assert retried.headers["Idempotent-Replayed"] == "true"
+            assert retried.json() == first.json()
+            assert statements == []
+
+        reused = post("create-1", title="Another Game")
+        assert reused.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+        # The request of a key is handled once at a time
+        fingerprint: str = idempotency_store.fingerprint(b"{}")
+        assert (
+            asyncio.run(idempotency_store.begin("POST /game:in-flight", fingerprint))
+            is None
+        )
+        with pytest.raises(HTTPException) as in_flight:
+            asyncio.run(idempotency_store.begin("POST /game:in-flight", fingerprint))
+        assert in_flight.value.status_code == status.HTTP_409_CONFLICT
+        asyncio.run(idempotency_store.end("POST /game:in-flight"))
+
+
+def test_idempotency_keys_shared_by_workers(tmp_path):
+    """
+    Test that a key claimed or answered by one worker is seen by the others
+    sharing the store, so a retry reaching another worker is not run again.
+    """
+    idempotency_config: IdempotencyConfig = IdempotencyConfig(
+        shared_path=str(tmp_path / "keys.db"),
+    )
+    worker_a: IdempotencyStore = IdempotencyStore(idempotency_config)
+    worker_b: IdempotencyStore = IdempotencyStore(idempotency_config)
+    key: str = "POST /game:shared"
+    fingerprint: str = worker_a.fingerprint(b"{}")
+
+    assert asyncio.run(worker_a.begin(key, fingerprint)) is None
+    with pytest.raises(HTTPException) as in_flight:
+        asyncio.run(worker_b.begin(key, fingerprint))
+    assert in_flight.value.status_code == status.HTTP_409_CONFLICT
+    assert in_flight.value.headers == {"Retry-After": "1"}
+
+    asyncio.run(worker_a.record(key, fingerprint, status.HTTP_201_CREATED, b"{}"))
+    asyncio.run(worker_a.end(key))
+    replayed = asyncio.run(worker_b.begin(key, fingerprint))
+    assert replayed is not None
+    assert replayed.status_code == status.HTTP_201_CREATED
+    assert worker_b.stats()["in_flight"] == 0
+
+    # A key released without a response (e.g. after a 500) can be retried
+    assert asyncio.run(worker_a.begin("POST /game:failed", fingerprint)) is None
+    asyncio.run(worker_a.end("POST /game:failed"))
+    assert asyncio.run(worker_b.begin("POST /game:failed", fingerprint)) is None
+    asyncio.run(worker_b.end("POST /game:failed"))
+
+
+def test_create_game_write_behind(monkeypatch):
+    """
+    Test that in write-behind mode the games are accepted without any query,
+    then committed in batches by the background writer, their status being
+    readable from the returned handle, and that a game that cannot be written
+    does not fail the others of its batch.
+    """
+    queue: WriteBehindQueue = WriteBehindQueue(
+        WriteBehindConfig(enabled=True, queue_size=3, batch_size=2),
+    )
+    monkeypatch.setattr(game_router, "write_behind", queue)
+
+    def game_data(title: str) -> dict[str, str]:
+        return {
+            "title": title,
+            "genre": "Sports",
+            "description": "A game written behind",
+            "platform": "Platform 0",
+            "developer": "Queue Developer",
+            "publisher": "Publisher 0",
+            "release_date": "2017-07-07",
+        }
+
+    def post(title: str) -> Any:
+        return client.post("/game", json=game_data(title), headers=_get_auth_headers())
+
+    with _isolated_catalog(3) as statements:
+        accepted = [post(title) for title in ("Queued 0", "Catalog Game 1", "Queued 1")]
+        assert [response.status_code for response in accepted] == [
+            status.HTTP_202_ACCEPTED
+        ] * 3
+        assert post("T" * 256).status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+        assert post("Queued 2").status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+        assert statements == []
+
+        async def write_queued_games() -> None:
+            writer = asyncio.create_task(
+                queue.run_forever(app.dependency_overrides[get_db_sessionmaker]()),
+            )
+            await queue.stop(writer)
+
+        asyncio.run(write_queued_games())
+        assert len([s for s in statements if s.startswith("INSERT INTO game ")]) == 2
+
+        writes = [
+            client.get(response.headers["Location"], headers=_get_auth_headers())
+            for response in accepted
+        ]
+        assert [write.json()["status"] for write in writes] == [
+            "created",
+            "conflict",
+            "created",
+        ]
+        assert queue.stats()["depth"] == 0
+        assert (queue.stats()["batches"], queue.stats()["written"]) == (2, 2)
+
+        missing = client.get("/game/writes/unknown", headers=_get_auth_headers())
+        assert missing.status_code == status.HTTP_404_NOT_FOUND
+
+        # The failed batch is written again one game per transaction
+        queue.accepting = True
+        written = queue.submit(GameSchema(**game_data("Queued 3")))
+        unwritable = queue.submit(
+            GameSchema.model_construct(
+                **{**game_data("Queued 4"), "release_date": "not a date"},
+            ),
+        )
+        asyncio.run(queue.flush(app.dependency_overrides[get_db_sessionmaker]()))
+        assert [queue.status(write.id).status for write in (written, unwritable)] == [
+            "created",
+            "failed",
+        ]
+        assert (queue.stats()["written"], queue.stats()["failed"]) == (3, 1)
+
+
+def test_create_game_without_lookups():
+    """
+    Test that a creation inserts the game once, without looking up its title
+    before nor reading it back after, and that the unique title turns a
+    duplicate into a conflict.
+    """
+    game_data: dict[str, str] = {
+        "title": "Unique Game",
+        "genre": "Puzzle",
+        "description": "A game created without lookups",
+        "platform": "Platform 2",
+        "developer": "New Developer",
+        "publisher": "Publisher 1",
+        "release_date": "2021-05-05",
+    }
+    with _isolated_catalog(3) as statements:
+        created = client.post("/game", json=game_data, headers=_get_auth_headers())
+        assert created.status_code == status.HTTP_201_CREATED
+        inserts: list[int] = [
+            i for i, s in enumerate(statements) if s.startswith("INSERT INTO game ")
+        ]
+        assert len(inserts) == 1
+        first_write: int = inserts[0]
+        assert not [s for s in statements[first_write:] if s.startswith("SELECT")]
+        assert not [s for s in statements if "FROM game" in s]
+
+        duplicate = client.post(
+            "/game",
+            json={**game_data, "developer": "Other Developer"},
+            headers=_get_auth_headers(),
+        )
+        assert duplicate.status_code == status.HTTP_409_CONFLICT
+
+        listed = client.get(
+            "/games",
+            params={"genre": "Puzzle", "use_index": "false"},
+            headers=_get_auth_headers(),
+        )
+        assert [g["developer"] for g in listed.json()] == ["New Developer"]
+
+
+def test_create_game_with_cached_dimension_ids():
+    """
+    Test that the names known from the dimension id cache are not queried,
+    and that names created by a rolled back write are not cached.
+    """
+
+    def game(title: str, **overrides) -> dict:
+        return {
+            "title": title,
+            "genre": "Racing",
+            "description": "A game created with cached names",
+            "platform": "Cached Platform",
+            "developer": "Cached Developer",
+            "publisher": "Publisher 0",
+            "release_date": "2019-09-09",
+            **overrides,
+        }
+
+    with _isolated_catalog(3) as statements:
+        asyncio.run(_warm_dimension_ids())
+        assert dimension_ids.get(Publisher, "Publisher 0") is not None
+        assert dimension_ids.get(Platform, "Cached Platform") is None
+
+        first = client.post("/game", json=game("Cached 0"), headers=_get_auth_headers())
+        assert first.status_code == status.HTTP_201_CREATED
+        assert [s for s in statements if "INTO publisher" in s] == []
+        assert dimension_ids.get(Platform, "Cached Platform") is not None
+
+        statements.clear()
+        second = client.post(
+            "/game", json=game("Cached 1"), headers=_get_auth_headers()
+        )
+        assert second.status_code == status.HTTP_201_CREATED
+        assert [s.split()[0] for s in statements] == ["UPDATE", "INSERT"]
+
+        conflict = client.post(
+            "/game",
+            json=game("Cached 1", platform="Ghost Platform"),
+            headers=_get_auth_headers(),
+        )
+        assert conflict.status_code == status.HTTP_409_CONFLICT
+        assert dimension_ids.get(Platform, "Ghost Platform") is None
+
+        listed = client.get(
+            "/games",
+            params={"genre": "Racing", "use_index": "false"},
+            headers=_get_auth_headers(),
+        )
+        assert [(g["title"], g["platform"]) for g in listed.json()] == [
+            ("Cached 0", "Cached Platform"),
+            ("Cached 1", "Cached Platform"),
+        ]
+
+
+async def _warm_dimension_ids() -> None:
+    async with app.dependency_overrides[get_db_sessionmaker]()() as db:
+        await dimension_ids.load(db)
+
+
+def test_ingest_games_ndjson():
+    """
+    Test that a gzip encoded NDJSON body is loaded in one transaction, with
+    the invalid lines and the title conflicts reported.
+    """
+
+    def line(title: str, **overrides) -> bytes:
+        return json.dumps(
+            {
+                "title": title,
+                "genre": "Simulation",
+                "description": "A game loaded from NDJSON",
+                "platform": "Ingest Platform",
+                "developer": "Ingest Developer",
+                "publisher": "Publisher 2",
+                "release_date": "2015-03-03",
+                **overrides,
+            },
+        ).encode()
+
+    body: bytes = b"\n".join(
+        [
+            line("Ingest Game 0"),
+            line("Catalog Game 1"),
+            b"",
+            line("Ingest Game 1", platform="Platform 0"),
+            line("Ingest Game 0", genre="Other"),
+            line("Ingest Game 2", release_date="2999-01-01"),
+            line("T" * 256),
+            b"{not json",
+        ],
+    )
+    with _isolated_catalog(3):
+        response = client.post(
+            "/games/ingest",
+            content=gzip.compress(body),
+            headers={
+                **_get_auth_headers(),
+                "Content-Type": "application/x-ndjson",
+                "Content-Encoding": "gzip",
+            },
+        )
+        assert response.status_code == status.HTTP_200_OK
+        report = response.json()
+        assert {key: report[key] for key in report if key != "error_details"} == {
+            "lines": 7,
+            "created": 2,
+            "conflicts": 2,
+            "errors": 3,
+        }
+        assert [error["line"] for error in report["error_details"]] == [6, 7, 8]
+
+        listed = client.get(
+            "/games",
+            params={"developer": "Ingest Developer", "use_index": "false"},
+            headers=_get_auth_headers(),
+        )
+        assert [(g["title"], g["genre"], g["platform"]) for g in listed.json()] == [
+            ("Ingest Game 0", "Simulation", "Ingest Platform"),
+            ("Ingest Game 1", "Simulation", "Platform 0"),
+        ]
+
+        for encoding, expected in (
+            ("br", status.HTTP_415_UNSUPPORTED_MEDIA_TYPE),
+            ("gzip", status.HTTP_400_BAD_REQUEST),
+        ):
+            rejected = client.post(
+                "/games/ingest",
+                content=body,
+                headers={**_get_auth_headers(), "Content-Encoding": encoding},
+            )
+            assert rejected.status_code == expected
+
+
+def test_ingest_games_ndjson_updates_catalog_index(monkeypatch):
+    """
+    Test that the games of an ingest written in several batches are listed
+    from the catalog index right after the ingest.
+    """
+    monkeypatch.setattr(ingest, "INGEST_BATCH_SIZE", 1)
+    body: bytes = b"\n".join(
+        json.dumps(
+            {
+                "title": f"Indexed Ingest Game {i}",
+                "genre": "Simulation",
+                "description": "A game loaded from NDJSON",
+                "platform": "Platform 0",
+                "developer": "Indexed Ingest Developer",
+                "publisher": "Publisher 0",
+                "release_date": f"201{i}-03-03",
+            },
+        ).encode()
+        for i in range(3)
+    )
+    with _isolated_catalog(3) as statements, _loaded_catalog_index():
+        response = client.post(
+            "/games/ingest",
+            content=body,
+            headers={**_get_auth_headers(), "Content-Type": "application/x-ndjson"},
+        )
+        assert response.json()["created"] == 3
+
+        statements.clear()
+        listed = client.get(
+            "/games",
+            params={"developer": "Indexed Ingest Developer"},
+            headers=_get_auth_headers(),
+        )
+        assert [g["title"] for g in listed.json()] == [
+            f"Indexed Ingest Game {i}" for i in range(3)
+        ]
+        assert statements == []
+
+
+def test_listing_statements_are_reused():
+    """
+    Test that listings differing only by their filter values reuse the same
+    statement and its compiled SQL.
+    """
+
+    def get_games(platform: str, limit: int) -> list[dict]:
+        response = client.get(
+            "/games",
+            params={"platform": platform, "limit": limit, "use_index": "false"},
+            headers=_get_auth_headers(),
+        )
+        assert response.status_code == status.HTTP_200_OK
+        return response.json()
+
+    def statement_stats() -> dict[str, int]:
+        response = client.get("/metrics", headers=_get_auth_headers())
+        return response.json()["statements"]
+
+    with _isolated_catalog(12):
+        assert len(get_games("Platform 0,Platform 1", 2)) == 2
+        before: dict[str, int] = statement_stats()
+
+        assert len(get_games("Platform 1,Platform 2", 3)) == 3
+        assert len(get_games("Platform 0,Platform 1,Platform 2", 20)) == 12
+        after: dict[str, int] = statement_stats()
+
+    assert after["listing_hits"] == before["listing_hits"] + 2
+    assert after["listing_misses"] == before["listing_misses"]
+    assert after["compiled_misses"] == before["compiled_misses"]
+    assert after["compiled_hits"] >= before["compiled_hits"] + 2
+
+
+def test_create_games_bulk():
+    """
+    Test that a bulk creation reports each game, resolves the dimensions once
+    and writes the created games in one batch.
+    """
+
+    def game(title: str, **overrides) -> dict:
+        return {
+            "title": title,
+            "genre": "Strategy",
+            "description": "A game loaded in bulk",
+            "platform": "Platform 1",
+            "developer": "Bulk Developer",
+            "publisher": "Publisher 0",
+            "release_date": "2018-04-01",
+            **overrides,
+        }
+
+    with _isolated_catalog(3) as statements, _loaded_catalog_index():
+        response = client.post(
+            "/games/bulk",
+            json=[
+                game("Bulk Game 0"),
+                game("Catalog Game 1"),
+                game("Bulk Game 1", platform="Bulk Platform"),
+                game("Bulk Game 0"),
+                game("Bulk Game 2", release_date="2999-01-01"),
+                "not a game",
+            ],
+            headers=_get_auth_headers(),
+        )
+        assert response.status_code == status.HTTP_200_OK
+        body = response.json()
+        assert (body["created"], body["conflicts"], body["errors"]) == (2, 2, 2)
+        assert [result["status"] for result in body["results"]] == [
+            "created",
+            "conflict",
+            "created",
+            "conflict",
+            "error",
+            "error",
+        ]
+        assert "release_date" in body["results"][4]["detail"]
+        assert [s for s in statements if s.startswith("INSERT INTO game ")] == [
+            statements[-1]
+        ]
+        # The names are written first, the watermark is bumped right before the games
+        writes: list[str] = [
+            s.split()[1 if s.startswith("UPDATE") else 2]
+            for s in statements
+            if s.startswith(("INSERT", "UPDATE"))
+        ]
+        assert writes[-2:] == ["catalog_version", "game"]
+        assert {"platform", "developer"} <= set(writes[:-2])
+
+        # The created games are visible from the index and from SQL
+        for use_index in ("true", "false"):
+            listed = client.get(
+                "/games",
+                params={"developer": "Bulk Developer", "use_index": use_index},
+                headers=_get_auth_headers(),
+            )
+            assert [g["title"] for g in listed.json()] == ["Bulk Game 0", "Bulk Game 1"]
+            assert listed.json()[1]["platform"] == "Bulk Platform"
+
+
+def test_create_games_bulk_limits():
+    """
+    Test that an empty or oversized bulk request is rejected.
+    """
+    for games in ([], [{}] * (MAX_BULK_GAMES + 1)):
+        response = client.post("/games/bulk", json=games, headers=_get_auth_headers())
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+def test_create_games_bulk_overlong_values():
+    """
+    Test that a game with a value longer than its column is reported as an
+    error of its own, without failing the other games of the request.
+    """
+    games: list[dict[str, str]] = [
+        {
+            "title": title,
+            "genre": "Strategy",
+            "description": "A game loaded in bulk",
+            "platform": "Platform 1",
+            "developer": developer,
+            "publisher": "Publisher 0",
+            "release_date": "2018-04-01",
+        }
+        for title, developer in (
+            ("Short Game", "Bulk Developer"),
+            ("T" * 256, "Bulk Developer"),
+            ("Long Developer Game", "D" * 101),
+        )
+    ]
+    with _isolated_catalog(3):
+        response = client.post("/games/bulk", json=games, headers=_get_auth_headers())
+        assert response.status_code == status.HTTP_200_OK
+        results = response.json()["results"]
+        assert [result["status"] for result in results] == [
+            "created",
+            "error",
+            "error",
+        ]
+        assert results[1]["detail"].startswith("title:")
+        assert results[2]["detail"].startswith("developer:")
+
+    # The limits are the lengths of the catalog columns
+    assert [
+        GameSchema.model_fields[name].metadata[0].max_length
+        for name in ("title", "genre")
+    ] == [Game.__table__.c.title.type.length, Game.__table__.c.genre.type.length]
+    for name, model in (
+        ("platform", Platform),
+        ("publisher", Publisher),
+        ("developer", Developer),
+    ):
+        assert (
+            GameSchema.model_fields[name].metadata[0].max_length
+            == model.__table__.c.name.type.length
+        )
+
+
+def test_game_changes_feed():
+    """
+    Test that the change feed returns the games written after a catalog
+    version, in write order and page by page, and nothing once caught up.
+    """
+    with _isolated_catalog(3):
+        everything = client.get("/games/changes", headers=_get_auth_headers())
+        assert everything.status_code == status.HTTP_200_OK
+        assert len(everything.json()["changes"]) == 3
+        since: int = everything.json()["until"]
+
+        titles: list[str] = [f"Changed Game {i}" for i in range(3)]
+        for title in titles:
+            created = client.post(
+                "/game",
+                json={
+                    "title": title,
+                    "genre": "Puzzle",
+                    "description": "A game of the change feed",
+                    "platform": "Platform 1",
+                    "developer": "Developer 0",
+                    "publisher": "Publisher 1",
+                    "release_date": "2021-05-05",
+                },
+                headers=_get_auth_headers(),
+            )
+            assert created.status_code == status.HTTP_201_CREATED
+
+        first = client.get(
+            "/games/changes",
+            params={"since": since, "limit": 2},
+            headers=_get_auth_headers(),
+        )
+        assert first.status_code == status.HTTP_200_OK
+        page: list[dict] = first.json()["changes"]
+        assert [g["title"] for g in page] == titles[:2]
+        assert page[0]["change_version"] < page[1]["change_version"]
+        assert page[0]["change_version"] > since
+        until: int = first.json()["until"]
+        assert until == page[1]["change_version"] + 1
+
+        # A game written between two pages is left for the next poll
+        client.post(
+            "/games/bulk",
+            json=[
+                {
+                    "title": "Later Game",
+                    "genre": "Puzzle",
+                    "description": "Written while paginating",
+                    "platform": "Platform 1",
+                    "developer": "Developer 0",
+                    "publisher": "Publisher 1",
+                    "release_date": "2021-05-05",
+                },
+            ],
+            headers=_get_auth_headers(),
+        )
+        next_url: str = first.headers["Link"].split(">")[0].lstrip("<")
+        second = client.get(next_url, headers=_get_auth_headers())
+        assert second.json()["until"] == until
+        assert [g["title"] for g in second.json()["changes"]] == titles[2:]
+        assert "Link" not in second.headers
+
+        caught_up = client.get(
+            "/games/changes",
+            params={"since": until},
+            headers=_get_auth_headers(),
+        )
+        assert [g["title"] for g in caught_up.json()["changes"]] == ["Later Game"]
+
+        # A conflicting write rolls back its catalog version
+        conflict = client.post(
+            "/game",
+            json={
+                "title": titles[0],
+                "genre": "Puzzle",
+                "description": "A duplicate",
+                "platform": "Platform 1",
+                "developer": "Developer 0",
+                "publisher": "Publisher 1",
+                "release_date": "2021-05-05",
+            },
+            headers=_get_auth_headers(),
+        )
+        assert conflict.status_code == status.HTTP_409_CONFLICT
+        latest = client.get(
+            "/games/changes",
+            params={"since": until + 1},
+            headers=_get_auth_headers(),
+        )
+        assert latest.json() == {"until": until + 1, "changes": []}
+
+        invalid = client.get(
+            "/games/changes",
+            params={"after": "not-a-cursor"},
+            headers=_get_auth_headers(),
+        )
+        assert invalid.status_code == status.HTTP_400_BAD_REQUEST
@@ -0,0 +1,106 @@
+import asyncio
+import time
+
+from api.app.cache import CachedResponse, ResponseCache, SQLiteStore, TTLCache
+from api.app.config import CacheConfig
+
+
+def test_ttl_cache_lru_eviction():
+    """
+    Test that the least recently used entry is evicted above the size bound.
+    """
+    cache: TTLCache[int] = TTLCache(max_entries=2, ttl_seconds=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1  # "b" becomes the least recently used entry
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert (cache.hits, cache.misses, cache.evictions) == (3, 1, 1)
+
+
+def test_ttl_cache_expiration():
+    """
+    Test that entries are no longer returned once their TTL is over.
+    """
+    cache: TTLCache[int] = TTLCache(max_entries=2, ttl_seconds=0.01)
+    cache.set("a", 1)
+    time.sleep(0.02)
+
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_make_key_is_normalized():
+    """
+    Test that the cache key ignores parameter order and missing parameters.
+    """
+    assert ResponseCache.make_key(
+        "/games",
+        genre="Action",
+        platform="PC",
+        limit=None,
+    ) == ResponseCache.make_key("/games", platform="PC", genre="Action")
+
+
+def test_response_cache_invalidation():
+    """
+    Test that bumping the catalog version invalidates the cached responses.
+    """
+    cache: ResponseCache = ResponseCache(CacheConfig(enabled=True))
+    asyncio.run(cache.set("/games?", 0, CachedResponse(body=b"[]")))
+    assert asyncio.run(cache.get("/games?", 0)) == CachedResponse(body=b"[]")
+
+    asyncio.run(cache.invalidate())
+
+    version: int = asyncio.run(cache.current_version())
+    assert version == 1
+    assert asyncio.run(cache.get("/games?", version)) is None
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+    assert cache.stats()["invalidations"] == 1
+
+
+def test_response_cache_disabled():
+    """
+    Test that a disabled cache never stores nor returns responses.
+    """
+    cache: ResponseCache = ResponseCache(CacheConfig(enabled=False))
+    asyncio.run(cache.set("/games?", 0, CachedResponse(body=b"[]")))
+    assert asyncio.run(cache.get("/games?", 0)) is None
+
+
+def test_response_cache_shared_tier(tmp_path):
+    """
+    Test that two caches sharing a store (e.g. two workers) see each
+    other's responses and invalidations.
+    """
+    cache_config: CacheConfig = CacheConfig(
+        enabled=True,
+        shared_path=str(tmp_path / "cache.db"),
+    )
+    worker_a: ResponseCache = ResponseCache(cache_config)
+    worker_b: ResponseCache = ResponseCache(cache_config)
+
+    cached: CachedResponse = CachedResponse(body=b"[]", headers={"Link": "<next>"})
+    asyncio.run(worker_a.set("/games?", 0, cached))
+    assert asyncio.run(worker_b.get("/games?", 0)) == cached
+    assert worker_b.stats()["shared_hits"] == 1
+
+    asyncio.run(worker_a.invalidate())
+    version: int = asyncio.run(worker_b.current_version())
+    assert version == 1
+    assert asyncio.run(worker_b.get("/games?", version)) is None
+
+
+def test_sqlite_store_expiration(tmp_path):
+    """
+    Test that the shared store does not return expired values.
+    """
+    store: SQLiteStore = SQLiteStore(str(tmp_path / "cache.db"), ttl_seconds=0.01)
+    store.set("key", b"value")
+    assert store.get("key") == b"value"
+    time.sleep(0.02)
+    assert store.get("key") is None
@@ -0,0 +1,140 @@
+import gzip
+import zlib
+
+import pytest
+from api.app.compression import CompressionMiddleware, negotiate_encoding
+from api.app.config import CompressionConfig
+from fastapi import FastAPI, Response
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from fastapi.testclient import TestClient
+
+BIG_BODY: bytes = b'[{"title": "Example Game", "genre": "Action"}' + b"," * 4096 + b"]"
+
+app: FastAPI = FastAPI()
+app.add_middleware(
+    CompressionMiddleware,
+    compression_config=CompressionConfig(minimum_size=1024),
+)
+
+
+@app.get("/big")
+async def big() -> Response:
+    return Response(BIG_BODY, media_type="application/json", headers={"ETag": '"1-a"'})
+
+
+@app.get("/tiny")
+async def tiny() -> Response:
+    return PlainTextResponse("OK")
+
+
+@app.get("/image")
+async def image() -> Response:
+    return Response(BIG_BODY, media_type="image/png")
+
+
+@app.get("/not-modified")
+async def not_modified() -> Response:
+    return Response(status_code=304, headers={"ETag": '"1-a"'})
+
+
+@app.get("/stream")
+async def stream() -> Response:
+    async def lines():
+        for i in range(3):
+            yield f'{{"line": {i}}}\n'.encode("utf-8")
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+
+client: TestClient = TestClient(app)
+
+
+@pytest.mark.parametrize(
+    "accept_encoding, expected",
+    [
+        ("gzip", "gzip"),
+        ("gzip, deflate", "gzip"),
+        ("GZIP;q=0.5", "gzip"),
+        ("gzip;q=0", None),
+        ("identity", None),
+        ("*", "gzip"),
+        ("*, gzip;q=0", None),
+        ("", None),
+    ],
+)
+def test_negotiate_encoding(accept_encoding, expected):
+    """
+    Test the content coding negotiation.
+    """
+    assert negotiate_encoding(accept_encoding, ["gzip"]) == expected
+
+
+def test_negotiate_encoding_prefers_the_client_weight():
+    """
+    Test that the client weight wins over the server preference, which breaks ties.
+    """
+    assert negotiate_encoding("gzip;q=1, br;q=0.5", ["zstd", "br", "gzip"]) == "gzip"
+    assert negotiate_encoding("gzip, br", ["zstd", "br", "gzip"]) == "br"
+
+
+def test_compress_large_response():
+    """
+    Test that a large JSON body is gzipped, with a weak ETag and a Vary header.
+    """
+    response = client.get("/big", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert response.headers["etag"] == 'W/"1-a"'
+    assert int(response.headers["content-length"]) < len(BIG_BODY)
+    assert response.content == BIG_BODY
+
+
+@pytest.mark.parametrize("url, vary", [("/tiny", "Accept-Encoding"), ("/image", None)])
+def test_skip_small_or_incompressible_response(url, vary):
+    """
+    Test that tiny bodies and non text media types are sent as is, a tiny
+    body still varying on Accept-Encoding.
+    """
+    response = client.get(url, headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in response.headers
+    assert response.headers.get("vary") == vary
+
+
+def test_identity_when_not_accepted():
+    """
+    Test that nothing is compressed for a client that does not accept it.
+    """
+    response = client.get("/big", headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in response.headers
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert response.headers["etag"] == '"1-a"'
+    assert response.content == BIG_BODY
+
+
+def test_compress_streaming_response():
+    """
+    Test that a streamed body is compressed chunk by chunk, each chunk being
+    decodable as soon as it arrives.
+    """
+    with client.stream(
+        "GET",
+        "/stream",
+        headers={"Accept-Encoding": "gzip"},
+    ) as response:
+        assert response.headers["content-encoding"] == "gzip"
+        assert "content-length" not in response.headers
+        raw: bytes = b"".join(response.iter_raw())
+
+    decoder = zlib.decompressobj(zlib.MAX_WBITS | 16)
+    assert decoder.decompress(raw) == b'{"line": 0}\n{"line": 1}\n{"line": 2}\n'
+    assert gzip.decompress(raw).count(b"\n") == 3
+
+
+def test_not_modified_matches_the_compressed_etag():
+    """
+    Test that a 304 carries the weak ETag of the compressed representation.
+    """
+    response = client.get("/not-modified", headers={"Accept-Encoding": "gzip"})
+    assert response.status_code == 304
+    assert response.headers["etag"] == 'W/"1-a"'
+    assert response.headers["vary"] == "Accept-Encoding"
@@ -0,0 +1,79 @@
+import asyncio
+import gzip
+from typing import AsyncIterator
+
+import pytest
+from api.app.ingest import MAX_LINE_BYTES, IngestReport, ndjson_games, ndjson_lines
+from fastapi import HTTPException
+
+BODY: bytes = (
+    b'{"title": "A", "genre": "RPG", "description": "", "release_date": "2001-01-01",'
+    b' "platform": "PC", "publisher": "P", "developer": "D"}\n'
+    b"\n"
+    b"not json\n"
+    b'{"title": "B"}\n'
+    b'{"title": "C", "genre": "RPG", "description": "\\u00e9", "release_date": "2002-02-02",'
+    b' "platform": "PC", "publisher": "P", "developer": "D"}'
+)
+
+
+async def _chunks(body: bytes, size: int) -> AsyncIterator[bytes]:
+    for start in range(0, len(body), size):
+        end: int = start + size
+        yield body[start:end]
+
+
+def _lines(body: bytes, size: int, gzipped: bool = False) -> list[bytes]:
+    async def collect() -> list[bytes]:
+        return [line async for line in ndjson_lines(_chunks(body, size), gzipped)]
+
+    return asyncio.run(collect())
+
+
+@pytest.mark.parametrize("size", [1, 7, 64, len(BODY)])
+@pytest.mark.parametrize("gzipped", [False, True])
+def test_ndjson_lines_split_across_chunks(size, gzipped):
+    """
+    Test that the lines are the same whatever the chunking and encoding of the body.
+    """
+    body: bytes = gzip.compress(BODY) if gzipped else BODY
+    assert _lines(body, size, gzipped) == BODY.split(b"\n")
+
+
+@pytest.mark.parametrize(
+    "body, gzipped",
+    [
+        (gzip.compress(BODY)[:-10], True),
+        (b"not gzip", True),
+        (b"x" * (MAX_LINE_BYTES + 1), False),
+    ],
+)
+def test_ndjson_lines_malformed_body(body, gzipped):
+    """
+    Test that a truncated or corrupted gzip body, or an endless line, is rejected.
+    """
+    with pytest.raises(HTTPException) as raised:
+        _lines(body, 1024, gzipped)
+    assert raised.value.status_code == 400
+
+
+def test_ndjson_games_reports_invalid_lines():
+    """
+    Test that the valid lines are kept with their line number, and the others reported.
+    """
+
+    async def collect(report: IngestReport) -> list:
+        lines = ndjson_lines(_chunks(BODY, 16))
+        return [batch async for batch in ndjson_games(lines, report)]
+
+    report: IngestReport = IngestReport()
+    batches = asyncio.run(collect(report))
+
+    assert [(line, game.title) for batch in batches for line, game in batch] == [
+        (1, "A"),
+        (5, "C"),
+    ]
+    assert (report.lines, report.errors) == (4, 2)
+    assert [line for line, _ in report.error_details] == [3, 4]
+    assert report.error_details[0][1].startswith("Invalid JSON")
+    assert "genre: Field required" in report.error_details[1][1]
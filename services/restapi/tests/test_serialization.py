@@ -0,0 +1,52 @@
+from collections import namedtuple
+from datetime import date
+
+from api.app.queries import GAME_FIELDS
+from api.app.schemas import GameSchema
+from api.app.serialization import encode_game_lines, encode_games
+from pydantic import TypeAdapter
+
+# The shape of a listing row: the game id and the `GameSchema` fields
+GameRow = namedtuple("GameRow", ("id", *GAME_FIELDS))  # type: ignore
+
+ROWS: list = [
+    GameRow(
+        id=1,
+        release_date=date(2020, 1, 31),
+        title='Pokémon "Légendes" \\ 東方',
+        genre="Action",
+        description="",
+        platform="Switch",
+        publisher="Nintendo",
+        developer="Game Freak",
+    ),
+    GameRow(
+        id=2,
+        release_date=date(1999, 12, 1),
+        title="Catalog Game 2",
+        genre="RPG",
+        description="Line one\nline two\t🎮",
+        platform="PC",
+        publisher="Publisher 0",
+        developer="Developer 0",
+    ),
+]
+
+
+def test_encode_games_matches_game_schema():
+    """
+    Test that the rows are encoded to the exact bytes of the `GameSchema` serialization.
+    """
+    games: list[GameSchema] = [GameSchema(**row._asdict()) for row in ROWS]
+    assert encode_games(ROWS) == TypeAdapter(list[GameSchema]).dump_json(games)
+    assert encode_games([]) == b"[]"
+
+
+def test_encode_game_lines_with_fields():
+    """
+    Test that a sparse fieldset is encoded in the requested order, one game per line.
+    """
+    assert encode_game_lines(ROWS, ("title", "release_date")) == (
+        '{"title":"Pokémon \\"Légendes\\" \\\\ 東方","release_date":"2020-01-31"}\n'
+        '{"title":"Catalog Game 2","release_date":"1999-12-01"}\n'
+    ).encode("utf-8")
@@ -1,4 +1,7 @@
+import pytest
+from api.app.config import EventLoop, ServerConfig
 from api.settings import Settings
+from pydantic import ValidationError
 
 
 def test_settings_loading(monkeypatch):
@@ -31,3 +34,56 @@ def test_settings_loading(monkeypatch):
     assert settings.db.port == 5432
     assert settings.db.database == "api_db"
     assert settings.db.host == "localhost"
+
+
+def test_server_settings_split_the_pool(monkeypatch):
+    """
+    Test that the server settings load and that the DB pool is split per worker.
+    """
+    monkeypatch.setenv("guestready__api__server__workers", "4")
+    monkeypatch.setenv("guestready__api__server__event_loop", "uvloop")
+    monkeypatch.setenv("guestready__api__server__keep_alive_timeout", "30")
+    monkeypatch.setenv("guestready__db__pool_size", "40")
+    monkeypatch.setenv("guestready__api__idempotency__shared_path", "/tmp/keys.db")
+
+    settings = Settings()  # type:ignore
+
+    assert settings.api.server.worker_count() == 4
+    assert settings.api.server.event_loop == EventLoop.UVLOOP
+    assert settings.api.server.keep_alive_timeout == 30
+    assert settings.db.worker_pool(settings.api.server.worker_count()) == (10, 2)
+    assert settings.db.worker_pool(64) == (1, 0)
+
+
+def test_server_workers_default_to_the_cpu_count(monkeypatch):
+    """
+    Test that 0 workers means one worker per CPU core.
+    """
+    monkeypatch.setattr("os.cpu_count", lambda: 6)
+    assert ServerConfig(workers=0).worker_count() == 6
+    assert ServerConfig().worker_count() == 1
+
+
+def test_several_workers_require_shared_idempotency_keys(monkeypatch):
+    """
+    Test that several workers are refused when the idempotency keys are only
+    kept per worker.
+    """
+    monkeypatch.setenv("guestready__api__server__workers", "2")
+    with pytest.raises(ValidationError, match="idempotency"):
+        Settings()  # type:ignore
+
+    monkeypatch.setenv("guestready__api__idempotency__enabled", "false")
+    assert Settings().api.server.worker_count() == 2  # type:ignore
+
+
+def test_several_workers_refuse_write_behind(monkeypatch):
+    """
+    Test that the write-behind mode, whose queue and statuses are kept per
+    worker, is refused with several workers.
+    """
+    monkeypatch.setenv("guestready__api__server__workers", "2")
+    monkeypatch.setenv("guestready__api__idempotency__shared_path", "/tmp/keys.db")
+    monkeypatch.setenv("guestready__api__write_behind__enabled", "true")
+    with pytest.raises(ValidationError, match="write_behind"):
+        Settings()  # type:ignore